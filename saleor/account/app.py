@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, pre_delete
 
 
 class AccountAppConfig(AppConfig):
@@ -7,10 +7,15 @@ class AccountAppConfig(AppConfig):
 
     def ready(self):
         from .models import User
-        from .signals import delete_avatar
+        from .signals import delete_avatar, release_checkouts_reservations
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        pre_delete.connect(
+            release_checkouts_reservations,
+            sender=User,
+            dispatch_uid="release_user_checkouts_reservations",
+        )
@@ -0,0 +1,39 @@
+# Generated by Django 3.2.13 on 2022-07-14 11:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from ...core.search_tasks import set_user_search_document_values
+
+
+def update_user_search_document_values(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        set_user_search_document_values.delay()
+
+    post_migrate.connect(on_migrations_complete, weak=False)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("account", "0065_address_warehouse_address_search_gin"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "search_document", config="simple"
+                ),
+                name="user_search_vector_gin",
+            ),
+        ),
+        migrations.RunPython(
+            update_user_search_document_values, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -10,6 +10,7 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
 from django.db.models import JSONField  # type: ignore
 from django.db.models import Q, QuerySet, Value
@@ -213,6 +214,11 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
                 fields=["search_document"],
                 opclasses=["gin_trgm_ops"],
             ),
+            # Account searching by prefixes of words, too short for trigrams
+            GinIndex(
+                SearchVector("search_document", config="simple"),
+                name="user_search_vector_gin",
+            ),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -1,7 +1,9 @@
+from functools import reduce
+from operator import or_
 from typing import TYPE_CHECKING
 
-from django.contrib.postgres.search import SearchVector
-from django.db.models import Q, Value, prefetch_related_objects
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, Q, Value, prefetch_related_objects
 
 if TYPE_CHECKING:
     from .models import Address, User
@@ -19,6 +21,11 @@ ADDRESS_SEARCH_FIELDS = [
     "phone",
 ]
 
+# Should be the same as the expression of the `user_search_vector_gin` index
+USER_SEARCH_VECTOR = SearchVector("search_document", config="simple")
+# Shorter terms can't be split into trigrams, so they can't use the trigram index
+MIN_TRIGRAM_TERM_LENGTH = 3
+
 
 def prepare_user_search_document_value(
     user: "User", *, already_prefetched=False, attach_addresses_data=True
@@ -89,10 +96,32 @@ def generate_address_search_vector_value(
     return search_vector
 
 
+def prepare_user_search_prefix_query(term: str) -> SearchQuery:
+    """Return a query matching words of the user search document starting with term."""
+    term = term.replace("\\", "\\\\").replace("'", "\\'")
+    return SearchQuery(f"'{term}':*", search_type="raw", config="simple")
+
+
 def search_users(qs, value):
-    if value:
+    """Filter users matching all terms of the value and annotate `search_rank`.
+
+    Terms are matched anywhere in the search document with the trigram index.
+    Terms too short to be split into trigrams are matched against the beginnings
+    of the document words with the full-text index instead, as they would scan
+    the whole trigram index.
+    """
+    terms = value.lower().split() if value else []
+    if terms:
         lookup = Q()
-        for val in value.split():
-            lookup &= Q(search_document__ilike=val.lower())
-        qs = qs.filter(lookup)
+        for term in terms:
+            if len(term) < MIN_TRIGRAM_TERM_LENGTH:
+                lookup &= Q(search_vector=prepare_user_search_prefix_query(term))
+            else:
+                lookup &= Q(search_document__ilike=term)
+        query = reduce(or_, map(prepare_user_search_prefix_query, terms))
+        qs = (
+            qs.alias(search_vector=USER_SEARCH_VECTOR)
+            .filter(lookup)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+        )
     return qs
@@ -1,6 +1,15 @@
+from ..checkout.models import CheckoutLine
 from ..core.utils import delete_versatile_image
+from ..warehouse.reservations import release_checkout_lines_reservations
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_versatile_image(avatar)
+
+
+def release_checkouts_reservations(sender, instance, **kwargs):
+    # checkouts of the user are deleted by the cascade
+    release_checkout_lines_reservations(
+        CheckoutLine.objects.filter(checkout__user=instance)
+    )
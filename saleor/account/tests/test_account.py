@@ -7,6 +7,7 @@ from django.http import QueryDict
 from django_countries.fields import Country
 
 from ...order.models import Order
+from ...warehouse.models import Reservation
 from .. import forms, i18n
 from ..models import User
 from ..validators import validate_possible_number
@@ -283,3 +284,21 @@ def test_customers_show_staff_with_order(admin_user, channel_USD):
         channel=channel_USD,
     )
     assert User.objects.customers().count() == 1
+
+
+def test_delete_user_releases_checkouts_reservations(
+    customer_user, checkout_line_with_one_reservation
+):
+    # given
+    checkout_line = checkout_line_with_one_reservation
+    checkout_line.checkout.user = customer_user
+    checkout_line.checkout.save(update_fields=["user"])
+    stock = checkout_line.reservations.get().stock
+
+    # when
+    User.objects.filter(pk=customer_user.pk).delete()
+
+    # then
+    assert not Reservation.objects.exists()
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
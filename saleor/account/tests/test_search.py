@@ -1,4 +1,5 @@
-from ..search import prepare_user_search_document_value
+from ..models import User
+from ..search import prepare_user_search_document_value, search_users
 
 
 def test_prepare_user_search_document_value(customer_user, address, address_usa):
@@ -63,3 +64,22 @@ def test_prepare_user_search_document_value_do_not_attach_addresses_data(
 
     # then
     assert search_document_value == expected_search_value
+
+
+def test_search_users_matches_short_terms_with_word_prefixes(db):
+    # given
+    users = User.objects.bulk_create(
+        [
+            User(email="first@example.com", first_name="Alice", last_name="Doe"),
+            User(email="second@example.com", first_name="John", last_name="Kowal"),
+        ]
+    )
+    for user in users:
+        user.search_document = prepare_user_search_document_value(user)
+    User.objects.bulk_update(users, ["search_document"])
+
+    # when
+    result = search_users(User.objects.all(), "al")
+
+    # then
+    assert list(result) == [users[0]]
@@ -1,13 +1,16 @@
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+from prices import Money, TaxedMoney
 
 from ..core.prices import quantize_price
 from ..core.taxes import zero_taxed_money
 from ..discount import DiscountInfo
 from .interface import CheckoutTaxedPricesData
+from .models import CheckoutLine
 
 if TYPE_CHECKING:
-    from prices import TaxedMoney
-
     from ..account.models import Address
     from ..plugins.manager import PluginsManager
     from .fetch import CheckoutInfo, CheckoutLineInfo
@@ -25,10 +28,12 @@ def checkout_shipping_price(
 
     It takes in account all plugins.
     """
-    calculated_checkout_shipping = manager.calculate_checkout_shipping(
-        checkout_info, lines, address, discounts or []
+    checkout_info, _ = fetch_checkout_prices_if_expired(
+        checkout_info, manager, lines, address, discounts
+    )
+    return quantize_price(
+        checkout_info.checkout.shipping_price, checkout_info.checkout.currency
     )
-    return quantize_price(calculated_checkout_shipping, checkout_info.checkout.currency)
 
 
 def checkout_subtotal(
@@ -43,10 +48,12 @@ def checkout_subtotal(
 
     It takes in account all plugins.
     """
-    calculated_checkout_subtotal = manager.calculate_checkout_subtotal(
-        checkout_info, lines, address, discounts or []
+    checkout_info, _ = fetch_checkout_prices_if_expired(
+        checkout_info, manager, lines, address, discounts
+    )
+    return quantize_price(
+        checkout_info.checkout.subtotal, checkout_info.checkout.currency
     )
-    return quantize_price(calculated_checkout_subtotal, checkout_info.checkout.currency)
 
 
 def calculate_checkout_total_with_gift_cards(
@@ -85,10 +92,10 @@ def checkout_total(
 
     It takes in account all plugins.
     """
-    calculated_checkout_total = manager.calculate_checkout_total(
-        checkout_info, lines, address, discounts or []
+    checkout_info, _ = fetch_checkout_prices_if_expired(
+        checkout_info, manager, lines, address, discounts
     )
-    return quantize_price(calculated_checkout_total, checkout_info.checkout.currency)
+    return quantize_price(checkout_info.checkout.total, checkout_info.checkout.currency)
 
 
 def checkout_line_total(
@@ -112,3 +119,172 @@ def checkout_line_total(
         discounts or [],
     )
     return calculated_line_total
+
+
+def checkout_line_unit_price(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+) -> TaxedMoney:
+    """Return the unit price of provided line, taxes and discounts included."""
+    return _get_checkout_line_price(
+        "unit_price", manager, checkout_info, lines, checkout_line_info, discounts
+    )
+
+
+def checkout_line_undiscounted_unit_price(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+) -> TaxedMoney:
+    """Return the unit price of provided line without any sale and voucher."""
+    return _get_checkout_line_price(
+        "undiscounted_unit_price",
+        manager,
+        checkout_info,
+        lines,
+        checkout_line_info,
+        discounts,
+    )
+
+
+def checkout_line_total_price(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+) -> TaxedMoney:
+    """Return the total price of provided line, taxes and discounts included."""
+    return _get_checkout_line_price(
+        "total_price", manager, checkout_info, lines, checkout_line_info, discounts
+    )
+
+
+def checkout_line_undiscounted_total_price(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+) -> TaxedMoney:
+    """Return the total price of provided line without any sale and voucher."""
+    return _get_checkout_line_price(
+        "undiscounted_total_price",
+        manager,
+        checkout_info,
+        lines,
+        checkout_line_info,
+        discounts,
+    )
+
+
+def _get_checkout_line_price(
+    price_field: str,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    discounts: Optional[Iterable[DiscountInfo]],
+) -> TaxedMoney:
+    address = checkout_info.shipping_address or checkout_info.billing_address
+    checkout_info, _ = fetch_checkout_prices_if_expired(
+        checkout_info, manager, lines, address, discounts
+    )
+    line = checkout_line_info.line
+    currency = checkout_info.checkout.currency
+    return TaxedMoney(
+        net=Money(getattr(line, f"{price_field}_net_amount"), currency),
+        gross=Money(getattr(line, f"{price_field}_gross_amount"), currency),
+    )
+
+
+def _set_checkout_line_price(line: CheckoutLine, price_field: str, price: TaxedMoney):
+    setattr(line, f"{price_field}_net_amount", price.net.amount)
+    setattr(line, f"{price_field}_gross_amount", price.gross.amount)
+
+
+def fetch_checkout_prices_if_expired(
+    checkout_info: "CheckoutInfo",
+    manager: "PluginsManager",
+    lines: Iterable["CheckoutLineInfo"],
+    address: Optional["Address"] = None,
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+    force_update: bool = False,
+) -> Tuple["CheckoutInfo", Iterable["CheckoutLineInfo"]]:
+    """Fetch checkout prices with taxes.
+
+    Prices are calculated by plugins only when the ones stored on the checkout and
+    its lines have expired. Calculated prices are stored for
+    `settings.CHECKOUT_PRICES_TTL`.
+    """
+    checkout = checkout_info.checkout
+    if not force_update and checkout.price_expiration > timezone.now():
+        return checkout_info, lines
+
+    discounts = discounts or []
+    lines = list(lines)
+    for line_info in lines:
+        line = line_info.line
+        total_price_data = manager.calculate_checkout_line_total(
+            checkout_info, lines, line_info, address, discounts
+        )
+        unit_price_data = manager.calculate_checkout_line_unit_price(
+            checkout_info, lines, line_info, address, discounts
+        )
+        _set_checkout_line_price(
+            line, "total_price", total_price_data.price_with_discounts
+        )
+        _set_checkout_line_price(
+            line, "undiscounted_total_price", total_price_data.undiscounted_price
+        )
+        _set_checkout_line_price(
+            line, "unit_price", unit_price_data.price_with_discounts
+        )
+        _set_checkout_line_price(
+            line, "undiscounted_unit_price", unit_price_data.undiscounted_price
+        )
+
+    checkout.total = manager.calculate_checkout_total(
+        checkout_info, lines, address, discounts
+    )
+    checkout.subtotal = manager.calculate_checkout_subtotal(
+        checkout_info, lines, address, discounts
+    )
+    checkout.shipping_price = manager.calculate_checkout_shipping(
+        checkout_info, lines, address, discounts
+    )
+    checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
+    checkout.save(
+        update_fields=[
+            "total_net_amount",
+            "total_gross_amount",
+            "subtotal_net_amount",
+            "subtotal_gross_amount",
+            "shipping_price_net_amount",
+            "shipping_price_gross_amount",
+            "price_expiration",
+        ]
+    )
+    CheckoutLine.objects.bulk_update(
+        [line_info.line for line_info in lines],
+        [
+            "unit_price_net_amount",
+            "unit_price_gross_amount",
+            "undiscounted_unit_price_net_amount",
+            "undiscounted_unit_price_gross_amount",
+            "total_price_net_amount",
+            "total_price_gross_amount",
+            "undiscounted_total_price_net_amount",
+            "undiscounted_total_price_gross_amount",
+        ],
+    )
+    return checkout_info, lines
@@ -51,7 +51,10 @@ from ..payment.utils import fetch_customer_id, store_customer_id
 from ..product.models import ProductTranslation, ProductVariantTranslation
 from ..warehouse.availability import check_stock_and_preorder_quantity_bulk
 from ..warehouse.management import allocate_preorders, allocate_stocks
-from ..warehouse.reservations import is_reservation_enabled
+from ..warehouse.reservations import (
+    is_reservation_enabled,
+    release_checkout_lines_reservations,
+)
 from . import AddressType
 from .base_calculations import calculate_base_line_unit_price
 from .checkout_cleaner import (
@@ -386,8 +389,12 @@ def _prepare_order_data(
     taxed_total = max(taxed_total, zero_taxed_money(checkout.currency))
     undiscounted_total = taxed_total + checkout.discount
 
-    shipping_total = manager.calculate_checkout_shipping(
-        checkout_info, lines, address, discounts
+    shipping_total = calculations.checkout_shipping_price(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        address=address,
+        discounts=discounts,
     )
     shipping_tax_rate = manager.get_checkout_shipping_tax_rate(
         checkout_info, lines, address, discounts, shipping_total
@@ -421,7 +428,13 @@ def _prepare_order_data(
     order_data.update(_process_voucher_data_for_order(checkout_info))
 
     order_data["total_price_left"] = (
-        manager.calculate_checkout_subtotal(checkout_info, lines, address, discounts)
+        calculations.checkout_subtotal(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=lines,
+            address=address,
+            discounts=discounts,
+        )
         + shipping_total
         - checkout.discount
     ).gross
@@ -573,6 +586,23 @@ def _create_order(
     return order
 
 
+def _fetch_checkout_prices(
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    discounts: Iterable[DiscountInfo],
+):
+    """Recalculate the checkout prices used to create the order.
+
+    Stored prices can be up to `CHECKOUT_PRICES_TTL` old, while the order lines
+    are calculated live, so all prices are recalculated once before completion.
+    """
+    address = checkout_info.shipping_address or checkout_info.billing_address
+    calculations.fetch_checkout_prices_if_expired(
+        checkout_info, manager, lines, address, discounts, force_update=True
+    )
+
+
 def _prepare_checkout(
     manager: "PluginsManager",
     checkout_info: "CheckoutInfo",
@@ -718,6 +748,13 @@ def complete_checkout(
     checkout = checkout_info.checkout
     channel_slug = checkout_info.channel.slug
     payment = checkout.get_last_active_payment()
+    try:
+        _fetch_checkout_prices(manager, checkout_info, lines, discounts)
+    except TaxError as tax_error:
+        raise ValidationError(
+            "Unable to calculate taxes - %s" % str(tax_error),
+            code=CheckoutErrorCode.TAX_ERROR.value,
+        )
     _prepare_checkout(
         manager=manager,
         checkout_info=checkout_info,
@@ -779,6 +816,7 @@ def complete_checkout(
                 site_settings=site_settings,
             )
             # remove checkout after order is successfully created
+            release_checkout_lines_reservations(checkout.lines.all())
             checkout.delete()
         except InsufficientStock as e:
             release_voucher_usage(
@@ -998,8 +1036,12 @@ def _create_order_from_checkout(
     voucher = checkout_info.voucher
 
     # shipping
-    shipping_total = manager.calculate_checkout_shipping(
-        checkout_info, checkout_lines_info, address, discounts
+    shipping_total = calculations.checkout_shipping_price(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=checkout_lines_info,
+        address=address,
+        discounts=discounts,
     )
     shipping_tax_rate = manager.get_checkout_shipping_tax_rate(
         checkout_info, checkout_lines_info, address, discounts, shipping_total
@@ -1115,6 +1157,8 @@ def create_order_from_checkout(
 
     :raises: InsufficientStock, GiftCardNotApplicable
     """
+    checkout_lines = list(checkout_lines)
+    _fetch_checkout_prices(manager, checkout_info, checkout_lines, discounts)
 
     if checkout_info.voucher:
         with transaction.atomic():
@@ -1124,7 +1168,7 @@ def create_order_from_checkout(
         try:
             order = _create_order_from_checkout(
                 checkout_info=checkout_info,
-                checkout_lines_info=list(checkout_lines),
+                checkout_lines_info=checkout_lines,
                 discounts=discounts,
                 manager=manager,
                 user=user,
@@ -1132,6 +1176,7 @@ def create_order_from_checkout(
                 tracking_code=tracking_code,
             )
             if delete_checkout:
+                release_checkout_lines_reservations(checkout_info.checkout.lines.all())
                 checkout_info.checkout.delete()
             return order
         except InsufficientStock:
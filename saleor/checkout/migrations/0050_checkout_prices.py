@@ -0,0 +1,89 @@
+# Generated by Django 3.2.13 on 2022-07-04 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("checkout", "0049_auto_20220621_0850"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="price_expiration",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="unit_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="unit_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="undiscounted_unit_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="undiscounted_unit_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="undiscounted_total_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="undiscounted_total_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+    ]
@@ -4,7 +4,8 @@ from django.db.models import Q
 from django.utils import timezone
 
 from ..celeryconf import app
-from .models import Checkout
+from ..warehouse.reservations import release_checkout_lines_reservations
+from .models import Checkout, CheckoutLine
 
 task_logger = get_task_logger(__name__)
 
@@ -23,8 +24,12 @@ def delete_expired_checkouts():
     empty_checkouts = Q(lines__isnull=True) & Q(
         last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA
     )
-    count, _ = Checkout.objects.filter(
+    checkouts = Checkout.objects.filter(
         empty_checkouts | expired_anonymous_checkouts | expired_user_checkout
-    ).delete()
+    )
+    release_checkout_lines_reservations(
+        CheckoutLine.objects.filter(checkout__in=checkouts)
+    )
+    count, _ = checkouts.delete()
     if count:
         task_logger.debug("Removed %s checkouts.", count)
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...plugins.manager import get_plugins_manager
+from ..calculations import (
+    checkout_line_total_price,
+    checkout_total,
+    fetch_checkout_prices_if_expired,
+)
+from ..fetch import fetch_checkout_info, fetch_checkout_lines
+from ..utils import invalidate_checkout_prices
+
+
+@freeze_time("2022-07-04 12:00:00")
+def test_fetch_checkout_prices_if_expired_stores_prices(checkout_with_item, settings):
+    # given
+    settings.CHECKOUT_PRICES_TTL = timedelta(hours=1)
+    manager = get_plugins_manager()
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    address = checkout_with_item.shipping_address
+
+    # when
+    fetch_checkout_prices_if_expired(checkout_info, manager, lines, address)
+
+    # then
+    checkout_with_item.refresh_from_db()
+    line = checkout_with_item.lines.get()
+    assert checkout_with_item.price_expiration == timezone.now() + timedelta(hours=1)
+    assert checkout_with_item.total == manager.calculate_checkout_total(
+        checkout_info, lines, address, []
+    )
+    assert checkout_with_item.subtotal == manager.calculate_checkout_subtotal(
+        checkout_info, lines, address, []
+    )
+    line_total = manager.calculate_checkout_line_total(
+        checkout_info, lines, lines[0], address, []
+    ).price_with_discounts
+    assert line.total_price_gross_amount == line_total.gross.amount
+    assert line.total_price_net_amount == line_total.net.amount
+
+
+@patch("saleor.plugins.manager.PluginsManager.calculate_checkout_total")
+def test_checkout_total_reuses_prices_until_expiration(
+    mocked_calculate_checkout_total, checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = timedelta(hours=1)
+    manager = get_plugins_manager()
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    address = checkout_with_item.shipping_address
+    mocked_calculate_checkout_total.return_value = checkout_with_item.total
+    fetch_checkout_prices_if_expired(checkout_info, manager, lines, address)
+    mocked_calculate_checkout_total.reset_mock()
+
+    # when
+    total = checkout_total(
+        manager=manager, checkout_info=checkout_info, lines=lines, address=address
+    )
+
+    # then
+    mocked_calculate_checkout_total.assert_not_called()
+    assert total == checkout_with_item.total
+
+
+def test_checkout_line_total_price_recalculated_after_invalidation(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = timedelta(hours=1)
+    manager = get_plugins_manager()
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    line_info = lines[0]
+    previous_total = checkout_line_total_price(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        checkout_line_info=line_info,
+    )
+    line_info.line.quantity *= 2
+    line_info.line.save(update_fields=["quantity"])
+
+    # when
+    invalidate_checkout_prices(checkout_with_item, save=True)
+    total = checkout_line_total_price(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        checkout_line_info=line_info,
+    )
+
+    # then
+    assert total == previous_total * 2
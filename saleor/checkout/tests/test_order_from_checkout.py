@@ -1,11 +1,15 @@
+import datetime
 from decimal import Decimal
 from unittest import mock
 
 import pytest
 from django.contrib.auth.models import AnonymousUser
 from django.test import override_settings
+from django.utils import timezone
+from prices import Money, TaxedMoney
 
 from ...core.exceptions import InsufficientStock
+from ...core.prices import quantize_price
 from ...core.taxes import zero_money, zero_taxed_money
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCard, GiftCardEvent
@@ -48,6 +52,46 @@ def test_create_order_insufficient_stock(
 
 
 @pytest.mark.parametrize("is_anonymous_user", (True, False))
+def test_create_order_recalculates_stored_checkout_prices(
+    checkout_with_item, customer_user, shipping_method, app
+):
+    # given
+    checkout = checkout_with_item
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_billing_address
+    checkout.shipping_method = shipping_method
+    checkout.save()
+    manager = get_plugins_manager()
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], manager)
+    address = checkout.shipping_address
+    expected_total = quantize_price(
+        manager.calculate_checkout_total(checkout_info, lines, address, []),
+        checkout.currency,
+    )
+
+    stale_price = Money("1.00", checkout.currency)
+    checkout.total = TaxedMoney(stale_price, stale_price)
+    checkout.price_expiration = timezone.now() + datetime.timedelta(hours=1)
+    checkout.save(
+        update_fields=["total_net_amount", "total_gross_amount", "price_expiration"]
+    )
+
+    # when
+    order = create_order_from_checkout(
+        checkout_info=checkout_info,
+        checkout_lines=lines,
+        discounts=[],
+        manager=manager,
+        user=AnonymousUser(),
+        app=app,
+        tracking_code="tracking_code",
+    )
+
+    # then
+    assert order.total == expected_total
+
+
 def test_create_order_with_gift_card(
     checkout_with_gift_card, customer_user, shipping_method, is_anonymous_user, app
 ):
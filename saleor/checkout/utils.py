@@ -35,7 +35,10 @@ from ..warehouse.availability import (
     check_stock_and_preorder_quantity_bulk,
 )
 from ..warehouse.models import Warehouse
-from ..warehouse.reservations import reserve_stocks_and_preorders
+from ..warehouse.reservations import (
+    release_checkout_lines_reservations,
+    reserve_stocks_and_preorders,
+)
 from . import AddressType, base_calculations, calculations
 from .error_codes import CheckoutErrorCode
 from .fetch import (
@@ -136,6 +139,7 @@ def add_variant_to_checkout(
 
     if new_quantity == 0:
         if line is not None:
+            release_checkout_lines_reservations([line])
             line.delete()
             line = None
     elif line is None:
@@ -187,6 +191,7 @@ def add_variants_to_checkout(
             to_create, checkout, variant, line_data, variant_ids_in_lines
         )
     if to_delete:
+        release_checkout_lines_reservations(to_delete)
         CheckoutLine.objects.filter(pk__in=[line.pk for line in to_delete]).delete()
     if to_update:
         CheckoutLine.objects.bulk_update(to_update, ["quantity", "price_override"])
@@ -531,6 +536,8 @@ def recalculate_checkout_discount(
         except NotApplicable:
             remove_voucher_from_checkout(checkout)
             checkout_info.voucher = None
+            for line_info in lines:
+                line_info.voucher = None
         else:
             # the gross is taken, as net and gross are the same for base calculations
             subtotal = base_calculations.base_checkout_lines_total(
@@ -670,6 +677,18 @@ def remove_voucher_code_from_checkout(checkout_info: "CheckoutInfo", voucher_cod
         checkout_info.voucher = None
 
 
+def invalidate_checkout_prices(checkout: Checkout, *, save: bool) -> List[str]:
+    """Mark the stored checkout prices as expired.
+
+    Return the list of checkout fields which have to be saved.
+    """
+    checkout.price_expiration = timezone.now()
+    updated_fields = ["price_expiration", "last_change"]
+    if save:
+        checkout.save(update_fields=updated_fields)
+    return updated_fields
+
+
 def remove_voucher_from_checkout(checkout: Checkout):
     """Remove voucher data from checkout."""
     checkout.voucher_code = None
@@ -10,7 +10,7 @@ from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from django.utils.translation import get_language
 
-from ..discount.utils import fetch_discounts
+from ..discount.utils import fetch_cached_discounts
 from ..graphql.utils import get_user_or_app_from_context
 from ..plugins.manager import PluginsManager, get_plugins_manager
 from . import analytics
@@ -60,7 +60,7 @@ def discounts(get_response):
 
     def _discounts_middleware(request):
         request.discounts = SimpleLazyObject(
-            lambda: fetch_discounts(request.request_time)
+            lambda: fetch_cached_discounts(request.request_time)
         )
         return get_response(request)
 
@@ -1,6 +1,11 @@
 from typing import List
 
+import opentracing
+import opentracing.tags
 from celery.utils.log import get_task_logger
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
@@ -10,7 +15,9 @@ from ..order.search import prepare_order_search_vector_value
 from ..product.models import Product
 from ..product.search import (
     PRODUCT_FIELDS_TO_PREFETCH,
+    PRODUCTS_BATCH_SIZE,
     prepare_product_search_vector_value,
+    update_products_search_vector,
 )
 
 task_logger = get_task_logger(__name__)
@@ -21,6 +28,10 @@ BATCH_SIZE = 500
 # running the task on different thresholds and measure memory usage, total time
 # and execution time of an single SQL statement.
 
+PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY = "products-search-index-clean-at"
+# Number of products batches indexed in a single run of the search index task
+PRODUCTS_SEARCH_INDEX_BATCHES_PER_RUN = 10
+
 
 @app.task
 def set_user_search_document_values(updated_count: int = 0) -> None:
@@ -109,6 +120,56 @@ def set_product_search_document_values(updated_count: int = 0) -> None:
     set_product_search_document_values.delay(updated_count)
 
 
+@app.task
+def update_products_search_vector_task():
+    """Rebuild search vectors of the products marked as dirty.
+
+    At most `PRODUCTS_SEARCH_INDEX_BATCHES_PER_RUN` batches are indexed in a single
+    run. The number of products left in the queue and the time since the queue was
+    last empty are reported as tags of the task span, to monitor the staleness of
+    the search index.
+    """
+    with opentracing.global_tracer().start_active_span(
+        "search.update_products_search_vector"
+    ) as scope:
+        span = scope.span
+        span.set_tag(opentracing.tags.COMPONENT, "search")
+        dirty_products = Product.objects.filter(search_index_dirty=True)
+        for _ in range(PRODUCTS_SEARCH_INDEX_BATCHES_PER_RUN):
+            product_ids = list(
+                dirty_products.order_by("pk").values_list("pk", flat=True)[
+                    :PRODUCTS_BATCH_SIZE
+                ]
+            )
+            if not product_ids:
+                break
+            products = Product.objects.filter(pk__in=product_ids)
+            with transaction.atomic():
+                # The flag is cleared before reading the products, so a product
+                # changed while it's being indexed is queued again.
+                products.update(search_index_dirty=False)
+                update_products_search_vector(products)
+
+        now = timezone.now()
+        dirty_count = dirty_products.count()
+        if dirty_count:
+            cache.add(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY, now, timeout=None)
+            clean_at = cache.get(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY, now)
+        else:
+            cache.set(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY, now, timeout=None)
+            clean_at = now
+        staleness = (now - clean_at).total_seconds()
+        span.set_tag("search.dirty_products", dirty_count)
+        span.set_tag("search.staleness_seconds", staleness)
+    if dirty_count:
+        task_logger.info(
+            "%d products are waiting for the search index update, "
+            "the index is stale for %d seconds.",
+            dirty_count,
+            staleness,
+        )
+
+
 def set_search_document_values(instances: List, prepare_search_document_func):
     if not instances:
         return 0
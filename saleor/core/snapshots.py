@@ -0,0 +1,79 @@
+import datetime
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+@dataclass
+class Snapshot:
+    """Data built once and shared between requests until it's outdated."""
+
+    version: str
+    created_at: datetime.datetime
+
+
+S = TypeVar("S", bound=Snapshot)
+
+
+class VersionedSnapshot(Generic[S]):
+    """Keep a snapshot in the worker memory, optionally shared through the cache.
+
+    The snapshot is rebuilt when it's older than the number of seconds set in
+    the `timeout_setting` or when its version is changed by `invalidate`.
+    A timeout of 0 disables the snapshot.
+    """
+
+    def __init__(
+        self,
+        key_prefix: str,
+        timeout_setting: str,
+        build: Callable[[str, datetime.datetime], S],
+        *,
+        share_through_cache: bool = True,
+    ):
+        self.key_prefix = key_prefix
+        self.version_key = f"{key_prefix}-version"
+        self.timeout_setting = timeout_setting
+        self.build = build
+        self.share_through_cache = share_through_cache
+        self._snapshot: Optional[S] = None
+
+    def invalidate(self):
+        """Force rebuilding the snapshot in all workers."""
+        cache.set(self.version_key, uuid4().hex, timeout=None)
+
+    def _get_version(self) -> str:
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid4().hex, timeout=None)
+            version = cache.get(self.version_key)
+        return version
+
+    def get(self) -> Optional[S]:
+        timeout = getattr(settings, self.timeout_setting)
+        if not timeout:
+            return None
+
+        version = self._get_version()
+        now = timezone.now()
+        expiration = datetime.timedelta(seconds=timeout)
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or snapshot.version != version
+            or snapshot.created_at + expiration <= now
+        ):
+            snapshot = None
+            cache_key = f"{self.key_prefix}-{version}"
+            if self.share_through_cache:
+                snapshot = cache.get(cache_key)
+            if snapshot is None or snapshot.created_at + expiration <= now:
+                snapshot = self.build(version, now)
+                if self.share_through_cache:
+                    cache.set(cache_key, snapshot, timeout)
+            self._snapshot = snapshot
+        return snapshot
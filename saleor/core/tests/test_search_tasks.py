@@ -0,0 +1,58 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...product.models import Product
+from ..search_tasks import (
+    PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY,
+    update_products_search_vector_task,
+)
+
+
+@freeze_time("2022-05-12 12:00:00")
+def test_update_products_search_vector_task(product_list):
+    # given
+    dirty_product, *other_products = product_list
+    Product.objects.update(search_vector=None)
+    Product.objects.filter(pk=dirty_product.pk).update(search_index_dirty=True)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    dirty_product.refresh_from_db()
+    assert dirty_product.search_vector
+    assert not dirty_product.search_index_dirty
+    for product in other_products:
+        product.refresh_from_db()
+        assert not product.search_vector
+    assert cache.get(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY) == timezone.now()
+    cache.delete(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY)
+
+
+@freeze_time("2022-05-12 12:00:00")
+@patch("saleor.core.search_tasks.PRODUCTS_SEARCH_INDEX_BATCHES_PER_RUN", 1)
+@patch("saleor.core.search_tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.core.search_tasks.opentracing.global_tracer")
+def test_update_products_search_vector_task_reports_staleness(
+    mocked_global_tracer, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+    clean_at = timezone.now() - timedelta(minutes=1)
+    cache.set(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY, clean_at)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    dirty_count = len(product_list) - 1
+    assert Product.objects.filter(search_index_dirty=True).count() == dirty_count
+    assert cache.get(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY) == clean_at
+    span = mocked_global_tracer().start_active_span().__enter__().span
+    span.set_tag.assert_any_call("search.dirty_products", dirty_count)
+    span.set_tag.assert_any_call("search.staleness_seconds", 60)
+    cache.delete(PRODUCTS_SEARCH_INDEX_CLEAN_AT_KEY)
@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+
+from ..snapshots import Snapshot, VersionedSnapshot
+
+
+def _build_snapshot(version, created_at):
+    return Snapshot(version=version, created_at=created_at)
+
+
+def test_versioned_snapshot_is_reused(settings):
+    # given
+    settings.TEST_SNAPSHOT_TIMEOUT = 60
+    build = Mock(wraps=_build_snapshot)
+    snapshot = VersionedSnapshot("test-snapshot", "TEST_SNAPSHOT_TIMEOUT", build)
+    snapshot.invalidate()
+    first = snapshot.get()
+
+    # when
+    second = snapshot.get()
+
+    # then
+    assert second is first
+    build.assert_called_once()
+
+
+def test_versioned_snapshot_is_rebuilt_after_invalidation(settings):
+    # given
+    settings.TEST_SNAPSHOT_TIMEOUT = 60
+    snapshot = VersionedSnapshot(
+        "test-snapshot", "TEST_SNAPSHOT_TIMEOUT", _build_snapshot
+    )
+    snapshot.invalidate()
+    first = snapshot.get()
+
+    # when
+    snapshot.invalidate()
+    second = snapshot.get()
+
+    # then
+    assert second.version != first.version
+
+
+def test_versioned_snapshot_is_shared_through_cache(settings):
+    # given
+    settings.TEST_SNAPSHOT_TIMEOUT = 60
+    build = Mock(wraps=_build_snapshot)
+    snapshot = VersionedSnapshot("test-snapshot", "TEST_SNAPSHOT_TIMEOUT", build)
+    other_worker_snapshot = VersionedSnapshot(
+        "test-snapshot", "TEST_SNAPSHOT_TIMEOUT", build
+    )
+    snapshot.invalidate()
+    first = snapshot.get()
+
+    # when
+    second = other_worker_snapshot.get()
+
+    # then
+    assert second.version == first.version
+    build.assert_called_once()
+
+
+def test_versioned_snapshot_disabled(settings):
+    # given
+    settings.TEST_SNAPSHOT_TIMEOUT = 0
+    build = Mock(wraps=_build_snapshot)
+    snapshot = VersionedSnapshot("test-snapshot", "TEST_SNAPSHOT_TIMEOUT", build)
+
+    # when
+    result = snapshot.get()
+
+    # then
+    assert result is None
+    build.assert_not_called()
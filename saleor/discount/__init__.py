@@ -3,9 +3,12 @@ from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Union
 
 from django.conf import settings
 
+from ..core.snapshots import Snapshot
+
 if TYPE_CHECKING:
     # flake8: noqa
     from .models import Sale, SaleChannelListing, Voucher
+    from .utils import DiscountsIndex
 
 
 class DiscountValueType:
@@ -44,3 +47,11 @@ class DiscountInfo:
     category_ids: Union[List[int], Set[int]]
     collection_ids: Union[List[int], Set[int]]
     variants_ids: Union[List[int], Set[int]]
+
+
+@dataclass
+class DiscountsSnapshot(Snapshot):
+    """Sales that are active or scheduled to start, shared between requests."""
+
+    discounts: List[DiscountInfo]
+    index: "DiscountsIndex"
@@ -16,11 +16,16 @@ from ..models import (
     VoucherCustomer,
 )
 from ..utils import (
+    IndexedDiscounts,
     add_voucher_usage_by_customer,
+    calculate_discounted_prices,
     decrease_voucher_usage,
+    fetch_cached_discounts,
     fetch_catalogue_info,
     get_product_discount_on_sale,
+    get_product_discounts,
     increase_voucher_usage,
+    invalidate_discounts_snapshot,
     remove_voucher_usage_by_customer,
     validate_voucher,
 )
@@ -730,3 +735,162 @@ def test_fetch_catalogue_info_for_sale_has_one_element_sets(sale):
     assert catalogue_info["collections"] == collection_ids
     assert catalogue_info["products"] == product_ids
     assert catalogue_info["variants"] == variant_ids
+
+
+def test_fetch_cached_discounts_reuses_snapshot(
+    sale, settings, django_assert_num_queries
+):
+    # given
+    settings.DISCOUNTS_SNAPSHOT_TIMEOUT = 60
+    invalidate_discounts_snapshot()
+    fetch_cached_discounts(timezone.now())
+
+    # when
+    with django_assert_num_queries(0):
+        discounts = fetch_cached_discounts(timezone.now())
+
+    # then
+    assert [discount.sale for discount in discounts] == [sale]
+
+
+def test_fetch_cached_discounts_after_snapshot_invalidation(sale, settings):
+    # given
+    settings.DISCOUNTS_SNAPSHOT_TIMEOUT = 60
+    invalidate_discounts_snapshot()
+    fetch_cached_discounts(timezone.now())
+    new_sale = Sale.objects.create(name="New sale")
+
+    # when
+    invalidate_discounts_snapshot()
+    discounts = fetch_cached_discounts(timezone.now())
+
+    # then
+    assert {discount.sale for discount in discounts} == {sale, new_sale}
+
+
+def test_fetch_cached_discounts_includes_sales_starting_on_schedule(
+    sale, settings, django_assert_num_queries
+):
+    # given
+    settings.DISCOUNTS_SNAPSHOT_TIMEOUT = 60
+    start_date = timezone.now() + timedelta(seconds=10)
+    sale.start_date = start_date
+    sale.save(update_fields=["start_date"])
+    invalidate_discounts_snapshot()
+    assert not fetch_cached_discounts(timezone.now())
+
+    # when
+    with django_assert_num_queries(0):
+        discounts = fetch_cached_discounts(start_date + timedelta(seconds=1))
+
+    # then
+    assert [discount.sale for discount in discounts] == [sale]
+
+
+def _create_discount_info(channel, discount_value, **catalogue):
+    sale = Sale.objects.create(type=DiscountValueType.FIXED)
+    sale_channel_listing = SaleChannelListing.objects.create(
+        sale=sale,
+        discount_value=discount_value,
+        currency=channel.currency_code,
+        channel=channel,
+    )
+    return DiscountInfo(
+        sale=sale,
+        channel_listings={channel.slug: sale_channel_listing},
+        product_ids=catalogue.get("product_ids", set()),
+        category_ids=catalogue.get("category_ids", set()),
+        collection_ids=catalogue.get("collection_ids", set()),
+        variants_ids=catalogue.get("variants_ids", set()),
+    )
+
+
+def test_indexed_discounts_match_the_same_sales_as_list(
+    product, collection, channel_USD
+):
+    # given
+    variant = product.variants.get()
+    product.collections.add(collection)
+    discounts = [
+        _create_discount_info(channel_USD, 1, product_ids={product.id}),
+        _create_discount_info(channel_USD, 2, category_ids={product.category_id}),
+        _create_discount_info(channel_USD, 3, collection_ids={collection.id}),
+        _create_discount_info(channel_USD, 4, variants_ids={variant.id}),
+        _create_discount_info(channel_USD, 5, product_ids={product.id + 1}),
+        _create_discount_info(
+            channel_USD,
+            6,
+            product_ids={product.id},
+            category_ids={product.category_id},
+        ),
+    ]
+    collections = [collection]
+
+    # when
+    indexed_result = list(
+        get_product_discounts(
+            product=product,
+            collections=collections,
+            discounts=IndexedDiscounts(discounts),
+            channel=channel_USD,
+            variant_id=variant.id,
+        )
+    )
+
+    # then
+    expected_result = list(
+        get_product_discounts(
+            product=product,
+            collections=collections,
+            discounts=discounts,
+            channel=channel_USD,
+            variant_id=variant.id,
+        )
+    )
+    assert [sale_id for sale_id, _ in indexed_result] == [
+        sale_id for sale_id, _ in expected_result
+    ]
+    assert len(indexed_result) == 5
+
+
+def test_indexed_discounts_match_only_discounts_from_the_list(product, channel_USD):
+    # given
+    active_discount = _create_discount_info(channel_USD, 1, product_ids={product.id})
+    inactive_discount = _create_discount_info(channel_USD, 2, product_ids={product.id})
+    index = IndexedDiscounts([active_discount, inactive_discount]).index
+    discounts = IndexedDiscounts([active_discount], index=index)
+
+    # when
+    result = list(
+        get_product_discounts(
+            product=product, collections=[], discounts=discounts, channel=channel_USD
+        )
+    )
+
+    # then
+    assert [sale_id for sale_id, _ in result] == [active_discount.sale.id]
+
+
+def test_calculate_discounted_prices(product, channel_USD):
+    # given
+    variant = product.variants.get()
+    other_variant_id = variant.id + 1
+    discounts = IndexedDiscounts(
+        [
+            _create_discount_info(channel_USD, 1, product_ids={product.id}),
+            _create_discount_info(channel_USD, 3, variants_ids={variant.id}),
+        ]
+    )
+    price = Money(10, "USD")
+
+    # when
+    prices = calculate_discounted_prices(
+        product=product,
+        variant_prices=[(variant.id, price), (other_variant_id, price), (None, price)],
+        collections=[],
+        discounts=discounts,
+        channel=channel_USD,
+    )
+
+    # then
+    assert prices == [Money(7, "USD"), Money(9, "USD"), Money(9, "USD")]
@@ -14,17 +14,20 @@ from typing import (
     cast,
 )
 
-from django.db.models import F
+from django.db.models import F, Q
 from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ..channel.models import Channel
+from ..core.snapshots import VersionedSnapshot
 from ..core.taxes import zero_money
-from . import DiscountInfo
+from . import DiscountInfo, DiscountsSnapshot
 from .models import NotApplicable, Sale, SaleChannelListing, VoucherCustomer
 
 if TYPE_CHECKING:
     # flake8: noqa
+    from django.db.models import QuerySet
+
     from ..account.models import User
     from ..checkout.fetch import CheckoutInfo, CheckoutLineInfo
     from ..order.models import Order
@@ -92,17 +95,93 @@ def get_product_discount_on_sale(
     raise NotApplicable("Discount not applicable for this product")
 
 
-def get_product_discounts(
-    *,
+class DiscountsIndex:
+    """Inverted index of discounts by IDs of the catalogue objects they apply to."""
+
+    def __init__(self, discounts: Iterable[DiscountInfo]):
+        self._products: DefaultDict[int, List[DiscountInfo]] = defaultdict(list)
+        self._categories: DefaultDict[int, List[DiscountInfo]] = defaultdict(list)
+        self._collections: DefaultDict[int, List[DiscountInfo]] = defaultdict(list)
+        self._variants: DefaultDict[int, List[DiscountInfo]] = defaultdict(list)
+        for discount in discounts:
+            for product_id in discount.product_ids:
+                self._products[product_id].append(discount)
+            for category_id in discount.category_ids:
+                self._categories[category_id].append(discount)
+            for collection_id in discount.collection_ids:
+                self._collections[collection_id].append(discount)
+            for variant_id in discount.variants_ids:
+                self._variants[variant_id].append(discount)
+
+    def get_product_discounts(
+        self, product: "Product", collection_ids: Iterable[int]
+    ) -> List[DiscountInfo]:
+        discounts = self._products.get(product.id, []) + self._categories.get(
+            product.category_id, []  # type: ignore
+        )
+        for collection_id in collection_ids:
+            discounts += self._collections.get(collection_id, [])
+        return discounts
+
+    def get_variant_discounts(self, variant_id: int) -> List[DiscountInfo]:
+        return self._variants.get(variant_id, [])
+
+
+class IndexedDiscounts(list):
+    """List of discounts that can be quickly matched with catalogue objects.
+
+    The index may contain more discounts than the list, e.g. when it's shared with
+    the discounts snapshot; only discounts from the list are matched.
+    """
+
+    def __init__(
+        self, discounts: Iterable[DiscountInfo], index: Optional[DiscountsIndex] = None
+    ):
+        super().__init__(discounts)
+        self.index = index if index is not None else DiscountsIndex(self)
+        self.positions = {id(discount): i for i, discount in enumerate(self)}
+
+    def filter(self, candidates: Iterable[DiscountInfo]) -> List[DiscountInfo]:
+        """Return unique candidates present in the list, in the list order."""
+        matching = {
+            self.positions[id(discount)]: discount
+            for discount in candidates
+            if id(discount) in self.positions
+        }
+        return [matching[position] for position in sorted(matching)]
+
+
+def _get_discounts_for_product(
     product: "Product",
-    collections: Iterable["Collection"],
+    product_collections: Set[int],
+    discounts: Iterable[DiscountInfo],
+    variant_id: Optional[int] = None,
+    product_candidates: Optional[List[DiscountInfo]] = None,
+) -> Iterable[DiscountInfo]:
+    """Narrow down the discounts to those that may apply to the product."""
+    if not isinstance(discounts, IndexedDiscounts):
+        return discounts or []
+    if product_candidates is None:
+        product_candidates = discounts.index.get_product_discounts(
+            product, product_collections
+        )
+    candidates = product_candidates
+    if variant_id:
+        candidates = candidates + discounts.index.get_variant_discounts(variant_id)
+    return discounts.filter(candidates)
+
+
+def _get_product_discounts(
+    product: "Product",
+    product_collections: Set[int],
     discounts: Iterable[DiscountInfo],
     channel: "Channel",
-    variant_id: Optional[int] = None
+    variant_id: Optional[int] = None,
+    product_candidates: Optional[List[DiscountInfo]] = None,
 ) -> Iterator[Tuple[int, Callable]]:
-    """Return sale ids, discount values for all discounts applicable to a product."""
-    product_collections = set(pc.id for pc in collections)
-    for discount in discounts or []:
+    for discount in _get_discounts_for_product(
+        product, product_collections, discounts, variant_id, product_candidates
+    ):
         try:
             yield get_product_discount_on_sale(
                 product, product_collections, discount, channel, variant_id=variant_id
@@ -111,6 +190,21 @@ def get_product_discounts(
             pass
 
 
+def get_product_discounts(
+    *,
+    product: "Product",
+    collections: Iterable["Collection"],
+    discounts: Iterable[DiscountInfo],
+    channel: "Channel",
+    variant_id: Optional[int] = None
+) -> Iterator[Tuple[int, Callable]]:
+    """Return sale ids, discount values for all discounts applicable to a product."""
+    product_collections = set(pc.id for pc in collections)
+    yield from _get_product_discounts(
+        product, product_collections, discounts, channel, variant_id=variant_id
+    )
+
+
 def get_sale_id_with_min_price(
     *,
     product: "Product",
@@ -163,6 +257,47 @@ def calculate_discounted_price(
     return price
 
 
+def calculate_discounted_prices(
+    *,
+    product: "Product",
+    variant_prices: Iterable[Tuple[Optional[int], Money]],
+    collections: Iterable["Collection"],
+    discounts: Optional[Iterable[DiscountInfo]],
+    channel: "Channel",
+) -> List[Money]:
+    """Return discounted prices for many variants of the product in one call.
+
+    Discounts matching the product are looked up once and shared by all variants;
+    `variant_prices` is an iterable of (variant ID, price) tuples.
+    """
+    if not discounts:
+        return [price for _variant_id, price in variant_prices]
+
+    product_collections = set(pc.id for pc in collections)
+    product_candidates = None
+    if isinstance(discounts, IndexedDiscounts):
+        product_candidates = discounts.index.get_product_discounts(
+            product, product_collections
+        )
+    discounted_prices = []
+    for variant_id, price in variant_prices:
+        available_discounts = _get_product_discounts(
+            product,
+            product_collections,
+            discounts,
+            channel,
+            variant_id=variant_id,
+            product_candidates=product_candidates,
+        )
+        discounted_prices.append(
+            min(
+                (discount(price) for _sale_id, discount in available_discounts),
+                default=price,
+            )
+        )
+    return discounted_prices
+
+
 def get_sale_id_applied_as_a_discount(
     *,
     product: "Product",
@@ -325,7 +460,10 @@ def fetch_sale_channel_listings(
 
 
 def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
-    sales = list(Sale.objects.active(date))
+    return fetch_discounts_info(list(Sale.objects.active(date)))
+
+
+def fetch_discounts_info(sales: List[Sale]) -> List[DiscountInfo]:
     pks = {s.pk for s in sales}
     collections = fetch_collections(pks)
     channel_listings = fetch_sale_channel_listings(pks)
@@ -347,7 +485,60 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
 
 
 def fetch_active_discounts() -> List[DiscountInfo]:
-    return fetch_discounts(timezone.now())
+    return fetch_cached_discounts(timezone.now())
+
+
+def is_sale_active(sale: Sale, date: datetime.datetime) -> bool:
+    return sale.start_date <= date and (sale.end_date is None or sale.end_date >= date)
+
+
+def _build_discounts_snapshot(
+    version: str, created_at: datetime.datetime
+) -> DiscountsSnapshot:
+    sales = Sale.objects.filter(Q(end_date__isnull=True) | Q(end_date__gte=created_at))
+    discounts = fetch_discounts_info(list(sales))
+    return DiscountsSnapshot(
+        version=version,
+        created_at=created_at,
+        discounts=discounts,
+        index=DiscountsIndex(discounts),
+    )
+
+
+_discounts_snapshot: VersionedSnapshot[DiscountsSnapshot] = VersionedSnapshot(
+    "discounts-snapshot", "DISCOUNTS_SNAPSHOT_TIMEOUT", _build_discounts_snapshot
+)
+
+
+def invalidate_discounts_snapshot():
+    """Force rebuilding the discounts snapshot in all workers."""
+    _discounts_snapshot.invalidate()
+
+
+def get_discounts_snapshot() -> Optional[DiscountsSnapshot]:
+    """Return the snapshot of sales that are active or scheduled to start.
+
+    The snapshot is kept in the worker memory and shared between workers through
+    the cache. It's rebuilt when it expires or when its version is changed by
+    `invalidate_discounts_snapshot`. Sales starting or ending on schedule don't
+    require rebuilding, as the snapshot is filtered by date when used.
+    """
+    return _discounts_snapshot.get()
+
+
+def fetch_cached_discounts(date: datetime.datetime) -> List[DiscountInfo]:
+    """Return discounts active at the given date, using the discounts snapshot."""
+    snapshot = get_discounts_snapshot()
+    if snapshot is None or date < snapshot.created_at:
+        return IndexedDiscounts(fetch_discounts(date))
+    return IndexedDiscounts(
+        [
+            discount
+            for discount in snapshot.discounts
+            if is_sale_active(cast(Sale, discount.sale), date)
+        ],
+        index=snapshot.index,
+    )
 
 
 def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
@@ -360,3 +551,17 @@ def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
         )
 
     return catalogue_info
+
+
+def fetch_sales_catalogues_info(sales: "QuerySet[Sale]") -> CatalogueInfo:
+    """Return catalogue objects assigned to any of the sales."""
+    catalogue_fields = ["categories", "collections", "products", "variants"]
+    catalogue_info: CatalogueInfo = defaultdict(set)
+
+    for field in catalogue_fields:
+        model = Sale._meta.get_field(field).related_model
+        catalogue_info[field].update(
+            model.objects.filter(sale__in=sales).values_list("id", flat=True)
+        )
+
+    return catalogue_info
@@ -1,4 +1,7 @@
+from typing import List, Optional
+
 import graphene
+from graphql import GraphQLError
 
 from ...core.permissions import AccountPermissions, OrderPermissions
 from ..core.connection import create_connection_slice, filter_connection_queryset
@@ -66,7 +69,7 @@ from .resolvers import (
     resolve_staff_users,
     resolve_user,
 )
-from .sorters import PermissionGroupSortingInput, UserSortingInput
+from .sorters import PermissionGroupSortingInput, UserSortField, UserSortingInput
 from .types import (
     Address,
     AddressValidationData,
@@ -77,6 +80,24 @@ from .types import (
 )
 
 
+def search_string_in_kwargs(kwargs: dict) -> bool:
+    return bool(kwargs.get("filter", {}).get("search", "").strip())
+
+
+def sort_field_from_kwargs(kwargs: dict) -> Optional[List[str]]:
+    return kwargs.get("sort_by", {}).get("field") or None
+
+
+def validate_sort_by_rank(kwargs: dict):
+    # sort by RANK can be used only with search filter
+    if sort_field_from_kwargs(kwargs) != UserSortField.RANK:
+        return
+    if not search_string_in_kwargs(kwargs):
+        raise GraphQLError(
+            "Sorting by RANK is available only when using a search filter."
+        )
+
+
 class CustomerFilterInput(FilterInputObjectType):
     class Meta:
         filterset_class = CustomerFilter
@@ -176,6 +197,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_customers(_root, info, **kwargs):
+        validate_sort_by_rank(kwargs)
         qs = resolve_customers(info)
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, UserCountableConnection)
@@ -198,6 +220,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_staff_users(_root, info, **kwargs):
+        validate_sort_by_rank(kwargs)
         qs = resolve_staff_users(info)
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, UserCountableConnection)
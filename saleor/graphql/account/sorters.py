@@ -1,6 +1,7 @@
 import graphene
 from django.db.models import Count, QuerySet
 
+from ..core.descriptions import ADDED_IN_35
 from ..core.types import SortInputObjectType
 
 
@@ -11,10 +12,21 @@ class UserSortField(graphene.Enum):
     ORDER_COUNT = ["order_count", "email"]
     CREATED_AT = ["date_joined", "pk"]
     LAST_MODIFIED_AT = ["updated_at", "pk"]
+    RANK = ["search_rank", "id"]
 
     @property
     def description(self):
+        descriptions = {
+            UserSortField.RANK.name: (
+                "rank. Note: This option is available only with the `search` filter."
+                + ADDED_IN_35
+            ),
+        }
+
         if self.name in UserSortField.__enum__._member_names_:
+            if self.name in descriptions:
+                return f"Sort users by {descriptions[self.name]}"
+
             sort_name = self.name.lower().replace("_", " ")
             return f"Sort users by {sort_name}."
         raise ValueError("Unsupported enum value: %s" % self.value)
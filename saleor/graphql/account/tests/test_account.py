@@ -5446,6 +5446,69 @@ def test_query_customer_members_with_filter_search(
     assert len(users) == count
 
 
+QUERY_CUSTOMERS_WITH_SEARCH_AND_SORT = """
+    query ($filter: CustomerFilterInput, $sortBy: UserSortingInput) {
+        customers(first: 5, filter: $filter, sortBy: $sortBy) {
+            edges {
+                node {
+                    email
+                }
+            }
+        }
+    }
+"""
+
+
+def test_query_customers_sort_by_rank(staff_api_client, permission_manage_users):
+    # given
+    users = User.objects.bulk_create(
+        [
+            User(email="adam@example.com", first_name="Adam", last_name="Smith"),
+            User(email="john@example.com", first_name="Smith", last_name="Smith"),
+        ]
+    )
+    for user in users:
+        user.search_document = prepare_user_search_document_value(user)
+    User.objects.bulk_update(users, ["search_document"])
+    variables = {
+        "filter": {"search": "smith"},
+        "sortBy": {"field": "RANK", "direction": "DESC"},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_CUSTOMERS_WITH_SEARCH_AND_SORT,
+        variables,
+        permissions=[permission_manage_users],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    emails = [edge["node"]["email"] for edge in content["data"]["customers"]["edges"]]
+    assert emails == ["john@example.com", "adam@example.com"]
+
+
+def test_query_customers_sort_by_rank_without_search(
+    staff_api_client, permission_manage_users
+):
+    # given
+    variables = {"sortBy": {"field": "RANK", "direction": "DESC"}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_CUSTOMERS_WITH_SEARCH_AND_SORT,
+        variables,
+        permissions=[permission_manage_users],
+    )
+
+    # then
+    content = get_graphql_content(response, ignore_errors=True)
+    assert (
+        content["errors"][0]["message"]
+        == "Sorting by RANK is available only when using a search filter."
+    )
+
+
 @pytest.mark.parametrize(
     "staff_member_filter, count",
     [({"status": "DEACTIVATED"}, 1), ({"status": "ACTIVE"}, 2)],
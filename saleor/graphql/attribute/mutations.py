@@ -17,7 +17,7 @@ from ...core.permissions import (
 from ...core.tracing import traced_atomic_transaction
 from ...core.utils import generate_unique_slug
 from ...product import models as product_models
-from ...product.search import update_products_search_vector
+from ...product.search import mark_products_search_vector_as_dirty
 from ..core.enums import MeasurementUnitsEnum
 from ..core.fields import JSONString
 from ..core.inputs import ReorderInput
@@ -753,7 +753,7 @@ class AttributeValueUpdate(AttributeValueCreate):
             Q(Exists(instance.productassignments.filter(product_id=OuterRef("id"))))
             | Q(Exists(variants.filter(product_id=OuterRef("id"))))
         )
-        update_products_search_vector(products)
+        mark_products_search_vector_as_dirty(products.values_list("id", flat=True))
         info.context.plugins.attribute_value_updated(instance)
         info.context.plugins.attribute_updated(instance.attribute)
 
@@ -778,9 +778,7 @@ class AttributeValueDelete(ModelDeleteMutation):
         instance = cls.get_node_or_error(info, node_id, only_type=AttributeValue)
         product_ids = cls.get_product_ids_to_update(instance)
         response = super().perform_mutation(_root, info, **data)
-        update_products_search_vector(
-            product_models.Product.objects.filter(id__in=product_ids)
-        )
+        mark_products_search_vector_as_dirty(product_ids)
         info.context.plugins.attribute_value_deleted(instance)
         info.context.plugins.attribute_updated(instance.attribute)
         return response
@@ -253,5 +253,5 @@ def test_delete_attribute_values_search_document_updated(
 
     product_1.refresh_from_db()
     product_2.refresh_from_db()
-    assert product_1.search_vector
-    assert product_2.search_vector
+    assert product_1.search_index_dirty
+    assert product_2.search_index_dirty
@@ -4,15 +4,18 @@ from typing import DefaultDict, Dict, Iterable, List
 import graphene
 import pytz
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils.text import slugify
 
 from ...channel import models
-from ...checkout.models import Checkout
+from ...checkout.models import Checkout, CheckoutLine
 from ...core.permissions import ChannelPermissions
 from ...core.tracing import traced_atomic_transaction
 from ...core.utils.date_time import convert_to_utc_date_time
 from ...order.models import Order
+from ...plugins.manager import invalidate_plugins_registry
 from ...shipping.tasks import drop_invalid_shipping_methods_relations_for_given_channels
+from ...warehouse.reservations import release_checkout_lines_reservations
 from ..account.enums import CountryCodeEnum
 from ..core.descriptions import ADDED_IN_31
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
@@ -85,6 +88,7 @@ class ChannelCreate(ModelMutation):
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
         info.context.plugins.channel_created(instance)
+        transaction.on_commit(invalidate_plugins_registry)
 
 
 class ChannelUpdateInput(ChannelInput):
@@ -164,6 +168,7 @@ class ChannelUpdate(ModelMutation):
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
         info.context.plugins.channel_updated(instance)
+        transaction.on_commit(invalidate_plugins_registry)
 
 
 class ChannelDeleteInput(graphene.InputObjectType):
@@ -223,6 +228,9 @@ class ChannelDelete(ModelDeleteMutation):
 
     @classmethod
     def delete_checkouts(cls, origin_channel_id):
+        release_checkout_lines_reservations(
+            CheckoutLine.objects.filter(checkout__channel_id=origin_channel_id)
+        )
         Checkout.objects.select_for_update().filter(
             channel_id=origin_channel_id
         ).delete()
@@ -253,6 +261,7 @@ class ChannelDelete(ModelDeleteMutation):
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
         info.context.plugins.channel_deleted(instance)
+        transaction.on_commit(invalidate_plugins_registry)
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
@@ -416,6 +425,7 @@ class ChannelActivate(BaseMutation):
         channel.is_active = True
         channel.save(update_fields=["is_active"])
         info.context.plugins.channel_status_changed(channel)
+        transaction.on_commit(invalidate_plugins_registry)
         return ChannelActivate(channel=channel)
 
 
@@ -450,4 +460,5 @@ class ChannelDeactivate(BaseMutation):
         channel.is_active = False
         channel.save(update_fields=["is_active"])
         info.context.plugins.channel_status_changed(channel)
+        transaction.on_commit(invalidate_plugins_registry)
         return ChannelDeactivate(channel=channel)
@@ -8,6 +8,7 @@ from ....channel.error_codes import ChannelErrorCode
 from ....channel.models import Channel
 from ....checkout.models import Checkout
 from ....order.models import Order
+from ....warehouse.models import Reservation
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.payloads import generate_meta, generate_requestor
 from ...tests.utils import assert_no_permission, get_graphql_content
@@ -139,6 +140,33 @@ def test_channel_delete_mutation_without_orders_in_channel(
     assert not Channel.objects.filter(slug=channel_USD.slug).exists()
 
 
+def test_channel_delete_mutation_releases_checkouts_reservations(
+    permission_manage_channels,
+    staff_api_client,
+    channel_USD,
+    checkout_line_with_one_reservation,
+):
+    # given
+    checkout_line = checkout_line_with_one_reservation
+    stock = checkout_line.reservations.get().stock
+    channel_id = graphene.Node.to_global_id("Channel", channel_USD.id)
+    variables = {"id": channel_id}
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_DELETE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+    content = get_graphql_content(response)
+
+    # then
+    assert not content["data"]["channelDelete"]["errors"]
+    assert not Reservation.objects.exists()
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+
+
 def test_channel_delete_mutation_with_different_currency(
     permission_manage_channels, staff_api_client, channel_USD, channel_PLN
 ):
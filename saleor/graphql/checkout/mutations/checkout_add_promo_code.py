@@ -8,13 +8,17 @@ from ....checkout.fetch import (
     fetch_checkout_lines,
     update_delivery_method_lists_for_checkout_info,
 )
-from ....checkout.utils import add_promo_code_to_checkout
+from ....checkout.utils import add_promo_code_to_checkout, invalidate_checkout_prices
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
 from ...core.mutations import BaseMutation
 from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ..types import Checkout
-from .utils import get_checkout, update_checkout_shipping_method_if_invalid
+from .utils import (
+    get_checkout,
+    invalidate_checkout_loaders,
+    update_checkout_shipping_method_if_invalid,
+)
 
 
 class CheckoutAddPromoCode(BaseMutation):
@@ -105,5 +109,7 @@ class CheckoutAddPromoCode(BaseMutation):
         )
 
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
+        invalidate_checkout_prices(checkout, save=True)
         manager.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutAddPromoCode(checkout=checkout)
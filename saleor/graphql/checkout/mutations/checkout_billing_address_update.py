@@ -2,7 +2,10 @@ import graphene
 
 from ....checkout import AddressType
 from ....checkout.error_codes import CheckoutErrorCode
-from ....checkout.utils import change_billing_address_in_checkout
+from ....checkout.utils import (
+    change_billing_address_in_checkout,
+    invalidate_checkout_prices,
+)
 from ....core.tracing import traced_atomic_transaction
 from ...account.types import AddressInput
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
@@ -10,7 +13,7 @@ from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ..types import Checkout
 from .checkout_shipping_address_update import CheckoutShippingAddressUpdate
-from .utils import get_checkout
+from .utils import get_checkout, invalidate_checkout_loaders
 
 
 class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
@@ -62,5 +65,7 @@ class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
         with traced_atomic_transaction():
             billing_address.save()
             change_billing_address_in_checkout(checkout, billing_address)
+            invalidate_checkout_prices(checkout, save=True)
             info.context.plugins.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutBillingAddressUpdate(checkout=checkout)
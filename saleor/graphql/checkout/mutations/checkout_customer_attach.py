@@ -2,6 +2,7 @@ import graphene
 from django.forms import ValidationError
 
 from ....checkout.error_codes import CheckoutErrorCode
+from ....checkout.utils import invalidate_checkout_prices
 from ....core.exceptions import PermissionDenied
 from ....core.permissions import AccountPermissions, AuthorizationFilters
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
@@ -10,7 +11,7 @@ from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ...utils import get_user_or_app_from_context
 from ..types import Checkout
-from .utils import get_checkout
+from .utils import get_checkout, invalidate_checkout_loaders
 
 
 class CheckoutCustomerAttach(BaseMutation):
@@ -93,7 +94,11 @@ class CheckoutCustomerAttach(BaseMutation):
 
         checkout.user = customer
         checkout.email = customer.email
-        checkout.save(update_fields=["email", "user", "last_change"])
+        checkout.save(
+            update_fields=["email", "user"]
+            + invalidate_checkout_prices(checkout, save=False)
+        )
 
         info.context.plugins.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutCustomerAttach(checkout=checkout)
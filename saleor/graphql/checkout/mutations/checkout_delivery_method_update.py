@@ -4,9 +4,14 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....checkout.error_codes import CheckoutErrorCode
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import (
+    fetch_checkout_info,
+    fetch_checkout_lines,
+    update_checkout_info_delivery_method,
+)
 from ....checkout.utils import (
     delete_external_shipping_id,
+    invalidate_checkout_prices,
     is_shipping_required,
     recalculate_checkout_discount,
     set_external_shipping_id,
@@ -29,7 +34,12 @@ from ...core.utils import from_global_id_or_error
 from ...shipping.types import ShippingMethod
 from ...warehouse.types import Warehouse
 from ..types import Checkout
-from .utils import ERROR_DOES_NOT_SHIP, clean_delivery_method, get_checkout
+from .utils import (
+    ERROR_DOES_NOT_SHIP,
+    clean_delivery_method,
+    get_checkout,
+    prime_checkout_loaders,
+)
 
 
 class CheckoutDeliveryMethodUpdate(BaseMutation):
@@ -92,6 +102,8 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        update_checkout_info_delivery_method(checkout_info, delivery_method)
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutDeliveryMethodUpdate(checkout=checkout)
 
     @classmethod
@@ -128,6 +140,8 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        update_checkout_info_delivery_method(checkout_info, delivery_method)
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutDeliveryMethodUpdate(checkout=checkout)
 
     @classmethod
@@ -154,6 +168,8 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
             external_shipping_method=None,
             collection_point=collection_point,
         )
+        update_checkout_info_delivery_method(checkout_info, collection_point)
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutDeliveryMethodUpdate(checkout=checkout)
 
     @staticmethod
@@ -206,8 +222,8 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
                 "private_metadata",
                 "shipping_method",
                 "collection_point",
-                "last_change",
             ]
+            + invalidate_checkout_prices(checkout, save=False)
         )
         manager.checkout_updated(checkout)
 
@@ -2,12 +2,13 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....checkout.error_codes import CheckoutErrorCode
+from ....checkout.utils import invalidate_checkout_prices
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
 from ...core.mutations import BaseMutation
 from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ..types import Checkout
-from .utils import get_checkout
+from .utils import get_checkout, invalidate_checkout_loaders
 
 
 class CheckoutEmailUpdate(BaseMutation):
@@ -64,6 +65,9 @@ class CheckoutEmailUpdate(BaseMutation):
 
         checkout.email = email
         cls.clean_instance(info, checkout)
-        checkout.save(update_fields=["email", "last_change"])
+        checkout.save(
+            update_fields=["email"] + invalidate_checkout_prices(checkout, save=False)
+        )
         info.context.plugins.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutEmailUpdate(checkout=checkout)
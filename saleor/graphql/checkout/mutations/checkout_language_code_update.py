@@ -7,7 +7,7 @@ from ...core.mutations import BaseMutation
 from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ..types import Checkout
-from .utils import get_checkout
+from .utils import get_checkout, invalidate_checkout_loaders
 
 
 class CheckoutLanguageCodeUpdate(BaseMutation):
@@ -53,4 +53,5 @@ class CheckoutLanguageCodeUpdate(BaseMutation):
         checkout.language_code = language_code
         checkout.save(update_fields=["language_code", "last_change"])
         info.context.plugins.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutLanguageCodeUpdate(checkout=checkout)
@@ -2,13 +2,18 @@ import graphene
 
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
-from ....checkout.utils import recalculate_checkout_discount
+from ....checkout.utils import invalidate_checkout_prices, recalculate_checkout_discount
+from ....warehouse.reservations import release_checkout_lines_reservations
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
 from ...core.mutations import BaseMutation
 from ...core.scalars import UUID
 from ...core.types import CheckoutError
 from ..types import Checkout, CheckoutLine
-from .utils import get_checkout, update_checkout_shipping_method_if_invalid
+from .utils import (
+    get_checkout,
+    prime_checkout_loaders,
+    update_checkout_shipping_method_if_invalid,
+)
 
 
 class CheckoutLineDelete(BaseMutation):
@@ -54,10 +59,11 @@ class CheckoutLineDelete(BaseMutation):
         )
 
         if line and line in checkout.lines.all():
+            release_checkout_lines_reservations([line])
             line.delete()
 
         manager = info.context.plugins
-        lines, _ = fetch_checkout_lines(checkout)
+        lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
         checkout_info = fetch_checkout_info(
             checkout, lines, info.context.discounts, manager
         )
@@ -65,5 +71,9 @@ class CheckoutLineDelete(BaseMutation):
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        invalidate_checkout_prices(checkout, save=True)
+        prime_checkout_loaders(
+            info.context, checkout_info, lines, unavailable_variant_pks
+        )
         manager.checkout_updated(checkout)
         return CheckoutLineDelete(checkout=checkout)
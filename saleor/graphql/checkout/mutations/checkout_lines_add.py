@@ -6,7 +6,11 @@ from ....checkout.fetch import (
     fetch_checkout_lines,
     update_delivery_method_lists_for_checkout_info,
 )
-from ....checkout.utils import add_variants_to_checkout, recalculate_checkout_discount
+from ....checkout.utils import (
+    add_variants_to_checkout,
+    invalidate_checkout_prices,
+    recalculate_checkout_discount,
+)
 from ....warehouse.reservations import get_reservation_length, is_reservation_enabled
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
 from ...core.mutations import BaseMutation
@@ -21,6 +25,7 @@ from .utils import (
     check_permissions_for_custom_prices,
     get_checkout,
     group_quantity_and_custom_prices_by_variants,
+    prime_checkout_loaders,
     update_checkout_shipping_method_if_invalid,
     validate_variants_are_published,
     validate_variants_available_for_purchase,
@@ -138,7 +143,7 @@ class CheckoutLinesAdd(BaseMutation):
                 reservation_length=get_reservation_length(info.context),
             )
 
-        lines, _ = fetch_checkout_lines(checkout)
+        lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
         shipping_channel_listings = checkout.channel.shipping_method_listings.all()
         update_delivery_method_lists_for_checkout_info(
             checkout_info,
@@ -150,7 +155,7 @@ class CheckoutLinesAdd(BaseMutation):
             manager,
             shipping_channel_listings,
         )
-        return lines
+        return lines, unavailable_variant_pks
 
     @classmethod
     def perform_mutation(
@@ -180,7 +185,7 @@ class CheckoutLinesAdd(BaseMutation):
         )
 
         lines, _ = fetch_checkout_lines(checkout)
-        lines = cls.clean_input(
+        lines, unavailable_variant_pks = cls.clean_input(
             info,
             checkout,
             variants,
@@ -195,5 +200,9 @@ class CheckoutLinesAdd(BaseMutation):
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        invalidate_checkout_prices(checkout, save=True)
+        prime_checkout_loaders(
+            info.context, checkout_info, lines, unavailable_variant_pks
+        )
         manager.checkout_updated(checkout)
         return CheckoutLinesAdd(checkout=checkout)
@@ -3,14 +3,19 @@ from django.core.exceptions import ValidationError
 
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
-from ....checkout.utils import recalculate_checkout_discount
+from ....checkout.utils import invalidate_checkout_prices, recalculate_checkout_discount
+from ....warehouse.reservations import release_checkout_lines_reservations
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
 from ...core.mutations import BaseMutation
 from ...core.scalars import UUID
 from ...core.types import CheckoutError, NonNullList
 from ...utils import resolve_global_ids_to_primary_keys
 from ..types import Checkout
-from .utils import get_checkout, update_checkout_shipping_method_if_invalid
+from .utils import (
+    get_checkout,
+    prime_checkout_loaders,
+    update_checkout_shipping_method_if_invalid,
+)
 
 
 class CheckoutLinesDelete(BaseMutation):
@@ -72,9 +77,11 @@ class CheckoutLinesDelete(BaseMutation):
             lines_ids, graphene_type="CheckoutLine", raise_error=True
         )
         cls.validate_lines(checkout, lines_to_delete)
-        checkout.lines.filter(id__in=lines_to_delete).delete()
+        checkout_lines = checkout.lines.filter(id__in=lines_to_delete)
+        release_checkout_lines_reservations(checkout_lines)
+        checkout_lines.delete()
 
-        lines, _ = fetch_checkout_lines(checkout)
+        lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
 
         manager = info.context.plugins
         checkout_info = fetch_checkout_info(
@@ -84,5 +91,9 @@ class CheckoutLinesDelete(BaseMutation):
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        invalidate_checkout_prices(checkout, save=True)
+        prime_checkout_loaders(
+            info.context, checkout_info, lines, unavailable_variant_pks
+        )
         manager.checkout_updated(checkout)
         return CheckoutLinesDelete(checkout=checkout)
@@ -8,6 +8,7 @@ from ....checkout import models
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info
 from ....checkout.utils import (
+    invalidate_checkout_prices,
     remove_promo_code_from_checkout,
     remove_voucher_from_checkout,
 )
@@ -20,7 +21,7 @@ from ...core.validators import validate_one_of_args_is_in_mutation
 from ...discount.types import Voucher
 from ...giftcard.types import GiftCard
 from ..types import Checkout
-from .utils import get_checkout
+from .utils import get_checkout, invalidate_checkout_loaders
 
 
 class CheckoutRemovePromoCode(BaseMutation):
@@ -91,7 +92,9 @@ class CheckoutRemovePromoCode(BaseMutation):
         else:
             cls.remove_promo_code_by_id(info, checkout, object_type, promo_code_pk)
 
+        invalidate_checkout_prices(checkout, save=True)
         manager.checkout_updated(checkout)
+        invalidate_checkout_loaders(info.context, checkout.token)
         return CheckoutRemovePromoCode(checkout=checkout)
 
     @staticmethod
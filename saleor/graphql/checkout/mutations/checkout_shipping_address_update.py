@@ -12,6 +12,7 @@ from ....checkout.fetch import (
 )
 from ....checkout.utils import (
     change_shipping_address_in_checkout,
+    invalidate_checkout_prices,
     is_shipping_required,
     recalculate_checkout_discount,
 )
@@ -29,6 +30,7 @@ from .utils import (
     ERROR_DOES_NOT_SHIP,
     check_lines_quantity,
     get_checkout,
+    prime_checkout_loaders,
     update_checkout_shipping_method_if_invalid,
 )
 
@@ -105,7 +107,7 @@ class CheckoutShippingAddressUpdate(BaseMutation, I18nMixin):
             ),
         )
 
-        lines, _ = fetch_checkout_lines(checkout)
+        lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
         if not is_shipping_required(lines):
             raise ValidationError(
                 {
@@ -151,5 +153,9 @@ class CheckoutShippingAddressUpdate(BaseMutation, I18nMixin):
             )
         recalculate_checkout_discount(manager, checkout_info, lines, discounts)
 
+        invalidate_checkout_prices(checkout, save=True)
+        prime_checkout_loaders(
+            info.context, checkout_info, lines, unavailable_variant_pks
+        )
         manager.checkout_updated(checkout)
         return CheckoutShippingAddressUpdate(checkout=checkout)
@@ -4,9 +4,14 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....checkout.error_codes import CheckoutErrorCode
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import (
+    fetch_checkout_info,
+    fetch_checkout_lines,
+    update_checkout_info_delivery_method,
+)
 from ....checkout.utils import (
     delete_external_shipping_id,
+    invalidate_checkout_prices,
     is_shipping_required,
     recalculate_checkout_discount,
     set_external_shipping_id,
@@ -22,7 +27,12 @@ from ...core.types import CheckoutError
 from ...core.utils import from_global_id_or_error
 from ...shipping.types import ShippingMethod
 from ..types import Checkout
-from .utils import ERROR_DOES_NOT_SHIP, clean_delivery_method, get_checkout
+from .utils import (
+    ERROR_DOES_NOT_SHIP,
+    clean_delivery_method,
+    get_checkout,
+    prime_checkout_loaders,
+)
 
 
 class CheckoutShippingMethodUpdate(BaseMutation):
@@ -175,12 +185,15 @@ class CheckoutShippingMethodUpdate(BaseMutation):
         delete_external_shipping_id(checkout=checkout)
         checkout.shipping_method = shipping_method
         checkout.save(
-            update_fields=["private_metadata", "shipping_method", "last_change"]
+            update_fields=["private_metadata", "shipping_method"]
+            + invalidate_checkout_prices(checkout, save=False)
         )
 
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        update_checkout_info_delivery_method(checkout_info, delivery_method)
+        prime_checkout_loaders(info.context, checkout_info, lines)
         manager.checkout_updated(checkout)
         return CheckoutShippingMethodUpdate(checkout=checkout)
 
@@ -201,11 +214,14 @@ class CheckoutShippingMethodUpdate(BaseMutation):
         set_external_shipping_id(checkout=checkout, app_shipping_id=delivery_method.id)
         checkout.shipping_method = None
         checkout.save(
-            update_fields=["private_metadata", "shipping_method", "last_change"]
+            update_fields=["private_metadata", "shipping_method"]
+            + invalidate_checkout_prices(checkout, save=False)
         )
 
         recalculate_checkout_discount(
             manager, checkout_info, lines, info.context.discounts
         )
+        update_checkout_info_delivery_method(checkout_info, delivery_method)
+        prime_checkout_loaders(info.context, checkout_info, lines)
         manager.checkout_updated(checkout)
         return CheckoutShippingMethodUpdate(checkout=checkout)
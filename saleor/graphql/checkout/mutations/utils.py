@@ -27,6 +27,12 @@ from ....shipping import interface as shipping_interface
 from ....warehouse import models as warehouse_models
 from ....warehouse.availability import check_stock_and_preorder_quantity_bulk
 from ...core.validators import validate_one_of_args_is_in_mutation
+from ..dataloaders import (
+    CheckoutByTokenLoader,
+    CheckoutInfoByCheckoutTokenLoader,
+    CheckoutLinesByCheckoutTokenLoader,
+    CheckoutLinesInfoByCheckoutTokenLoader,
+)
 from ..types import Checkout
 
 if TYPE_CHECKING:
@@ -274,6 +280,38 @@ def get_checkout(
     return checkout
 
 
+def invalidate_checkout_loaders(context, checkout_token: uuid.UUID):
+    """Drop the checkout data cached by dataloaders during the request.
+
+    Must be called by mutations changing the checkout, as the data could be loaded
+    by resolvers of a previous mutation in the same request.
+    """
+    CheckoutByTokenLoader(context).clear(checkout_token)
+    CheckoutLinesByCheckoutTokenLoader(context).clear(checkout_token)
+    CheckoutLinesInfoByCheckoutTokenLoader(context).clear(checkout_token)
+    CheckoutInfoByCheckoutTokenLoader(context).clear(checkout_token)
+
+
+def prime_checkout_loaders(
+    context,
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    unavailable_variant_pks: Iterable[int] = (),
+):
+    """Share the checkout data fetched by a mutation with resolvers of its response.
+
+    Must be called when the mutation doesn't change the checkout anymore. Line infos
+    are shared only when they were fetched for all the checkout lines.
+    """
+    checkout = checkout_info.checkout
+    invalidate_checkout_loaders(context, checkout.token)
+    if unavailable_variant_pks:
+        return
+    CheckoutByTokenLoader(context).prime(checkout.token, checkout)
+    CheckoutLinesInfoByCheckoutTokenLoader(context).prime(checkout.token, list(lines))
+    CheckoutInfoByCheckoutTokenLoader(context).prime(checkout.token, checkout_info)
+
+
 def group_quantity_and_custom_prices_by_variants(
     lines: List[Dict[str, Any]]
 ) -> List[CheckoutLineData]:
@@ -1400,6 +1400,8 @@ def test_checkout_complete_own_reservation(
         quantity_reserved=quantity_available,
         reserved_until=timezone.now() + timedelta(minutes=5),
     )
+    stock.quantity_reserved = quantity_available
+    stock.save(update_fields=["quantity_reserved"])
 
     manager = get_plugins_manager()
     lines, _ = fetch_checkout_lines(checkout)
@@ -1444,6 +1446,8 @@ def test_checkout_complete_own_reservation(
     # Reservation associated with checkout has been deleted
     with pytest.raises(Reservation.DoesNotExist):
         reservation.refresh_from_db()
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
 
 
 def test_checkout_complete_without_redirect_url(
@@ -1,4 +1,7 @@
+import datetime
+
 import graphene
+from django.utils import timezone
 
 from .....account.models import User
 from .....checkout.error_codes import CheckoutErrorCode
@@ -47,6 +50,30 @@ def test_checkout_customer_attach(
     assert checkout.last_change != previous_last_change
 
 
+def test_checkout_customer_attach_invalidates_checkout_prices(
+    user_api_client, checkout_with_item, customer_user, permission_impersonate_user
+):
+    # given
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + datetime.timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    customer_id = graphene.Node.to_global_id("User", customer_user.pk)
+    variables = {"id": to_global_id_or_none(checkout), "customerId": customer_id}
+
+    # when
+    response = user_api_client.post_graphql(
+        MUTATION_CHECKOUT_CUSTOMER_ATTACH,
+        variables,
+        permissions=[permission_impersonate_user],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["checkoutCustomerAttach"]["errors"]
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+
+
 def test_checkout_customer_attach_no_customer_id(
     api_client, user_api_client, checkout_with_item, customer_user
 ):
@@ -10,7 +10,7 @@ from .....checkout.utils import (
     calculate_checkout_quantity,
 )
 from .....plugins.manager import get_plugins_manager
-from .....warehouse.models import Reservation
+from .....warehouse.models import Reservation, Stock
 from ....core.utils import to_global_id_or_none
 from ....tests.utils import get_graphql_content
 from ...mutations.utils import update_checkout_shipping_method_if_invalid
@@ -68,6 +68,7 @@ def test_checkout_line_delete(
     assert checkout.lines.count() == 0
     assert calculate_checkout_quantity(lines) == 0
     assert Reservation.objects.count() == 0
+    assert not Stock.objects.filter(quantity_reserved__gt=0).exists()
     manager = get_plugins_manager()
     checkout_info = fetch_checkout_info(checkout, lines, [], manager)
     mocked_update_shipping_method.assert_called_once_with(checkout_info, lines)
@@ -84,6 +84,29 @@ def test_checkout_lines_add(
     assert checkout.last_change != previous_last_change
 
 
+def test_checkout_lines_add_invalidates_checkout_prices(
+    user_api_client, checkout_with_item, stock
+):
+    # given
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + datetime.timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    variant_id = graphene.Node.to_global_id("ProductVariant", stock.product_variant.pk)
+    variables = {
+        "id": to_global_id_or_none(checkout),
+        "lines": [{"variantId": variant_id, "quantity": 1}],
+    }
+
+    # when
+    response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_ADD, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["checkoutLinesAdd"]["errors"]
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+
+
 def test_checkout_lines_add_with_reservations(
     site_settings_with_reservations, user_api_client, checkout_with_item, stock
 ):
@@ -1,8 +1,15 @@
 import pytest
 
+from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ...dataloaders import (
+    CheckoutInfoByCheckoutTokenLoader,
+    CheckoutLinesInfoByCheckoutTokenLoader,
+)
 from ...mutations.utils import (
     CheckoutLineData,
     group_quantity_and_custom_prices_by_variants,
+    invalidate_checkout_loaders,
+    prime_checkout_loaders,
 )
 
 
@@ -78,3 +85,60 @@ from ...mutations.utils import (
 )
 def test_group_by_variants(lines, expected):
     assert expected == group_quantity_and_custom_prices_by_variants(lines)
+
+
+def test_prime_checkout_loaders(checkout_with_item, info):
+    # given
+    manager = info.context.plugins
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+
+    # when
+    prime_checkout_loaders(info.context, checkout_info, lines)
+
+    # then
+    token = checkout_with_item.token
+    checkout_info_loader = CheckoutInfoByCheckoutTokenLoader(info.context)
+    lines_info_loader = CheckoutLinesInfoByCheckoutTokenLoader(info.context)
+    assert checkout_info_loader.load(token).get() is checkout_info
+    assert lines_info_loader.load(token).get() == lines
+
+
+def test_prime_checkout_loaders_skips_lines_with_unavailable_variants(
+    checkout_with_item, info
+):
+    # given
+    manager = info.context.plugins
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    unavailable_variant_pks = [lines[0].variant.pk]
+
+    # when
+    prime_checkout_loaders(
+        info.context, checkout_info, lines[1:], unavailable_variant_pks
+    )
+
+    # then
+    token = checkout_with_item.token
+    assert token not in CheckoutInfoByCheckoutTokenLoader(info.context)._promise_cache
+    assert (
+        token not in CheckoutLinesInfoByCheckoutTokenLoader(info.context)._promise_cache
+    )
+
+
+def test_invalidate_checkout_loaders(checkout_with_item, info):
+    # given
+    manager = info.context.plugins
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    prime_checkout_loaders(info.context, checkout_info, lines)
+
+    # when
+    invalidate_checkout_loaders(info.context, checkout_with_item.token)
+
+    # then
+    token = checkout_with_item.token
+    assert token not in CheckoutInfoByCheckoutTokenLoader(info.context)._promise_cache
+    assert (
+        token not in CheckoutLinesInfoByCheckoutTokenLoader(info.context)._promise_cache
+    )
@@ -128,8 +128,6 @@ class CheckoutLine(ModelObjectType):
 
     @staticmethod
     def resolve_unit_price(root, info):
-        # Temporary solution in new tax interface introduced in PR#9526
-        # this value will be denormalized and store in checkout line.
         def with_checkout(checkout):
             discounts = DiscountsByDateTimeLoader(info.context).load(
                 info.context.request_time
@@ -149,17 +147,13 @@ class CheckoutLine(ModelObjectType):
                 ) = data
                 for line_info in lines:
                     if line_info.line.pk == root.pk:
-                        address = (
-                            checkout_info.shipping_address
-                            or checkout_info.billing_address
-                        )
-                        return info.context.plugins.calculate_checkout_line_unit_price(
+                        return calculations.checkout_line_unit_price(
+                            manager=info.context.plugins,
                             checkout_info=checkout_info,
                             lines=lines,
                             checkout_line_info=line_info,
-                            address=address,
                             discounts=discounts,
-                        ).price_with_discounts
+                        )
                 return None
 
             return Promise.all(
@@ -178,8 +172,6 @@ class CheckoutLine(ModelObjectType):
 
     @staticmethod
     def resolve_undiscounted_unit_price(root, info):
-        # Temporary solution in new tax interface introduced in PR#9526
-        # this value will be denormalized and store in checkout line.
         def with_checkout(checkout):
             discounts = DiscountsByDateTimeLoader(info.context).load(
                 info.context.request_time
@@ -199,21 +191,17 @@ class CheckoutLine(ModelObjectType):
                 ) = data
                 for line_info in lines:
                     if line_info.line.pk == root.pk:
-                        address = (
-                            checkout_info.shipping_address
-                            or checkout_info.billing_address
-                        )
                         include_taxes_in_prices = (
                             info.context.site.settings.include_taxes_in_prices
                         )
                         undiscounted_price = (
-                            info.context.plugins.calculate_checkout_line_unit_price(
+                            calculations.checkout_line_undiscounted_unit_price(
+                                manager=info.context.plugins,
                                 checkout_info=checkout_info,
                                 lines=lines,
                                 checkout_line_info=line_info,
-                                address=address,
                                 discounts=discounts,
-                            ).undiscounted_price
+                            )
                         )
                         return (
                             undiscounted_price.gross
@@ -258,17 +246,13 @@ class CheckoutLine(ModelObjectType):
                 ) = data
                 for line_info in lines:
                     if line_info.line.pk == root.pk:
-                        address = (
-                            checkout_info.shipping_address
-                            or checkout_info.billing_address
-                        )
-                        return info.context.plugins.calculate_checkout_line_total(
+                        return calculations.checkout_line_total_price(
+                            manager=info.context.plugins,
                             checkout_info=checkout_info,
                             lines=lines,
                             checkout_line_info=line_info,
-                            address=address,
                             discounts=discounts,
-                        ).price_with_discounts
+                        )
                 return None
 
             return Promise.all(
@@ -287,8 +271,6 @@ class CheckoutLine(ModelObjectType):
 
     @staticmethod
     def resolve_undiscounted_total_price(root, info):
-        # Temporary solution in new tax interface introduced in PR#9526
-        # this value will be denormalized and store in checkout line.
         def with_checkout(checkout):
             discounts = DiscountsByDateTimeLoader(info.context).load(
                 info.context.request_time
@@ -308,21 +290,17 @@ class CheckoutLine(ModelObjectType):
                 ) = data
                 for line_info in lines:
                     if line_info.line.pk == root.pk:
-                        address = (
-                            checkout_info.shipping_address
-                            or checkout_info.billing_address
-                        )
                         include_taxes_in_prices = (
                             info.context.site.settings.include_taxes_in_prices
                         )
                         undiscounted_price = (
-                            info.context.plugins.calculate_checkout_line_total(
+                            calculations.checkout_line_undiscounted_total_price(
+                                manager=info.context.plugins,
                                 checkout_info=checkout_info,
                                 lines=lines,
                                 checkout_line_info=line_info,
-                                address=address,
                                 discounts=discounts,
-                            ).undiscounted_price
+                            )
                         )
                         return (
                             undiscounted_price.gross
@@ -578,7 +556,6 @@ class Checkout(ModelObjectType):
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_total_price(root: models.Checkout, info):
         def calculate_total_price(data):
             address, lines, checkout_info, discounts = data
@@ -609,7 +586,6 @@ class Checkout(ModelObjectType):
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_subtotal_price(root: models.Checkout, info):
         def calculate_subtotal_price(data):
             address, lines, checkout_info, discounts = data
@@ -636,7 +612,6 @@ class Checkout(ModelObjectType):
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_shipping_price(root: models.Checkout, info):
         def calculate_shipping_price(data):
             address, lines, checkout_info, discounts = data
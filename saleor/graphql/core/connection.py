@@ -19,6 +19,7 @@ from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.enums import OrderDirection
 from ..core.types import NonNullList
 from ..utils.sorting import sort_queryset_for_connection
+from .total_count import TotalCountStrategy, get_total_count
 
 ConnectionArguments = Dict[str, Any]
 
@@ -238,6 +239,19 @@ def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
 
+def _has_filter_args(args: ConnectionArguments) -> bool:
+    """Return True if the connection is filtered or searched by the client."""
+    if args.get("search"):
+        return True
+    filter_input = args.get(args.get(FILTERS_NAME, "filter")) or {}
+    # channel is always set on the filter input, it's not a filter by itself
+    return any(
+        value not in (None, "", [], {})
+        for name, value in filter_input.items()
+        if name != "channel"
+    )
+
+
 def connection_from_queryset_slice(
     qs: QuerySet,
     args: ConnectionArguments = None,
@@ -287,14 +301,12 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
-
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=lambda: get_total_count(
+                qs, connection_type, filtered=_has_filter_args(args)
+            ),
         )
 
     return connection_type(
@@ -506,6 +518,9 @@ class CountableConnection(NonNullConnection):
     class Meta:
         abstract = True
 
+    # Overridden per connection type by `GRAPHQL_TOTAL_COUNT_STRATEGIES` setting.
+    total_count_strategy = TotalCountStrategy.EXACT
+
     total_count = graphene.Int(description="A total count of items in the collection.")
 
     @staticmethod
@@ -0,0 +1,161 @@
+from unittest import mock
+
+from django.core.cache import cache
+from graphql import get_default_backend
+
+from ...api import schema
+from ...document_cache import DocumentCache
+from ...query_cost_map import COST_MAP
+from ..validators.query_cost import validate_query_cost
+
+QUERY_SHOP = """
+    query {
+        shop {
+            name
+        }
+    }
+"""
+
+QUERY_CHANNELS = """
+    query {
+        channels {
+            slug
+        }
+    }
+"""
+
+QUERY_PRODUCTS = """
+    query Products($first: Int) {
+        products(first: $first) {
+            edges {
+                node {
+                    id
+                }
+            }
+        }
+    }
+"""
+
+
+def test_document_cache_returns_cached_document():
+    # given
+    document_cache = DocumentCache(max_size=10)
+    backend = get_default_backend()
+
+    # when
+    document = document_cache.get_document(backend, schema, QUERY_SHOP)
+    cached_document = document_cache.get_document(backend, schema, QUERY_SHOP)
+
+    # then
+    assert cached_document is document
+    assert document_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_document_cache_evicts_least_recently_used_document():
+    # given
+    document_cache = DocumentCache(max_size=1)
+    backend = get_default_backend()
+    document = document_cache.get_document(backend, schema, QUERY_SHOP)
+
+    # when
+    document_cache.get_document(backend, schema, QUERY_CHANNELS)
+    new_document = document_cache.get_document(backend, schema, QUERY_SHOP)
+
+    # then
+    assert new_document is not document
+    assert document_cache.stats() == {"hits": 0, "misses": 3, "size": 1}
+
+
+def test_document_cache_disabled():
+    # given
+    document_cache = DocumentCache(max_size=0)
+    backend = get_default_backend()
+
+    # when
+    document = document_cache.get_document(backend, schema, QUERY_SHOP)
+    new_document = document_cache.get_document(backend, schema, QUERY_SHOP)
+
+    # then
+    assert new_document is not document
+    assert document_cache.stats()["size"] == 0
+
+
+@mock.patch("saleor.graphql.document_cache.validate")
+def test_document_cache_validates_document_once(mocked_validate):
+    # given
+    mocked_validate.return_value = []
+    document_cache = DocumentCache(max_size=10)
+    document = document_cache.get_document(get_default_backend(), schema, QUERY_SHOP)
+
+    # when
+    errors = document_cache.validate(document)
+    document_cache.validate(document)
+
+    # then
+    assert errors is None
+    mocked_validate.assert_called_once_with(schema, document.document_ast)
+
+
+def test_document_cache_returns_validation_errors():
+    # given
+    document_cache = DocumentCache(max_size=10)
+    document = document_cache.get_document(
+        get_default_backend(), schema, "query { shop { invalidField } }"
+    )
+
+    # when
+    errors = document_cache.validate(document)
+
+    # then
+    assert len(errors) == 1
+    assert document_cache.validate(document) is errors
+
+
+@mock.patch(
+    "saleor.graphql.document_cache.validate_query_cost", wraps=validate_query_cost
+)
+def test_document_cache_caches_query_cost_per_variables(mocked_validate_query_cost):
+    # given
+    document_cache = DocumentCache(max_size=10)
+    document = document_cache.get_document(
+        get_default_backend(), schema, QUERY_PRODUCTS
+    )
+
+    # when
+    cost_small, _ = document_cache.get_query_cost(
+        schema, document, {"first": 1}, COST_MAP, 50000
+    )
+    cost_big, _ = document_cache.get_query_cost(
+        schema, document, {"first": 100}, COST_MAP, 50000
+    )
+    cost_small_cached, _ = document_cache.get_query_cost(
+        schema, document, {"first": 1}, COST_MAP, 50000
+    )
+
+    # then
+    assert cost_small < cost_big
+    assert cost_small_cached == cost_small
+    assert mocked_validate_query_cost.call_count == 2
+
+
+@mock.patch("saleor.graphql.document_cache.validate")
+def test_document_cache_uses_shared_cache(mocked_validate, settings):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SHARED = True
+    cache.clear()
+    mocked_validate.return_value = []
+    backend = get_default_backend()
+    first_worker_cache = DocumentCache(max_size=10)
+    second_worker_cache = DocumentCache(max_size=10)
+    first_worker_cache.validate(
+        first_worker_cache.get_document(backend, schema, QUERY_CHANNELS)
+    )
+
+    # when
+    errors = second_worker_cache.validate(
+        second_worker_cache.get_document(backend, schema, QUERY_CHANNELS)
+    )
+
+    # then
+    assert errors is None
+    mocked_validate.assert_called_once()
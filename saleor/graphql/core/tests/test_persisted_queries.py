@@ -0,0 +1,127 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+
+from ...persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND,
+    PERSISTED_QUERY_NOT_SUPPORTED,
+    generate_persisted_query_cache_key,
+)
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP_NAME = "query ShopName { shop { name } }"
+QUERY_SHOP_NAME_HASH = hashlib.sha256(QUERY_SHOP_NAME.encode("utf-8")).hexdigest()
+
+
+def _persisted_query_extensions(query_hash=QUERY_SHOP_NAME_HASH):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_persisted_query_not_found(api_client, site_settings):
+    # given
+    cache.delete(generate_persisted_query_cache_key(QUERY_SHOP_NAME_HASH))
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extensions()})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert "data" not in content
+    assert content["errors"][0]["message"] == PERSISTED_QUERY_NOT_FOUND
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_resolved_by_hash(api_client, site_settings):
+    # given
+    cache.delete(generate_persisted_query_cache_key(QUERY_SHOP_NAME_HASH))
+    response = api_client.post(
+        {"query": QUERY_SHOP_NAME, "extensions": _persisted_query_extensions()}
+    )
+    get_graphql_content(response)
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extensions()})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # when
+    response = api_client.post(
+        {
+            "query": QUERY_SHOP_NAME,
+            "extensions": _persisted_query_extensions("invalid-hash"),
+        }
+    )
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match query."
+    )
+    assert not cache.get(generate_persisted_query_cache_key("invalid-hash"))
+
+
+def test_persisted_queries_disabled(api_client, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = api_client.post(
+        {"query": QUERY_SHOP_NAME, "extensions": _persisted_query_extensions()}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == PERSISTED_QUERY_NOT_SUPPORTED
+
+
+def test_persisted_query_sent_with_get_request(client, site_settings):
+    # given
+    cache.set(generate_persisted_query_cache_key(QUERY_SHOP_NAME_HASH), QUERY_SHOP_NAME)
+
+    # when
+    response = client.get(
+        API_PATH,
+        {"extensions": json.dumps(_persisted_query_extensions())},
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_query_sent_with_get_request(client, site_settings):
+    # when
+    response = client.get(
+        API_PATH,
+        {
+            "query": QUERY_SHOP_NAME,
+            "variables": json.dumps({}),
+        },
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_mutation_sent_with_get_request_is_rejected(client):
+    # when
+    response = client.get(
+        API_PATH,
+        {"query": 'mutation { tokenRefresh(refreshToken: "abc") { token } }'},
+    )
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Only query operations can be sent with GET requests."
+    )
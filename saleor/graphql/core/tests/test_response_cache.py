@@ -0,0 +1,303 @@
+from unittest import mock
+
+import graphene
+from django.core.cache import cache
+from graphql import get_default_backend
+from graphql.execution import ExecutionResult
+
+from ....plugins.manager import get_plugins_manager
+from ...api import schema
+from ...response_cache import (
+    cache_response,
+    collect_cache_tags,
+    get_cached_response,
+    get_list_tag,
+    get_operation_types,
+    get_response_cache_generation,
+    get_type_tag,
+    invalidate_cache_tags,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT = """
+    query Product($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            id
+            name
+        }
+    }
+"""
+
+QUERY_PRODUCT_NAME = """
+    query Product($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            name
+        }
+    }
+"""
+
+QUERY_CATEGORY_PRODUCTS = """
+    query CategoryProducts($id: ID!, $channel: String) {
+        category(id: $id) {
+            ...CategoryProducts
+        }
+    }
+
+    fragment CategoryProducts on Category {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+QUERY_CHECKOUT = """
+    query Checkout($token: UUID!) {
+        checkout(token: $token) {
+            token
+        }
+    }
+"""
+
+
+def test_collect_cache_tags():
+    # given
+    product_id = graphene.Node.to_global_id("Product", 1)
+    variant_id = graphene.Node.to_global_id("ProductVariant", 2)
+    data = {
+        "products": {
+            "edges": [
+                {
+                    "node": {
+                        "id": product_id,
+                        "variants": [{"id": variant_id, "name": "XL"}],
+                    }
+                }
+            ]
+        }
+    }
+    tags = set()
+
+    # when
+    collect_cache_tags(data, tags)
+
+    # then
+    assert tags == {
+        product_id,
+        variant_id,
+        get_type_tag("Product"),
+        get_type_tag("ProductVariant"),
+        get_list_tag("Product"),
+        get_list_tag("ProductVariant"),
+    }
+
+
+def test_get_operation_types():
+    # given
+    document = get_default_backend().document_from_string(
+        schema, QUERY_CATEGORY_PRODUCTS
+    )
+
+    # when
+    types = get_operation_types(document, None)
+
+    # then
+    assert types == {"Category": False, "Product": True}
+
+
+def test_anonymous_query_response_is_cached(api_client, product, channel_USD, settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    old_name = product.name
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+    get_graphql_content(response)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == old_name
+
+
+def test_cached_response_invalidated_by_plugin_event(
+    api_client, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.response_cache.plugin.ResponseCachePlugin"]
+    cache.clear()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+    get_graphql_content(response)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager().product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+def test_cached_response_without_ids_invalidated_by_plugin_event(
+    api_client, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.response_cache.plugin.ResponseCachePlugin"]
+    cache.clear()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    response = api_client.post_graphql(QUERY_PRODUCT_NAME, variables)
+    get_graphql_content(response)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager().product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCT_NAME, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+def test_cached_empty_list_invalidated_by_plugin_event(
+    api_client, category, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.response_cache.plugin.ResponseCachePlugin"]
+    cache.clear()
+    product.category = None
+    product.save(update_fields=["category"])
+    variables = {
+        "id": graphene.Node.to_global_id("Category", category.pk),
+        "channel": channel_USD.slug,
+    }
+    response = api_client.post_graphql(QUERY_CATEGORY_PRODUCTS, variables)
+    content = get_graphql_content(response)
+    assert content["data"]["category"]["products"]["edges"] == []
+    product.category = category
+    product.save(update_fields=["category"])
+
+    # when
+    get_plugins_manager().product_created(product)
+    response = api_client.post_graphql(QUERY_CATEGORY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["category"]["products"]["edges"] == [
+        {"node": {"name": product.name}}
+    ]
+
+
+def test_cached_response_invalidated_by_tag_of_other_type(
+    api_client, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+    get_graphql_content(response)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    invalidate_cache_tags([get_type_tag("Product")])
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+def test_response_not_cached_when_invalidated_during_execution(settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    product_id = graphene.Node.to_global_id("Product", 1)
+    result = ExecutionResult(data={"product": {"id": product_id, "name": "Old"}})
+    generation = get_response_cache_generation()
+
+    # when
+    invalidate_cache_tags([product_id])
+    cache_response("response-key", result, generation)
+
+    # then
+    assert get_cached_response("response-key") is None
+
+
+def test_authenticated_query_response_is_not_cached(
+    staff_api_client, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    response = staff_api_client.post_graphql(QUERY_PRODUCT, variables)
+    get_graphql_content(response)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+def test_response_without_tags_is_not_cached(settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    result = ExecutionResult(data={"shop": {"name": "Saleor"}})
+    generation = get_response_cache_generation()
+
+    # when
+    cache_response("response-key", result, generation, {})
+
+    # then
+    assert get_cached_response("response-key") is None
+
+
+@mock.patch("saleor.graphql.views.cache_response")
+def test_query_with_not_allowed_root_field_is_not_cached(
+    mocked_cache_response, api_client, checkout, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    variables = {"token": str(checkout.token)}
+
+    # when
+    response = api_client.post_graphql(QUERY_CHECKOUT, variables)
+
+    # then
+    get_graphql_content(response)
+    mocked_cache_response.assert_not_called()
@@ -0,0 +1,136 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import DateTimeField, Value
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ....tests.models import Book
+from ..total_count import COUNT_FUNCTIONS, TotalCountStrategy, get_total_count
+from .test_pagination import BookTypeCountableConnection
+
+
+@pytest.fixture
+def books(db):
+    books = [Book(name=f"Book{index}") for index in range(24)]
+    return Book.objects.bulk_create(books)
+
+
+def test_get_total_count_exact_by_default(books):
+    # when
+    total_count = get_total_count(Book.objects.all(), BookTypeCountableConnection)
+
+    # then
+    assert total_count == len(books)
+
+
+def test_get_total_count_cached_reuses_count_of_same_filters(books, settings):
+    # given
+    cache.clear()
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "BookTypeCountableConnection": TotalCountStrategy.CACHED
+    }
+    qs = Book.objects.filter(name__startswith="Book")
+    get_total_count(qs, BookTypeCountableConnection)
+    Book.objects.create(name="Book24")
+
+    # when
+    total_count = get_total_count(qs.order_by("-name"), BookTypeCountableConnection)
+    other_total_count = get_total_count(Book.objects.all(), BookTypeCountableConnection)
+
+    # then
+    assert total_count == len(books)
+    assert other_total_count == len(books) + 1
+
+
+def _get_books_published_at(now):
+    return Book.objects.alias(
+        published_at=Value(now, output_field=DateTimeField())
+    ).filter(published_at__lte=now)
+
+
+def test_get_total_count_cached_reuses_count_of_queries_filtered_by_time(
+    books, settings
+):
+    # given
+    cache.clear()
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "BookTypeCountableConnection": TotalCountStrategy.CACHED
+    }
+    settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = 30
+    now = timezone.now().replace(second=0, microsecond=0)
+    with freeze_time(now):
+        get_total_count(_get_books_published_at(now), BookTypeCountableConnection)
+    Book.objects.create(name="Book24")
+
+    # when
+    later = now + timedelta(seconds=10)
+    with freeze_time(later):
+        total_count = get_total_count(
+            _get_books_published_at(later), BookTypeCountableConnection
+        )
+
+    # then
+    assert total_count == len(books)
+
+
+def test_get_total_count_estimate_counts_small_results_exactly(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "BookTypeCountableConnection": TotalCountStrategy.ESTIMATE
+    }
+
+    # when
+    total_count = get_total_count(Book.objects.all(), BookTypeCountableConnection)
+
+    # then
+    assert total_count == len(books)
+
+
+@mock.patch("saleor.graphql.core.total_count.ESTIMATE_MIN_ROWS", 0)
+@mock.patch("saleor.graphql.core.total_count.get_exact_count")
+def test_get_total_count_estimate_uses_planner_estimate(
+    mocked_get_exact_count, books, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "BookTypeCountableConnection": TotalCountStrategy.ESTIMATE
+    }
+
+    # when
+    total_count = get_total_count(Book.objects.all(), BookTypeCountableConnection)
+
+    # then
+    mocked_get_exact_count.assert_not_called()
+    assert isinstance(total_count, int)
+
+
+def test_get_total_count_estimate_counts_filtered_results_exactly(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "BookTypeCountableConnection": TotalCountStrategy.ESTIMATE
+    }
+    qs = Book.objects.filter(name__startswith="Book1")
+    mocked_get_estimated_count = mock.Mock()
+
+    # when
+    with mock.patch.dict(
+        COUNT_FUNCTIONS, {TotalCountStrategy.ESTIMATE: mocked_get_estimated_count}
+    ):
+        total_count = get_total_count(qs, BookTypeCountableConnection, filtered=True)
+
+    # then
+    mocked_get_estimated_count.assert_not_called()
+    assert total_count == qs.count()
+
+
+def test_get_total_count_unknown_strategy(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {"BookTypeCountableConnection": "fast"}
+
+    # when & then
+    with pytest.raises(ImproperlyConfigured):
+        get_total_count(Book.objects.all(), BookTypeCountableConnection)
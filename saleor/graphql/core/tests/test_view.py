@@ -108,7 +108,7 @@ def test_graphql_view_access_control_header(client, settings):
     response = client.options(API_PATH, HTTP_ORIGIN=origin)
     assert response[ACCESS_CONTROL_ALLOW_ORIGIN] == origin
     assert response[ACCESS_CONTROL_ALLOW_CREDENTIALS] == "true"
-    assert response[ACCESS_CONTROL_ALLOW_METHODS] == "POST, OPTIONS"
+    assert response[ACCESS_CONTROL_ALLOW_METHODS] == "GET, POST, OPTIONS"
     assert (
         response[ACCESS_CONTROL_ALLOW_HEADERS]
         == "Origin, Content-Type, Accept, Authorization, Authorization-Bearer"
@@ -222,10 +222,12 @@ def test_query_is_dict(client):
     assert content["errors"][0]["message"] == "Must provide a query string."
 
 
-def test_graphql_execution_exception(monkeypatch, api_client):
+def test_graphql_execution_exception(monkeypatch, api_client, settings):
     def mocked_execute(*args, **kwargs):
         raise IOError("Spanish inquisition")
 
+    # documents cached by previous tests keep a reference to the original function
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 0
     monkeypatch.setattr("graphql.backend.core.execute_and_validate", mocked_execute)
     response = api_client.post_graphql("{ shop { name }}")
     assert response.status_code == 400
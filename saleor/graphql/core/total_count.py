@@ -0,0 +1,125 @@
+import datetime
+import hashlib
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
+from django.db import connections
+from django.db.models import QuerySet
+
+TOTAL_COUNT_KEY_PREFIX = "graphql-total-count"
+# Planner estimates below this number of rows are replaced with the exact count,
+# as counting them is cheap and the estimates of small results are least accurate.
+ESTIMATE_MIN_ROWS = 1000
+
+
+class TotalCountStrategy:
+    """Ways of resolving `totalCount` of connections."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+    CHOICES = [EXACT, ESTIMATE, CACHED]
+
+
+def get_total_count_strategy(connection_type) -> str:
+    """Return the `totalCount` strategy of the connection type.
+
+    The strategy is taken from `GRAPHQL_TOTAL_COUNT_STRATEGIES` setting, falling
+    back to the `total_count_strategy` of the connection type.
+    """
+    strategy = settings.GRAPHQL_TOTAL_COUNT_STRATEGIES.get(
+        connection_type._meta.name,
+        getattr(connection_type, "total_count_strategy", TotalCountStrategy.EXACT),
+    )
+    if strategy not in TotalCountStrategy.CHOICES:
+        raise ImproperlyConfigured(
+            f"Unknown totalCount strategy {strategy!r} of "
+            f"{connection_type._meta.name}."
+        )
+    return strategy
+
+
+def _get_count_query(qs: QuerySet) -> Optional[Tuple[str, tuple]]:
+    """Return SQL and params of the queryset, or None if it's known to be empty."""
+    try:
+        return qs.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+
+
+def get_exact_count(qs: QuerySet) -> int:
+    return qs.count()
+
+
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows estimated by the query planner.
+
+    Estimates are accurate for unfiltered and lightly filtered querysets only, so
+    `get_total_count` doesn't use them for querysets filtered by the client.
+    Small results are counted exactly.
+    """
+    count_query = _get_count_query(qs)
+    if count_query is None:
+        return 0
+    sql, params = count_query
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < ESTIMATE_MIN_ROWS:
+        return get_exact_count(qs)
+    return estimate
+
+
+def _normalize_count_query_param(param, timeout: int):
+    """Round datetimes down to the cache timeout.
+
+    Querysets filtered by the current time, e.g. by publication date, would
+    otherwise never share their counts.
+    """
+    if isinstance(param, datetime.datetime) and timeout:
+        return int(param.timestamp() // timeout)
+    return param
+
+
+def get_cached_count(qs: QuerySet) -> int:
+    """Return the exact count shared by querysets with the same filters.
+
+    Counts are kept for `GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT` seconds, so they may
+    not include the most recent changes.
+    """
+    count_query = _get_count_query(qs)
+    if count_query is None:
+        return 0
+    sql, params = count_query
+    timeout = settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT
+    params = tuple(_normalize_count_query_param(param, timeout) for param in params)
+    query_hash = hashlib.sha256(f"{sql}{params!r}".encode("utf-8")).hexdigest()
+    cache_key = f"{TOTAL_COUNT_KEY_PREFIX}-{query_hash}"
+    total_count = cache.get(cache_key)
+    if total_count is None:
+        total_count = get_exact_count(qs)
+        cache.set(cache_key, total_count, timeout)
+    return total_count
+
+
+COUNT_FUNCTIONS = {
+    TotalCountStrategy.EXACT: get_exact_count,
+    TotalCountStrategy.ESTIMATE: get_estimated_count,
+    TotalCountStrategy.CACHED: get_cached_count,
+}
+
+
+def get_total_count(qs: QuerySet, connection_type, *, filtered: bool = False) -> int:
+    """Return `totalCount` of the connection.
+
+    Querysets filtered or searched by the client are counted exactly instead of
+    estimated.
+    """
+    strategy = get_total_count_strategy(connection_type)
+    if filtered and strategy == TotalCountStrategy.ESTIMATE:
+        strategy = TotalCountStrategy.EXACT
+    return COUNT_FUNCTIONS[strategy](qs)
@@ -1,7 +1,9 @@
 import graphene
+from django.db import transaction
 
 from ...core.permissions import DiscountPermissions
 from ...discount import models
+from ...discount.utils import invalidate_discounts_snapshot
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types import DiscountError, NonNullList
 from .types import Sale, Voucher
@@ -21,6 +23,11 @@ class SaleBulkDelete(ModelBulkDeleteMutation):
         error_type_class = DiscountError
         error_type_field = "discount_errors"
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        queryset.delete()
+        transaction.on_commit(invalidate_discounts_snapshot)
+
 
 class VoucherBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
@@ -3,12 +3,14 @@ from typing import TYPE_CHECKING, Dict, List
 
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ....core.permissions import DiscountPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....discount import DiscountValueType
 from ....discount.error_codes import DiscountErrorCode
 from ....discount.models import SaleChannelListing
+from ....discount.utils import invalidate_discounts_snapshot
 from ....product.tasks import update_products_discounted_prices_of_discount_task
 from ...channel import ChannelContext
 from ...channel.mutations import BaseChannelListingMutation
@@ -120,9 +122,18 @@ class SaleChannelListingUpdate(BaseChannelListingMutation):
     @classmethod
     @traced_atomic_transaction()
     def save(cls, info, sale: "SaleModel", cleaned_input: Dict):
-        cls.add_channels(sale, cleaned_input.get("add_channels", []))
-        cls.remove_channels(sale, cleaned_input.get("remove_channels", []))
-        update_products_discounted_prices_of_discount_task.delay(sale.pk)
+        add_channels = cleaned_input.get("add_channels", [])
+        remove_channels = cleaned_input.get("remove_channels", [])
+        cls.add_channels(sale, add_channels)
+        cls.remove_channels(sale, remove_channels)
+        # Discounted prices change only in the updated channels.
+        channel_ids = [
+            add_channel["channel"].id for add_channel in add_channels
+        ] + list(remove_channels)
+        update_products_discounted_prices_of_discount_task.delay(
+            sale.pk, channel_ids=channel_ids
+        )
+        transaction.on_commit(invalidate_discounts_snapshot)
 
     @classmethod
     def perform_mutation(cls, _root, info, id, input):
@@ -6,7 +6,7 @@ from ....core.permissions import DiscountPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....discount import models
 from ....discount.error_codes import DiscountErrorCode
-from ....discount.utils import fetch_catalogue_info
+from ....discount.utils import fetch_catalogue_info, invalidate_discounts_snapshot
 from ....product.tasks import update_products_discounted_prices_of_discount_task
 from ...channel import ChannelContext
 from ...core.descriptions import ADDED_IN_31
@@ -22,13 +22,18 @@ from .utils import convert_catalogue_info_to_global_ids
 class SaleUpdateDiscountedPriceMixin:
     @classmethod
     def success_response(cls, instance):
-        # Update the "discounted_prices" of the associated, discounted
-        # products (including collections and categories).
-        update_products_discounted_prices_of_discount_task.delay(instance.pk)
+        cls.update_discounted_prices(instance)
+        transaction.on_commit(invalidate_discounts_snapshot)
         return super().success_response(
             ChannelContext(node=instance, channel_slug=None)
         )
 
+    @classmethod
+    def update_discounted_prices(cls, instance):
+        # Update the "discounted_prices" of the associated, discounted
+        # products (including collections and categories).
+        update_products_discounted_prices_of_discount_task.delay(instance.pk)
+
 
 class SaleInput(graphene.InputObjectType):
     name = graphene.String(description="Voucher name.")
@@ -2,7 +2,7 @@ from django.db import transaction
 
 from ....core.permissions import DiscountPermissions
 from ....core.tracing import traced_atomic_transaction
-from ....discount.utils import fetch_catalogue_info
+from ....discount.utils import fetch_catalogue_info, invalidate_discounts_snapshot
 from ....graphql.channel import ChannelContext
 from ...core.types import DiscountError
 from ..types import Sale
@@ -27,6 +27,7 @@ class SaleRemoveCatalogues(SaleBaseCatalogueMutation):
         cls.remove_catalogues_from_node(sale, data.get("input"))
         current_catalogue = fetch_catalogue_info(sale)
 
+        transaction.on_commit(invalidate_discounts_snapshot)
         transaction.on_commit(
             lambda: info.context.plugins.sale_updated(
                 sale,
@@ -4,7 +4,8 @@ from django.db import transaction
 from ....core.permissions import DiscountPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....discount import models
-from ....discount.utils import fetch_catalogue_info
+from ....discount.utils import CatalogueInfo, fetch_catalogue_info
+from ....product.tasks import update_products_discounted_prices_of_catalogues_task
 from ...core.mutations import ModelMutation
 from ...core.types import DiscountError
 from ..types import Sale
@@ -27,6 +28,32 @@ class SaleUpdate(SaleUpdateDiscountedPriceMixin, ModelMutation):
         error_type_class = DiscountError
         error_type_field = "discount_errors"
 
+    # Fields of the sale that change discounts of all its products
+    DISCOUNT_FIELDS = ["type", "start_date", "end_date"]
+
+    @classmethod
+    def update_discounted_prices(cls, instance):
+        # Called on success, the prices are updated by `perform_mutation`, once
+        # changes of the sale are known.
+        pass
+
+    @classmethod
+    def update_discounted_prices_of_catalogue_changes(
+        cls, previous_catalogue: CatalogueInfo, current_catalogue: CatalogueInfo
+    ):
+        """Update discounted prices of products added to or removed from the sale."""
+        changes = {
+            field: list(previous_catalogue[field] ^ current_catalogue[field])
+            for field in ["products", "categories", "collections", "variants"]
+        }
+        if any(changes.values()):
+            update_products_discounted_prices_of_catalogues_task.delay(
+                product_ids=changes["products"],
+                category_ids=changes["categories"],
+                collection_ids=changes["collections"],
+                variant_ids=changes["variants"],
+            )
+
     @classmethod
     @traced_atomic_transaction()
     def perform_mutation(cls, _root, info, **data):
@@ -35,6 +62,16 @@ class SaleUpdate(SaleUpdateDiscountedPriceMixin, ModelMutation):
         previous_catalogue = fetch_catalogue_info(instance)
         response = super().perform_mutation(_root, info, **data)
         current_catalogue = fetch_catalogue_info(instance)
+        sale = response.sale.node
+        if data["input"].get("value") is not None or any(
+            getattr(instance, field) != getattr(sale, field)
+            for field in cls.DISCOUNT_FIELDS
+        ):
+            super().update_discounted_prices(sale)
+        else:
+            cls.update_discounted_prices_of_catalogue_changes(
+                previous_catalogue, current_catalogue
+            )
         transaction.on_commit(
             lambda: info.context.plugins.sale_updated(
                 instance,
@@ -77,7 +77,7 @@ def test_sale_channel_listing_create_as_staff_user(
         == channel_PLN.slug
     )
     mock_update_discounted_prices_of_discount_task.delay.assert_called_once_with(
-        sale.pk,
+        sale.pk, channel_ids=[channel_PLN.id]
     )
 
 
@@ -124,7 +124,7 @@ def test_sale_channel_listing_update_as_staff_user(
 
     assert shipping_method_data["channelListings"][0]["discountValue"] == discounted
     mock_update_discounted_prices_of_discount_task.delay.assert_called_once_with(
-        sale.pk,
+        sale.pk, channel_ids=[channel_USD.id]
     )
 
 
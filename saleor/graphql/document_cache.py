@@ -0,0 +1,167 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLDocument
+from graphql.error import GraphQLError
+from graphql.validation import validate
+
+from .. import __version__ as saleor_version
+from .core.validators.query_cost import validate_query_cost
+
+# Maximum number of distinct variable sets for which the query cost is remembered
+# per single document.
+MAX_COSTS_PER_DOCUMENT = 100
+
+# Timeout of the entries stored in the shared (django cache) tier.
+SHARED_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def hash_variables(variables: Optional[Dict[str, Any]]) -> str:
+    raw_variables = json.dumps(variables or {}, sort_keys=True, default=str)
+    return hashlib.sha256(raw_variables.encode("utf-8")).hexdigest()
+
+
+class CachedDocument:
+    """Parsed GraphQL document with the results of its validation."""
+
+    def __init__(self, document: GraphQLDocument):
+        self.document = document
+        self.validated = False
+        self.validation_errors: Optional[List[GraphQLError]] = None
+        self.costs: "OrderedDict[str, Tuple[int, Optional[List[GraphQLError]]]]" = (
+            OrderedDict()
+        )
+
+
+class DocumentCache:
+    """Bounded LRU cache of parsed and validated GraphQL documents.
+
+    Documents are stored in process memory. When `GRAPHQL_DOCUMENT_CACHE_SHARED`
+    is enabled, successful validation and query costs are also stored in the django
+    cache, so freshly started workers don't need to validate known queries again.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self._max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, str], CachedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+
+    @property
+    def use_shared_cache(self) -> bool:
+        return settings.GRAPHQL_DOCUMENT_CACHE_SHARED
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_document(self, backend, schema, query: str) -> GraphQLDocument:
+        """Return the parsed document for the query string.
+
+        Raises the same errors as `backend.document_from_string` when the query
+        cannot be parsed; such queries are never cached.
+        """
+        if not self.max_size:
+            return backend.document_from_string(schema, query)
+
+        key = (id(schema), hash_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.document
+            self.misses += 1
+
+        document = backend.document_from_string(schema, query)
+        with self._lock:
+            self._entries[key] = CachedDocument(document)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return document
+
+    def validate(self, document: GraphQLDocument) -> Optional[List[GraphQLError]]:
+        """Return the schema validation errors of the document."""
+        entry = self._get_entry(document)
+        if entry is not None and entry.validated:
+            return entry.validation_errors
+
+        shared_key = self._get_shared_key(document, "valid")
+        if shared_key and cache.get(shared_key):
+            errors = None
+        else:
+            errors = validate(document.schema, document.document_ast) or None
+            if shared_key and not errors:
+                cache.set(shared_key, True, SHARED_CACHE_TIMEOUT)
+
+        if entry is not None:
+            entry.validation_errors = errors
+            entry.validated = True
+        return errors
+
+    def get_query_cost(
+        self, schema, document: GraphQLDocument, variables, cost_map, maximum_cost
+    ) -> Tuple[int, Optional[List[GraphQLError]]]:
+        """Return the query cost of the document for given variables."""
+        cost_key = f"{maximum_cost}-{hash_variables(variables)}"
+        entry = self._get_entry(document)
+        if entry is not None:
+            with self._lock:
+                if cost_key in entry.costs:
+                    entry.costs.move_to_end(cost_key)
+                    return entry.costs[cost_key]
+
+        shared_key = self._get_shared_key(document, f"cost-{cost_key}")
+        cost_result = cache.get(shared_key) if shared_key else None
+        if cost_result is None:
+            cost_result = validate_query_cost(
+                schema, document, variables, cost_map, maximum_cost
+            )
+            if shared_key and not cost_result[1]:
+                cache.set(shared_key, cost_result, SHARED_CACHE_TIMEOUT)
+
+        if entry is not None:
+            with self._lock:
+                entry.costs[cost_key] = cost_result
+                while len(entry.costs) > MAX_COSTS_PER_DOCUMENT:
+                    entry.costs.popitem(last=False)
+        return cost_result
+
+    def _get_entry(self, document: GraphQLDocument) -> Optional[CachedDocument]:
+        if not self.max_size:
+            return None
+        key = (id(document.schema), hash_query(document.document_string))
+        entry = self._entries.get(key)
+        if entry is not None and entry.document is document:
+            return entry
+        return None
+
+    def _get_shared_key(self, document: GraphQLDocument, suffix: str) -> Optional[str]:
+        if not self.use_shared_cache:
+            return None
+        hashed_query = hash_query(document.document_string)
+        return f"{saleor_version}-document-{hashed_query}-{suffix}"
+
+
+document_cache = DocumentCache()
@@ -12,7 +12,12 @@ from ....core.tracing import traced_atomic_transaction
 from ....core.utils.url import validate_storefront_url
 from ....order import OrderOrigin, OrderStatus, events, models
 from ....order.error_codes import OrderErrorCode
-from ....order.search import update_order_search_vector
+from ....order.search import (
+    ORDER_SEARCH_ADDRESSES_WEIGHT,
+    ORDER_SEARCH_CUSTOMER_WEIGHT,
+    ORDER_SEARCH_LINES_WEIGHT,
+    mark_order_search_vector_as_dirty,
+)
 from ....order.utils import add_variant_to_order, recalculate_order, update_order_prices
 from ...account.i18n import I18nMixin
 from ...account.types import AddressInput
@@ -329,4 +334,9 @@ class DraftOrderCreate(ModelMutation, I18nMixin):
 
         # Post-process the results
         recalculate_order(instance)
-        update_order_search_vector(instance)
+        mark_order_search_vector_as_dirty(
+            instance,
+            ORDER_SEARCH_CUSTOMER_WEIGHT
+            + ORDER_SEARCH_ADDRESSES_WEIGHT
+            + ORDER_SEARCH_LINES_WEIGHT,
+        )
@@ -3,7 +3,10 @@ import graphene
 from ....core.permissions import OrderPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....order import events
-from ....order.search import update_order_search_vector
+from ....order.search import (
+    ORDER_SEARCH_PAYMENTS_WEIGHT,
+    mark_order_search_vector_as_dirty,
+)
 from ....order.utils import remove_order_discount_from_order
 from ...core.types import OrderError
 from ..types import Order
@@ -44,6 +47,6 @@ class OrderDiscountDelete(OrderDiscountCommon):
         order.refresh_from_db()
 
         cls.recalculate_order(order)
-        update_order_search_vector(order)
+        mark_order_search_vector_as_dirty(order, ORDER_SEARCH_PAYMENTS_WEIGHT)
 
         return OrderDiscountDelete(order=order)
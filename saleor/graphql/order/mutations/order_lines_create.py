@@ -9,7 +9,10 @@ from ....core.taxes import TaxError
 from ....core.tracing import traced_atomic_transaction
 from ....order import events
 from ....order.error_codes import OrderErrorCode
-from ....order.search import update_order_search_vector
+from ....order.search import (
+    ORDER_SEARCH_LINES_WEIGHT,
+    mark_order_search_vector_as_dirty,
+)
 from ....order.utils import add_variant_to_order, recalculate_order
 from ...core.mutations import BaseMutation
 from ...core.types import NonNullList, OrderError
@@ -136,7 +139,7 @@ class OrderLinesCreate(EditableOrderValidationMixin, BaseMutation):
         lines = [line for _, line in added_lines]
 
         recalculate_order(order)
-        update_order_search_vector(order)
+        mark_order_search_vector_as_dirty(order, ORDER_SEARCH_LINES_WEIGHT)
 
         func = get_webhook_handler_by_order_status(order.status, info)
         transaction.on_commit(lambda: func(order))
@@ -7,7 +7,11 @@ from ....core.permissions import OrderPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....order import OrderStatus, models
 from ....order.error_codes import OrderErrorCode
-from ....order.search import prepare_order_search_vector_value
+from ....order.search import (
+    ORDER_SEARCH_ADDRESSES_WEIGHT,
+    ORDER_SEARCH_CUSTOMER_WEIGHT,
+    mark_order_search_vector_as_dirty,
+)
 from ....order.utils import update_order_prices
 from ...account.types import AddressInput
 from ...core.types import OrderError
@@ -70,8 +74,10 @@ class OrderUpdate(DraftOrderCreate):
         if instance.user_email:
             user = User.objects.filter(email=instance.user_email).first()
             instance.user = user
-        instance.search_vector = prepare_order_search_vector_value(instance)
         instance.save()
+        mark_order_search_vector_as_dirty(
+            instance, ORDER_SEARCH_CUSTOMER_WEIGHT + ORDER_SEARCH_ADDRESSES_WEIGHT
+        )
         update_order_prices(
             instance,
             info.context.plugins,
@@ -0,0 +1,66 @@
+"""Automatic persisted queries.
+
+Implements the Apollo APQ protocol: a client may send only the SHA-256 hash of
+a query in the `persistedQuery` extension. When the hash is unknown, the server
+responds with `PersistedQueryNotFound` and the client retries with both the hash
+and the full query, which is then stored for subsequent requests.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from .document_cache import hash_query
+
+PERSISTED_QUERY_VERSION = 1
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_SUPPORTED = "PersistedQueryNotSupported"
+
+
+def generate_persisted_query_cache_key(query_hash: str) -> str:
+    return f"persisted-query-{query_hash}"
+
+
+def resolve_persisted_query(
+    query: Optional[str], extensions: Optional[Dict[str, Any]]
+) -> Tuple[Optional[str], Optional[GraphQLError]]:
+    """Return the query string to execute for the given request.
+
+    When the request doesn't use persisted queries, the given query is returned
+    unchanged.
+    """
+    persisted_query = (
+        extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    )
+    if not persisted_query:
+        return query, None
+
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        return None, GraphQLError(
+            PERSISTED_QUERY_NOT_SUPPORTED,
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+    query_hash = persisted_query.get("sha256Hash")
+    if (
+        persisted_query.get("version") != PERSISTED_QUERY_VERSION
+        or not query_hash
+        or not isinstance(query_hash, str)
+    ):
+        return None, GraphQLError("Unsupported persisted query.")
+
+    cache_key = generate_persisted_query_cache_key(query_hash)
+    if query:
+        if not isinstance(query, str) or hash_query(query) != query_hash:
+            return None, GraphQLError("Provided sha256Hash does not match query.")
+        cache.set(cache_key, query, settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT)
+        return query, None
+
+    query = cache.get(cache_key)
+    if query is None:
+        return None, GraphQLError(
+            PERSISTED_QUERY_NOT_FOUND, extensions={"code": "PERSISTED_QUERY_NOT_FOUND"}
+        )
+    return query, None
@@ -18,10 +18,7 @@ from ....order import models as order_models
 from ....order.tasks import recalculate_orders_task
 from ....product import models
 from ....product.error_codes import ProductErrorCode
-from ....product.search import (
-    prepare_product_search_vector_value,
-    update_product_search_vector,
-)
+from ....product.search import mark_products_search_vector_as_dirty
 from ....product.tasks import update_product_discounted_price_task
 from ....product.utils import delete_categories
 from ....product.utils.variants import generate_and_set_variant_name
@@ -556,7 +553,7 @@ class ProductVariantBulkCreate(BaseMutation):
             ChannelContext(node=instance, channel_slug=None) for instance in instances
         ]
 
-        update_product_search_vector(product)
+        mark_products_search_vector_as_dirty([product.pk])
 
         transaction.on_commit(
             lambda: [
@@ -638,20 +635,15 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
         if order_pks:
             recalculate_orders_task.delay(list(order_pks))
 
+        mark_products_search_vector_as_dirty(product_pks)
+
         # set new product default variant if any has been removed
         products = models.Product.objects.filter(
             pk__in=product_pks, default_variant__isnull=True
         )
         for product in products:
-            product.search_vector = prepare_product_search_vector_value(product)
             product.default_variant = product.variants.first()
-            product.save(
-                update_fields=[
-                    "default_variant",
-                    "search_vector",
-                    "updated_at",
-                ]
-            )
+            product.save(update_fields=["default_variant", "updated_at"])
 
         return response
 
@@ -32,6 +32,7 @@ from .products import (
     ProductVariantChannelListingByIdLoader,
     ProductVariantsByProductIdAndChannel,
     ProductVariantsByProductIdLoader,
+    TaxedPriceByProductPriceCountryAndChannelSlugLoader,
     VariantChannelListingByVariantIdAndChannelIdLoader,
     VariantChannelListingByVariantIdAndChannelSlugLoader,
     VariantChannelListingByVariantIdLoader,
@@ -67,6 +68,7 @@ __all__ = [
     "MediaByProductVariantIdLoader",
     "SelectedAttributesByProductIdLoader",
     "SelectedAttributesByProductVariantIdLoader",
+    "TaxedPriceByProductPriceCountryAndChannelSlugLoader",
     "VariantAttributesByProductTypeIdLoader",
     "VariantChannelListingByVariantIdAndChannelSlugLoader",
     "VariantChannelListingByVariantIdAndChannelIdLoader",
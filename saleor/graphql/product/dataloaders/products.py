@@ -1,7 +1,10 @@
 from collections import defaultdict
+from decimal import Decimal
 from typing import DefaultDict, Dict, Iterable, List, Optional, Tuple
 
 from django.db.models import F
+from django_countries.fields import Country
+from prices import Money, TaxedMoney
 
 from ....product import ProductMediaTypes
 from ....product.models import (
@@ -21,6 +24,8 @@ from ...core.dataloaders import DataLoader
 
 ProductIdAndChannelSlug = Tuple[int, str]
 VariantIdAndChannelSlug = Tuple[int, str]
+# Product ID, price amount, currency, country code and channel slug.
+ProductPriceCountryAndChannelSlug = Tuple[int, Decimal, str, str, str]
 
 
 class CategoryByIdLoader(DataLoader):
@@ -394,6 +399,48 @@ class VariantsChannelListingByProductIdAndChannelSlugLoader(
         ]
 
 
+class TaxedPriceByProductPriceCountryAndChannelSlugLoader(
+    DataLoader[ProductPriceCountryAndChannelSlug, TaxedMoney]
+):
+    """Apply taxes to the product prices resolved in the request.
+
+    Prices of all products are passed to the plugins with a single call per
+    channel, so tax plugins can handle them in a batch.
+    """
+
+    context_key = "taxedprice_by_product_price_country_and_channel"
+
+    def batch_load(self, keys):
+        def with_products(products):
+            keys_by_channel: DefaultDict[str, List[int]] = defaultdict(list)
+            for index, (*_, channel_slug) in enumerate(keys):
+                keys_by_channel[channel_slug].append(index)
+
+            taxed_prices: List[Optional[TaxedMoney]] = [None] * len(keys)
+            for channel_slug, indexes in keys_by_channel.items():
+                items = []
+                for index in indexes:
+                    _, amount, currency, country_code, _ = keys[index]
+                    items.append(
+                        (
+                            products[index],
+                            Money(amount, currency),
+                            Country(country_code),
+                        )
+                    )
+                channel_taxed_prices = self.context.plugins.apply_taxes_to_products(
+                    items, channel_slug=channel_slug
+                )
+                for index, taxed_price in zip(indexes, channel_taxed_prices):
+                    taxed_prices[index] = taxed_price
+            return taxed_prices
+
+        product_ids = [product_id for product_id, *_ in keys]
+        return (
+            ProductByIdLoader(self.context).load_many(product_ids).then(with_products)
+        )
+
+
 class ProductMediaByIdLoader(DataLoader):
     context_key = "product_media_by_id"
 
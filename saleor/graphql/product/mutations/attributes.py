@@ -11,7 +11,7 @@ from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
 from ....product import models
 from ....product.error_codes import ProductErrorCode
-from ....product.search import update_products_search_vector
+from ....product.search import mark_products_search_vector_as_dirty
 from ...attribute.mutations import (
     BaseReorderAttributesMutation,
     BaseReorderAttributeValuesMutation,
@@ -346,7 +346,9 @@ class ProductAttributeUnassign(BaseMutation):
         cls.save_field_values(product_type, "product_attributes", attribute_pks)
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
 
-        update_products_search_vector(product_type.products.all())
+        mark_products_search_vector_as_dirty(
+            product_type.products.values_list("id", flat=True)
+        )
 
         return cls(product_type=product_type)
 
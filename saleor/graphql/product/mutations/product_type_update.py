@@ -2,7 +2,7 @@ import graphene
 
 from ....core.permissions import ProductTypePermissions
 from ....product import models
-from ....product.search import update_products_search_vector
+from ....product.search import mark_products_search_vector_as_dirty
 from ....product.tasks import update_variants_names
 from ...core.types import ProductError
 from ..types import ProductType
@@ -44,4 +44,4 @@ class ProductTypeUpdate(ProductTypeCreate):
             or "variant_attributes" in cleaned_input
         ):
             products = models.Product.objects.filter(product_type=instance)
-            update_products_search_vector(products)
+            mark_products_search_vector_as_dirty(products.values_list("id", flat=True))
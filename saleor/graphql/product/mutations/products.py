@@ -25,7 +25,7 @@ from ....order import models as order_models
 from ....order.tasks import recalculate_orders_task
 from ....product import ProductMediaTypes, models
 from ....product.error_codes import CollectionErrorCode, ProductErrorCode
-from ....product.search import update_product_search_vector
+from ....product.search import mark_products_search_vector_as_dirty
 from ....product.tasks import (
     update_product_discounted_price_task,
     update_products_discounted_prices_of_catalogues_task,
@@ -676,7 +676,7 @@ class ProductCreate(ModelMutation):
     @classmethod
     def post_save_action(cls, info, instance, _cleaned_input):
         product = models.Product.objects.prefetched_for_webhook().get(pk=instance.pk)
-        update_product_search_vector(instance)
+        mark_products_search_vector_as_dirty([instance.pk])
         info.context.plugins.product_created(product)
 
     @classmethod
@@ -729,7 +729,7 @@ class ProductUpdate(ProductCreate):
     @classmethod
     def post_save_action(cls, info, instance, _cleaned_input):
         product = models.Product.objects.prefetched_for_webhook().get(pk=instance.pk)
-        update_product_search_vector(instance)
+        mark_products_search_vector_as_dirty([instance.pk])
         info.context.plugins.product_updated(product)
 
 
@@ -1057,7 +1057,7 @@ class ProductVariantCreate(ModelMutation):
             AttributeAssignmentMixin.save(instance, attributes)
 
         generate_and_set_variant_name(instance, cleaned_input.get("sku"))
-        update_product_search_vector(instance.product)
+        mark_products_search_vector_as_dirty([instance.product_id])
         event_to_call = (
             info.context.plugins.product_variant_created
             if new_variant
@@ -1153,7 +1153,7 @@ class ProductVariantDelete(ModelDeleteMutation):
         # Update the "discounted_prices" of the parent product
         update_product_discounted_price_task.delay(instance.product_id)
         product = models.Product.objects.get(id=instance.product_id)
-        update_product_search_vector(product)
+        mark_products_search_vector_as_dirty([product.pk])
         # if the product default variant has been removed set the new one
         if not product.default_variant:
             product.default_variant = product.variants.first()
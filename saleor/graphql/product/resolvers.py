@@ -8,6 +8,10 @@ from ...order import OrderStatus
 from ...order.models import Order
 from ...product import models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
+from ...product.search import (
+    get_product_search_term_suggestions,
+    search_product_suggestions,
+)
 from ..channel import ChannelQsContext
 from ..core.utils import from_global_id_or_error
 from ..utils import get_user_or_app_from_context
@@ -98,6 +102,18 @@ def resolve_products(info, requestor, channel_slug=None) -> ChannelQsContext:
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
 
 
+@traced_resolver
+def resolve_product_suggestions(info, requestor, search, channel_slug, limit):
+    qs = resolve_products(info, requestor, channel_slug=channel_slug).qs
+    terms = []
+    if channel_slug:
+        terms = get_product_search_term_suggestions(channel_slug, search, limit)
+    return {
+        "terms": terms,
+        "products": search_product_suggestions(qs, search, limit),
+    }
+
+
 @traced_resolver
 def resolve_variant_by_id(
     _info, id, *, channel_slug, requestor, requestor_has_access_to_all
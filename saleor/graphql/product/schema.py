@@ -9,6 +9,7 @@ from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..channel import ChannelContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.descriptions import ADDED_IN_35, PREVIEW_FEATURE
 from ..core.enums import ReportingPeriod
 from ..core.fields import ConnectionField, FilterConnectionField, PermissionsField
 from ..core.types import NonNullList
@@ -97,6 +98,7 @@ from .resolvers import (
     resolve_digital_contents,
     resolve_product_by_id,
     resolve_product_by_slug,
+    resolve_product_suggestions,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variant_by_sku,
@@ -122,12 +124,16 @@ from .types import (
     DigitalContentCountableConnection,
     Product,
     ProductCountableConnection,
+    ProductSuggestions,
     ProductType,
     ProductTypeCountableConnection,
     ProductVariant,
     ProductVariantCountableConnection,
 )
 
+PRODUCT_SUGGESTIONS_DEFAULT_LIMIT = 10
+PRODUCT_SUGGESTIONS_MAX_LIMIT = 50
+
 
 def search_string_in_kwargs(kwargs: dict) -> bool:
     return bool(kwargs.get("filter", {}).get("search", "").strip())
@@ -229,6 +235,28 @@ class ProductQueries(graphene.ObjectType):
             f"{', '.join([p.name for p in ALL_PRODUCTS_PERMISSIONS])}."
         ),
     )
+    product_suggestions = graphene.Field(
+        ProductSuggestions,
+        search=graphene.Argument(
+            graphene.String, description="Search phrase being typed.", required=True
+        ),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        first=graphene.Argument(
+            graphene.Int,
+            description=(
+                "Number of suggestions to return, at most "
+                f"{PRODUCT_SUGGESTIONS_MAX_LIMIT}. "
+                f"Defaults to {PRODUCT_SUGGESTIONS_DEFAULT_LIMIT}."
+            ),
+        ),
+        description=(
+            "Look up suggestions of products and words for a search phrase being "
+            "typed, e.g. in a search box. Every term of the phrase is matched as "
+            "a word prefix." + ADDED_IN_35 + PREVIEW_FEATURE
+        ),
+    )
     product_type = graphene.Field(
         ProductType,
         id=graphene.Argument(
@@ -419,6 +447,26 @@ class ProductQueries(graphene.ObjectType):
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, ProductCountableConnection)
 
+    @staticmethod
+    @traced_resolver
+    def resolve_product_suggestions(
+        _root, info: graphene.ResolveInfo, *, search, channel=None, first=None
+    ):
+        if first is None:
+            first = PRODUCT_SUGGESTIONS_DEFAULT_LIMIT
+        if not 0 < first <= PRODUCT_SUGGESTIONS_MAX_LIMIT:
+            raise GraphQLError(
+                "The `first` argument should be between 1 and "
+                f"{PRODUCT_SUGGESTIONS_MAX_LIMIT}."
+            )
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error()
+        return resolve_product_suggestions(info, requestor, search, channel, first)
+
     @staticmethod
     def resolve_product_type(_root, _info: graphene.ResolveInfo, *, id):
         _, id = from_global_id_or_error(id, ProductType)
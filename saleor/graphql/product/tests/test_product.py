@@ -46,7 +46,6 @@ from ....product.models import (
 from ....product.search import prepare_product_search_vector_value
 from ....product.tasks import update_variants_names
 from ....product.tests.utils import create_image, create_pdf_file_with_image_ext
-from ....product.utils.availability import get_variant_availability
 from ....product.utils.costs import get_product_costs_data
 from ....tests.utils import dummy_editorjs, flush_post_commit_hooks
 from ....warehouse.models import Allocation, Stock, Warehouse
@@ -61,7 +60,7 @@ from ...tests.utils import (
 )
 from ..bulk_mutations.products import ProductVariantStocksUpdate
 from ..enums import VariantAttributeScope
-from ..utils import create_stocks
+from ..utils import create_stocks, load_variant_availability
 
 
 @pytest.fixture
@@ -3367,6 +3366,8 @@ def test_products_query_with_filter_stock_availability_as_staff(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
@@ -3397,6 +3398,8 @@ def test_products_query_with_filter_stock_availability_as_user(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
@@ -6920,6 +6923,8 @@ def test_update_and_search_product_by_description(
     assert data["product"]["name"] == product_name
     assert data["product"]["slug"] == product_slug
     assert data["product"]["description"] == other_description_json
+    product.refresh_from_db()
+    assert product.search_index_dirty
 
 
 def test_update_product_without_description_clear_description_plaintext(
@@ -10534,11 +10539,11 @@ QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS = """
 
 
 @mock.patch(
-    "saleor.graphql.product.types.products.get_variant_availability",
-    wraps=get_variant_availability,
+    "saleor.graphql.product.types.products.load_variant_availability",
+    wraps=load_variant_availability,
 )
 def test_product_variant_price_no_address(
-    mock_get_variant_availability, user_api_client, variant, stock, channel_USD
+    mock_load_variant_availability, user_api_client, variant, stock, channel_USD
 ):
     channel_USD.default_country = "FR"
     channel_USD.save()
@@ -10548,7 +10553,7 @@ def test_product_variant_price_no_address(
         QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS, variables
     )
     assert (
-        mock_get_variant_availability.call_args[1]["country"]
+        mock_load_variant_availability.call_args[1]["country_code"]
         == channel_USD.default_country
     )
 
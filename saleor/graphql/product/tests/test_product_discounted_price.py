@@ -267,6 +267,60 @@ def test_sale_update_updates_products_discounted_prices(
     )
 
 
+@patch(
+    "saleor.graphql.discount.mutations.sale_update"
+    ".update_products_discounted_prices_of_catalogues_task"
+)
+@patch(
+    "saleor.graphql.discount.mutations.sale_create"
+    ".update_products_discounted_prices_of_discount_task"
+)
+def test_sale_update_catalogue_updates_only_changed_products_discounted_prices(
+    mock_update_products_discounted_prices_of_discount,
+    mock_update_products_discounted_prices_of_catalogues,
+    staff_api_client,
+    sale,
+    product,
+    product_with_two_variants,
+    permission_manage_discounts,
+):
+    query = """
+    mutation SaleUpdate($id: ID!, $products: [ID!]) {
+        saleUpdate(id: $id, input: {products: $products}) {
+            sale {
+                id
+            }
+            errors {
+                field
+                message
+            }
+        }
+    }
+    """
+    variables = {
+        "id": to_global_id("Sale", sale.pk),
+        "products": [
+            to_global_id("Product", product.pk),
+            to_global_id("Product", product_with_two_variants.pk),
+        ],
+    }
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_discounts]
+    )
+    assert response.status_code == 200
+
+    content = get_graphql_content(response)
+    assert content["data"]["saleUpdate"]["errors"] == []
+
+    mock_update_products_discounted_prices_of_discount.delay.assert_not_called()
+    mock_update_products_discounted_prices_of_catalogues.delay.assert_called_once_with(
+        product_ids=[product_with_two_variants.pk],
+        category_ids=[],
+        collection_ids=[],
+        variant_ids=[],
+    )
+
+
 @patch(
     "saleor.graphql.discount.mutations.sale_create"
     ".update_products_discounted_prices_of_discount_task"
@@ -0,0 +1,71 @@
+import graphene
+
+from ....product.models import Product
+from ....product.search import update_product_search_terms
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_PRODUCT_SUGGESTIONS = """
+    query ($search: String!, $channel: String, $first: Int) {
+        productSuggestions(search: $search, channel: $channel, first: $first) {
+            terms
+            products {
+                id
+                name
+                slug
+            }
+        }
+    }
+"""
+
+
+def test_product_suggestions(api_client, product_list, channel_USD):
+    # given
+    update_product_search_terms(Product.objects.all(), channel_USD.slug)
+    variables = {"search": "big bl", "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productSuggestions"]
+    product = product_list[0]
+    assert data["terms"] == ["blue"]
+    assert data["products"] == [
+        {
+            "id": graphene.Node.to_global_id("Product", product.pk),
+            "name": product.name,
+            "slug": product.slug,
+        }
+    ]
+
+
+def test_product_suggestions_skips_not_visible_products(
+    api_client, product_list, channel_USD
+):
+    # given
+    product_list[0].channel_listings.update(visible_in_listings=False)
+    variables = {"search": "big", "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    products = content["data"]["productSuggestions"]["products"]
+    assert [product["name"] for product in products] == [product_list[1].name]
+
+
+def test_product_suggestions_first_above_limit(api_client, channel_USD):
+    # given
+    variables = {"search": "big", "channel": channel_USD.slug, "first": 51}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert (
+        content["errors"][0]["message"]
+        == "The `first` argument should be between 1 and 50."
+    )
@@ -164,9 +164,12 @@ UPDATE_PRODUCT_TYPE_SLUG_MUTATION = """
         (None, "", "Slug value cannot be blank."),
     ],
 )
-@patch("saleor.product.search.update_products_search_vector")
+@patch(
+    "saleor.graphql.product.mutations.product_type_update."
+    "mark_products_search_vector_as_dirty"
+)
 def test_update_product_type_slug(
-    update_products_search_vector_mock,
+    mark_products_search_vector_as_dirty_mock,
     staff_api_client,
     product_type,
     permission_manage_product_types_and_attributes,
@@ -190,7 +193,7 @@ def test_update_product_type_slug(
     if not error_message:
         assert not errors
         assert data["productType"]["slug"] == expected_slug
-        update_products_search_vector_mock.assert_not_called()
+        mark_products_search_vector_as_dirty_mock.assert_not_called()
     else:
         assert errors
         assert errors[0]["field"] == "slug"
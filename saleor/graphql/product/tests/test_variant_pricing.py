@@ -111,7 +111,9 @@ def test_variant_pricing(
 ):
     taxed_price = TaxedMoney(Money("10.0", "USD"), Money("12.30", "USD"))
     monkeypatch.setattr(
-        PluginsManager, "apply_taxes_to_product", Mock(return_value=taxed_price)
+        PluginsManager,
+        "apply_taxes_to_products",
+        Mock(side_effect=lambda prices, **_: [taxed_price] * len(prices)),
     )
 
     product = variant.product
@@ -168,3 +170,51 @@ def test_variant_pricing(
     assert pricing.price.tax.amount
     assert pricing.price_undiscounted.tax.amount
     assert pricing.price_undiscounted.tax.amount
+
+
+QUERY_GET_PRODUCTS_PRICE_RANGE = """
+query ($channel: String) {
+  products(first: 10, channel: $channel) {
+    edges {
+      node {
+        pricing {
+          priceRange {
+            start {
+              net {
+                amount
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def test_products_pricing_applies_taxes_in_single_plugins_call(
+    api_client, product_list, channel_USD, monkeypatch
+):
+    # given
+    mocked_apply_taxes_to_products = Mock(
+        side_effect=lambda items, **_: [
+            TaxedMoney(net=price, gross=price) for _, price, _ in items
+        ]
+    )
+    monkeypatch.setattr(
+        PluginsManager, "apply_taxes_to_products", mocked_apply_taxes_to_products
+    )
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_GET_PRODUCTS_PRICE_RANGE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["products"]["edges"]
+    assert len(edges) == len(product_list)
+    assert all(edge["node"]["pricing"]["priceRange"] for edge in edges)
+    mocked_apply_taxes_to_products.assert_called_once()
+    items = mocked_apply_taxes_to_products.call_args.args[0]
+    assert {product for product, _, _ in items} == set(product_list)
@@ -12,6 +12,7 @@ from .products import (
     Product,
     ProductCountableConnection,
     ProductMedia,
+    ProductSuggestions,
     ProductType,
     ProductTypeCountableConnection,
     ProductVariant,
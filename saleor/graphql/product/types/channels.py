@@ -1,14 +1,12 @@
 from dataclasses import asdict
 
 import graphene
-from django_countries.fields import Country
 
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_resolver
 from ....core.utils import get_currency_for_country
 from ....graphql.core.types import Money, MoneyRange
 from ....product import models
-from ....product.utils.availability import get_product_availability
 from ....product.utils.costs import (
     get_margin_for_variant_channel_listing,
     get_product_costs_data,
@@ -32,6 +30,7 @@ from ..dataloaders import (
     VariantChannelListingByVariantIdAndChannelSlugLoader,
     VariantsChannelListingByProductIdAndChannelSlugLoader,
 )
+from ..utils import load_product_availability
 
 
 class Margin(graphene.ObjectType):
@@ -214,7 +213,10 @@ class ProductChannelListing(ModelObjectType):
                                 local_currency = None
                                 local_currency = get_currency_for_country(country_code)
 
-                                availability = get_product_availability(
+                                from .products import ProductPricingInfo
+
+                                return load_product_availability(
+                                    context,
                                     product=product,
                                     product_channel_listing=root,
                                     variants=variants,
@@ -222,13 +224,13 @@ class ProductChannelListing(ModelObjectType):
                                     collections=collections,
                                     discounts=discounts,
                                     channel=channel,
-                                    manager=context.plugins,
-                                    country=Country(country_code),
+                                    country_code=country_code,
                                     local_currency=local_currency,
+                                ).then(
+                                    lambda availability: ProductPricingInfo(
+                                        **asdict(availability)
+                                    )
                                 )
-                                from .products import ProductPricingInfo
-
-                                return ProductPricingInfo(**asdict(availability))
 
                             return (
                                 CollectionsByProductIdLoader(context)
@@ -4,7 +4,6 @@ from dataclasses import asdict
 from typing import List, Optional
 
 import graphene
-from django_countries.fields import Country
 from graphene import relay
 
 from ....attribute import models as attribute_models
@@ -21,10 +20,6 @@ from ....product import models
 from ....product.models import ALL_PRODUCTS_PERMISSIONS
 from ....product.product_images import get_product_image_thumbnail, get_thumbnail
 from ....product.utils import calculate_revenue_for_variant
-from ....product.utils.availability import (
-    get_product_availability,
-    get_variant_availability,
-)
 from ....product.utils.variants import get_variant_selection_attributes
 from ....warehouse.reservations import is_reservation_enabled
 from ...account import types as account_types
@@ -48,6 +43,7 @@ from ...core.connection import (
 )
 from ...core.descriptions import (
     ADDED_IN_31,
+    ADDED_IN_35,
     DEPRECATED_IN_3X_FIELD,
     DEPRECATED_IN_3X_INPUT,
     PREVIEW_FEATURE,
@@ -124,6 +120,7 @@ from ..enums import ProductMediaType, ProductTypeKindEnum, VariantAttributeScope
 from ..filters import ProductFilterInput
 from ..resolvers import resolve_product_variants, resolve_products
 from ..sorters import ProductOrder
+from ..utils import load_product_availability, load_variant_availability
 from .channels import (
     CollectionChannelListing,
     ProductChannelListing,
@@ -576,7 +573,8 @@ class ProductVariant(ChannelContextTypeWithMetadata, ModelObjectType):
                                 local_currency = None
                                 local_currency = get_currency_for_country(country_code)
 
-                                availability = get_variant_availability(
+                                return load_variant_availability(
+                                    context,
                                     variant=root.node,
                                     variant_channel_listing=variant_channel_listing,
                                     product=product,
@@ -584,11 +582,13 @@ class ProductVariant(ChannelContextTypeWithMetadata, ModelObjectType):
                                     collections=collections,
                                     discounts=discounts,
                                     channel=channel,
-                                    country=Country(country_code),
+                                    country_code=country_code,
                                     local_currency=local_currency,
-                                    plugins=context.plugins,
+                                ).then(
+                                    lambda availability: VariantPricingInfo(
+                                        **asdict(availability)
+                                    )
                                 )
-                                return VariantPricingInfo(**asdict(availability))
 
                             return collections.then(calculate_pricing_with_collections)
 
@@ -970,7 +970,8 @@ class Product(ChannelContextTypeWithMetadata, ModelObjectType):
                                 )
                                 local_currency = get_currency_for_country(country_code)
 
-                                availability = get_product_availability(
+                                return load_product_availability(
+                                    context,
                                     product=root.node,
                                     product_channel_listing=product_channel_listing,
                                     variants=variants,
@@ -978,11 +979,13 @@ class Product(ChannelContextTypeWithMetadata, ModelObjectType):
                                     collections=collections,
                                     discounts=discounts,
                                     channel=channel,
-                                    manager=context.plugins,
-                                    country=Country(country_code),
+                                    country_code=country_code,
                                     local_currency=local_currency,
+                                ).then(
+                                    lambda availability: ProductPricingInfo(
+                                        **asdict(availability)
+                                    )
                                 )
-                                return ProductPricingInfo(**asdict(availability))
 
                             return collections.then(calculate_pricing_with_collections)
 
@@ -1258,6 +1261,43 @@ class ProductCountableConnection(CountableConnection):
         node = Product
 
 
+class ProductSuggestion(graphene.ObjectType):
+    id = graphene.ID(required=True, description="ID of the product.")
+    name = graphene.String(required=True, description="Name of the product.")
+    slug = graphene.String(required=True, description="Slug of the product.")
+
+    class Meta:
+        description = (
+            "Represents a product suggested for a search phrase."
+            + ADDED_IN_35
+            + PREVIEW_FEATURE
+        )
+
+    @staticmethod
+    def resolve_id(root, _info):
+        return graphene.Node.to_global_id("Product", root["id"])
+
+
+class ProductSuggestions(graphene.ObjectType):
+    terms = NonNullList(
+        graphene.String,
+        required=True,
+        description="Common words completing the last term of the search phrase.",
+    )
+    products = NonNullList(
+        ProductSuggestion,
+        required=True,
+        description="Products best matching the search phrase.",
+    )
+
+    class Meta:
+        description = (
+            "Represents suggestions for a search phrase being typed."
+            + ADDED_IN_35
+            + PREVIEW_FEATURE
+        )
+
+
 @federated_entity("id")
 class ProductType(ModelObjectType):
     id = graphene.GlobalID(required=True)
@@ -5,17 +5,36 @@ import graphene
 from django.core.exceptions import ValidationError
 from django.db import DatabaseError, transaction
 from django.db.utils import IntegrityError
+from prices import TaxedMoneyRange
+from promise import Promise
 
 from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
+from ...product.utils.availability import (
+    ProductAvailability,
+    VariantAvailability,
+    get_product_availability_from_taxed_prices,
+    get_product_net_price_ranges,
+    get_variant_availability_from_taxed_prices,
+    get_variant_net_prices,
+)
 from ...warehouse.models import Stock
 from ..core.enums import ProductErrorCode
+from .dataloaders import TaxedPriceByProductPriceCountryAndChannelSlugLoader
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from ...product.models import ProductVariant
+    from ...channel.models import Channel
+    from ...discount import DiscountInfo
+    from ...product.models import (
+        Collection,
+        Product,
+        ProductChannelListing,
+        ProductVariant,
+        ProductVariantChannelListing,
+    )
 
 import logging
 
@@ -141,3 +160,108 @@ def update_ordered_media(ordered_media):
 
     if errors:
         raise ValidationError(errors)
+
+
+def _load_taxed_prices(context, product: "Product", prices, country_code, channel):
+    return TaxedPriceByProductPriceCountryAndChannelSlugLoader(context).load_many(
+        [
+            (product.id, price.amount, price.currency, country_code, channel.slug)
+            for price in prices
+        ]
+    )
+
+
+def load_product_availability(
+    context,
+    *,
+    product: "Product",
+    product_channel_listing: Optional["ProductChannelListing"],
+    variants: Iterable["ProductVariant"],
+    variants_channel_listing: List["ProductVariantChannelListing"],
+    collections: Iterable["Collection"],
+    discounts: Iterable["DiscountInfo"],
+    channel: "Channel",
+    country_code: str,
+    local_currency: Optional[str] = None,
+) -> Promise[ProductAvailability]:
+    """Return availability of the product with taxes applied in a request batch."""
+    discounted_net_range, undiscounted_net_range = get_product_net_price_ranges(
+        product=product,
+        variants=variants,
+        variants_channel_listing=variants_channel_listing,
+        collections=collections,
+        discounts=discounts,
+        channel=channel,
+    )
+    if discounted_net_range is None or undiscounted_net_range is None:
+        return Promise.resolve(
+            get_product_availability_from_taxed_prices(
+                product_channel_listing=product_channel_listing,
+                discounted=None,
+                undiscounted=None,
+                local_currency=local_currency,
+            )
+        )
+
+    def with_taxed_prices(taxed_prices):
+        (
+            discounted_start,
+            discounted_stop,
+            undiscounted_start,
+            undiscounted_stop,
+        ) = taxed_prices
+        return get_product_availability_from_taxed_prices(
+            product_channel_listing=product_channel_listing,
+            discounted=TaxedMoneyRange(start=discounted_start, stop=discounted_stop),
+            undiscounted=TaxedMoneyRange(
+                start=undiscounted_start, stop=undiscounted_stop
+            ),
+            local_currency=local_currency,
+        )
+
+    prices = [
+        discounted_net_range.start,
+        discounted_net_range.stop,
+        undiscounted_net_range.start,
+        undiscounted_net_range.stop,
+    ]
+    return _load_taxed_prices(context, product, prices, country_code, channel).then(
+        with_taxed_prices
+    )
+
+
+def load_variant_availability(
+    context,
+    *,
+    variant: "ProductVariant",
+    variant_channel_listing: "ProductVariantChannelListing",
+    product: "Product",
+    product_channel_listing: Optional["ProductChannelListing"],
+    collections: Iterable["Collection"],
+    discounts: Iterable["DiscountInfo"],
+    channel: "Channel",
+    country_code: str,
+    local_currency: Optional[str] = None,
+) -> Promise[VariantAvailability]:
+    """Return availability of the variant with taxes applied in a request batch."""
+    prices = get_variant_net_prices(
+        variant=variant,
+        variant_channel_listing=variant_channel_listing,
+        product=product,
+        collections=collections,
+        discounts=discounts,
+        channel=channel,
+    )
+
+    def with_taxed_prices(taxed_prices):
+        discounted, undiscounted = taxed_prices
+        return get_variant_availability_from_taxed_prices(
+            product_channel_listing=product_channel_listing,
+            discounted=discounted,
+            undiscounted=undiscounted,
+            local_currency=local_currency,
+        )
+
+    return _load_taxed_prices(context, product, prices, country_code, channel).then(
+        with_taxed_prices
+    )
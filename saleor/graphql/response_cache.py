@@ -0,0 +1,277 @@
+"""Response cache for anonymous catalog queries.
+
+Cached responses are tagged with the global IDs of the objects they contain and
+with the names of the types they select or list, taken from the schema. Plugin
+events invalidate the tags of the changed objects, which makes every response
+that contains them stale.
+"""
+import uuid
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from graphql import GraphQLDocument, GraphQLList, GraphQLNonNull, GraphQLObjectType
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    InlineFragment,
+    OperationDefinition,
+    SelectionSet,
+)
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+from .core.utils import from_global_id_or_error
+from .document_cache import hash_query, hash_variables
+
+# Changed on every invalidation, so results computed while an invalidation happened
+# are not stored with tag versions that are already stale.
+RESPONSE_CACHE_GENERATION_KEY = "response-cache-generation"
+
+
+def get_type_tag(type_name: str) -> str:
+    """Return the tag of all responses containing objects of the given type."""
+    return f"{type_name}:type"
+
+
+def get_list_tag(type_name: str) -> str:
+    """Return the tag of all responses listing objects of the given type."""
+    return f"{type_name}:list"
+
+
+def _get_tag_cache_key(tag: str) -> str:
+    return f"response-cache-tag-{tag}"
+
+
+def generate_response_cache_key(
+    raw_query: str, variables: Optional[Dict[str, Any]], operation_name: Optional[str]
+) -> str:
+    hashed_query = hash_query(raw_query)
+    hashed_variables = hash_variables(
+        {"variables": variables, "operationName": operation_name}
+    )
+    return f"{saleor_version}-response-{hashed_query}-{hashed_variables}"
+
+
+def _get_operation_definitions(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Iterator[OperationDefinition]:
+    for definition in document.document_ast.definitions:
+        if not isinstance(definition, OperationDefinition):
+            continue
+        if operation_name and (
+            not definition.name or definition.name.value != operation_name
+        ):
+            continue
+        yield definition
+
+
+def is_response_cacheable(
+    request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+) -> bool:
+    """Check if the response for the request can be served from the cache.
+
+    Only anonymous query operations that select allowed root fields are cached.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return False
+    if get_token_from_request(request):
+        return False
+    if document.get_operation_type(operation_name) != "query":
+        return False
+
+    for definition in _get_operation_definitions(document, operation_name):
+        for selection in definition.selection_set.selections:
+            if not isinstance(selection, Field):
+                return False
+            if selection.name.value not in settings.GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS:
+                return False
+    return True
+
+
+def _unwrap_type(graphql_type):
+    """Return the named type and whether it's wrapped in a list."""
+    is_list = False
+    while isinstance(graphql_type, (GraphQLList, GraphQLNonNull)):
+        is_list = is_list or isinstance(graphql_type, GraphQLList)
+        graphql_type = graphql_type.of_type
+    return graphql_type, is_list
+
+
+def _is_node_type(graphql_type) -> bool:
+    return isinstance(graphql_type, GraphQLObjectType) and any(
+        interface.name == "Node" for interface in graphql_type.interfaces
+    )
+
+
+def _add_operation_type(types: Dict[str, bool], graphql_type, listed: bool):
+    if _is_node_type(graphql_type):
+        types[graphql_type.name] = types.get(graphql_type.name, False) or listed
+
+
+def _collect_operation_types(
+    schema,
+    parent_type,
+    selection_set: Optional[SelectionSet],
+    fragments: Dict[str, FragmentDefinition],
+    types: Dict[str, bool],
+    in_list: bool,
+):
+    if selection_set is None:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            field = getattr(parent_type, "fields", {}).get(selection.name.value)
+            if field is None:
+                continue
+            field_type, is_list = _unwrap_type(field.type)
+            # connection nodes are listed through the `edges` field
+            field_in_list = is_list or (in_list and selection.name.value == "node")
+            _add_operation_type(types, field_type, field_in_list)
+            _collect_operation_types(
+                schema,
+                field_type,
+                selection.selection_set,
+                fragments,
+                types,
+                field_in_list,
+            )
+            continue
+
+        if isinstance(selection, FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+        elif isinstance(selection, InlineFragment):
+            fragment = selection
+        else:
+            fragment = None
+        if fragment is None:
+            continue
+        fragment_type = parent_type
+        if fragment.type_condition:
+            fragment_type = schema.get_type(fragment.type_condition.name.value)
+            _add_operation_type(types, fragment_type, in_list)
+        _collect_operation_types(
+            schema, fragment_type, fragment.selection_set, fragments, types, in_list
+        )
+
+
+def get_operation_types(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Dict[str, bool]:
+    """Return names of object types selected by the operation.
+
+    The names are mapped to True for types selected in lists. They are taken from
+    the schema, so they are known even when the response doesn't contain IDs of
+    the objects or its lists are empty.
+    """
+    schema = document.schema
+    fragments = {
+        definition.name.value: definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, FragmentDefinition)
+    }
+    types: Dict[str, bool] = {}
+    for definition in _get_operation_definitions(document, operation_name):
+        _collect_operation_types(
+            schema,
+            schema.get_query_type(),
+            definition.selection_set,
+            fragments,
+            types,
+            False,
+        )
+    return types
+
+
+def collect_cache_tags(data: Any, tags: Set[str], in_list: bool = False):
+    if isinstance(data, list):
+        for item in data:
+            collect_cache_tags(item, tags, in_list=True)
+    elif isinstance(data, dict):
+        global_id = data.get("id")
+        if isinstance(global_id, str):
+            try:
+                type_name, _ = from_global_id_or_error(global_id)
+            except GraphQLError:
+                pass
+            else:
+                tags.add(global_id)
+                tags.add(get_type_tag(type_name))
+                if in_list:
+                    tags.add(get_list_tag(type_name))
+        for key, value in data.items():
+            # connection nodes are listed through the `edges` field
+            collect_cache_tags(value, tags, in_list=in_list and key == "node")
+
+
+def get_cached_response(cache_key: str) -> Optional[ExecutionResult]:
+    entry = cache.get(cache_key)
+    if entry is None:
+        return None
+    tag_versions = entry["tags"]
+    current_versions = cache.get_many([_get_tag_cache_key(tag) for tag in tag_versions])
+    for tag, version in tag_versions.items():
+        if current_versions.get(_get_tag_cache_key(tag)) != version:
+            return None
+    return ExecutionResult(data=entry["data"])
+
+
+def get_response_cache_generation() -> Optional[str]:
+    """Return the invalidation generation to pass to `cache_response`.
+
+    It should be read before the query is executed.
+    """
+    return cache.get(RESPONSE_CACHE_GENERATION_KEY)
+
+
+def cache_response(
+    cache_key: str,
+    result: ExecutionResult,
+    generation: Optional[str],
+    operation_types: Optional[Dict[str, bool]] = None,
+):
+    """Store the result tagged with its objects and the types of the operation.
+
+    Types selected without IDs of their objects are tagged like listed types, so
+    any change of their objects makes the result stale. Results without any tags
+    couldn't be invalidated, so they aren't stored.
+    """
+    if result.errors or result.invalid or result.data is None:
+        return
+    if cache.get(RESPONSE_CACHE_GENERATION_KEY) != generation:
+        # Objects could be changed while the query was executed.
+        return
+    tags: Set[str] = set()
+    collect_cache_tags(result.data, tags)
+    for type_name, listed in (operation_types or {}).items():
+        type_tag = get_type_tag(type_name)
+        if listed or type_tag not in tags:
+            tags.add(get_list_tag(type_name))
+        tags.add(type_tag)
+    if not tags:
+        return
+    tag_keys = {tag: _get_tag_cache_key(tag) for tag in tags}
+    current_versions = cache.get_many(tag_keys.values())
+    entry = {
+        "data": result.data,
+        "tags": {tag: current_versions.get(key) for tag, key in tag_keys.items()},
+    }
+    cache.set(cache_key, entry, settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT)
+
+
+def invalidate_cache_tags(tags: Iterable[str]):
+    """Mark all cached responses tagged with any of the given tags as stale."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return
+    version = uuid.uuid4().hex
+    cache.set_many(
+        {_get_tag_cache_key(tag): version for tag in tags},
+        settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+    )
+    cache.set(
+        RESPONSE_CACHE_GENERATION_KEY, version, settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT
+    )
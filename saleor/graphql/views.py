@@ -25,8 +25,17 @@ from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import get_context_value
-from .core.validators.query_cost import validate_query_cost
+from .document_cache import document_cache
+from .persisted_queries import resolve_persisted_query
 from .query_cost_map import COST_MAP
+from .response_cache import (
+    cache_response,
+    generate_response_cache_key,
+    get_cached_response,
+    get_operation_types,
+    get_response_cache_generation,
+    is_response_cacheable,
+)
 from .utils import format_error, query_fingerprint
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
@@ -98,13 +107,13 @@ class GraphQLView(View):
     @observability.report_view
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
-        if request.method == "GET":
+        if request.method == "GET" and not self.is_get_query_request(request):
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
         if request.method == "OPTIONS":
             response = self.options(request, *args, **kwargs)
-        elif request.method == "POST":
+        elif request.method in ("GET", "POST"):
             response = self.handle_query(request)
         else:
             return HttpResponseNotAllowed(["GET", "OPTIONS", "POST"])
@@ -115,7 +124,7 @@ class GraphQLView(View):
                     response["Access-Control-Allow-Origin"] = request.META[
                         "HTTP_ORIGIN"
                     ]
-                    response["Access-Control-Allow-Methods"] = "POST, OPTIONS"
+                    response["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
                     response["Access-Control-Allow-Headers"] = (
                         "Origin, Content-Type, Accept, Authorization, "
                         "Authorization-Bearer"
@@ -124,6 +133,11 @@ class GraphQLView(View):
                     break
         return response
 
+    @staticmethod
+    def is_get_query_request(request: HttpRequest) -> bool:
+        """Return True when GET request carries a query or a persisted query hash."""
+        return "query" in request.GET or "extensions" in request.GET
+
     def render_playground(self, request):
         return render(
             request,
@@ -246,7 +260,7 @@ class GraphQLView(View):
         # Attempt to parse the query, if it fails, return the error
         try:
             return (
-                self.backend.document_from_string(self.schema, query),  # type: ignore
+                document_cache.get_document(self.backend, self.schema, query),
                 None,
             )
         except (ValueError, GraphQLSyntaxError) as e:
@@ -278,6 +292,12 @@ class GraphQLView(View):
             query, variables, operation_name = self.get_graphql_params(request, data)
             query_cost = 0
 
+            query, persisted_query_error = resolve_persisted_query(
+                query, data.get("extensions")
+            )
+            if persisted_query_error:
+                return ExecutionResult(errors=[persisted_query_error], invalid=True)
+
             document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -287,6 +307,17 @@ class GraphQLView(View):
                 return error
 
             if document is not None:
+                if request.method == "GET" and (
+                    document.get_operation_type(operation_name) != "query"
+                ):
+                    return ExecutionResult(
+                        errors=[
+                            GraphQLError(
+                                "Only query operations can be sent with GET requests."
+                            )
+                        ],
+                        invalid=True,
+                    )
                 raw_query_string = document.document_string
                 span.set_tag("graphql.query", raw_query_string)
                 span.set_tag("graphql.query_fingerprint", query_fingerprint(document))
@@ -297,7 +328,7 @@ class GraphQLView(View):
                 except GraphQLError as e:
                     return ExecutionResult(errors=[e], invalid=True)
 
-                query_cost, cost_errors = validate_query_cost(
+                query_cost, cost_errors = document_cache.get_query_cost(
                     schema,
                     document,
                     variables,
@@ -325,17 +356,46 @@ class GraphQLView(View):
                         key = generate_cache_key(raw_query_string)
                         response = cache.get(key)
 
+                    response_cache_key = None
+                    response_cache_generation = None
+                    if not response and is_response_cacheable(
+                        request, document, operation_name  # type: ignore
+                    ):
+                        response_cache_key = generate_response_cache_key(
+                            raw_query_string, variables, operation_name
+                        )
+                        response_cache_generation = get_response_cache_generation()
+                        response = get_cached_response(response_cache_key)
+
                     if not response:
+                        validation_errors = document_cache.validate(
+                            document  # type: ignore
+                        )
+                        if validation_errors:
+                            return set_query_cost_on_result(
+                                ExecutionResult(errors=validation_errors, invalid=True),
+                                query_cost,
+                            )
                         response = document.execute(  # type: ignore
                             root=self.get_root_value(),
                             variables=variables,
                             operation_name=operation_name,
                             context=get_context_value(request),
                             middleware=self.middleware,
+                            validate=False,
                             **extra_options,
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
+                        elif response_cache_key:
+                            cache_response(
+                                response_cache_key,
+                                response,
+                                response_cache_generation,
+                                get_operation_types(
+                                    document, operation_name  # type: ignore
+                                ),
+                            )
 
                     if app := getattr(request, "app", None):
                         span.set_tag("app.name", app.name)
@@ -354,6 +414,12 @@ class GraphQLView(View):
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data = request.GET.dict()
+            for param in ("variables", "extensions"):
+                if param in data:
+                    data[param] = json.loads(data[param])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -6,6 +6,7 @@ from ...core.permissions import ProductPermissions
 from ...core.tracing import traced_atomic_transaction
 from ...warehouse import WarehouseClickAndCollectOption, models
 from ...warehouse.error_codes import WarehouseErrorCode
+from ...warehouse.utils import invalidate_warehouses_map
 from ...warehouse.validation import validate_warehouse_count  # type: ignore
 from ..account.i18n import I18nMixin
 from ..core.mutations import ModelDeleteMutation, ModelMutation
@@ -127,6 +128,7 @@ class WarehouseShippingZoneAssign(WarehouseMixin, ModelMutation, I18nMixin):
             data.get("shipping_zone_ids"), "shipping_zone_id", only_type=ShippingZone
         )
         warehouse.shipping_zones.add(*shipping_zones)
+        transaction.on_commit(invalidate_warehouses_map)
         return WarehouseShippingZoneAssign(warehouse=warehouse)
 
 
@@ -154,6 +156,7 @@ class WarehouseShippingZoneUnassign(WarehouseMixin, ModelMutation, I18nMixin):
             data.get("shipping_zone_ids"), "shipping_zone_id", only_type=ShippingZone
         )
         warehouse.shipping_zones.remove(*shipping_zones)
+        transaction.on_commit(invalidate_warehouses_map)
         return WarehouseShippingZoneAssign(warehouse=warehouse)
 
 
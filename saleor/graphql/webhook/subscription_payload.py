@@ -9,13 +9,15 @@ from django.utils.functional import SimpleLazyObject
 from graphql import GraphQLDocument, get_default_backend, parse
 from graphql.error import GraphQLError, GraphQLSyntaxError
 from graphql.language.ast import FragmentDefinition, OperationDefinition
+from graphql.language.printer import print_ast
 from promise import Promise
 
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
-from ...discount.utils import fetch_discounts
+from ...discount.utils import fetch_cached_discounts
 from ...plugins.manager import PluginsManager
 from ...settings import get_host
+from ..document_cache import hash_query
 from ..utils import format_error
 
 logger = get_task_logger(__name__)
@@ -53,6 +55,18 @@ def check_document_is_single_subscription(document: GraphQLDocument) -> bool:
     return len(subscriptions) == 1
 
 
+def get_subscription_query_hash(subscription_query: str) -> str:
+    """Return the hash of the subscription query ignoring its formatting.
+
+    Queries that differ only in whitespace, commas or comments get the same hash.
+    """
+    try:
+        normalized_query = print_ast(parse(subscription_query))
+    except GraphQLSyntaxError:
+        normalized_query = subscription_query
+    return hash_query(normalized_query)
+
+
 def initialize_request(requestor=None) -> HttpRequest:
     """Prepare a request object for webhook subscription.
 
@@ -79,7 +93,7 @@ def initialize_request(requestor=None) -> HttpRequest:
     request.request_time = request_time  # type: ignore
     request.site = SimpleLazyObject(lambda: Site.objects.get_current())  # type: ignore
     request.discounts = SimpleLazyObject(  # type: ignore
-        lambda: fetch_discounts(request_time)
+        lambda: fetch_cached_discounts(request_time)
     )
     request.plugins = SimpleLazyObject(lambda: _get_plugins(requestor))  # type: ignore
 
@@ -0,0 +1,26 @@
+# Generated by Django 3.2.13 on 2022-07-20 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0154_auto_20220621_0850"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="search_vector_dirty_weights",
+            field=models.CharField(blank=True, default="", max_length=4),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("search_vector_dirty_weights", ""), _negated=True),
+                fields=["search_vector_dirty_weights"],
+                name="order_search_vector_dirty_idx",
+            ),
+        ),
+    ]
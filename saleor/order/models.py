@@ -10,7 +10,7 @@ from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.db import connection, models
 from django.db.models import JSONField  # type: ignore
-from django.db.models import F, Max
+from django.db.models import F, Max, Q
 from django.db.models.expressions import Exists, OuterRef
 from django.utils.timezone import now
 from django_measurement.models import MeasurementField
@@ -289,6 +289,8 @@ class Order(ModelWithMetadata):
     redirect_url = models.URLField(blank=True, null=True)
     search_document = models.TextField(blank=True, default="")
     search_vector = SearchVectorField(blank=True, null=True)
+    # weights of the search vector parts waiting for the update
+    search_vector_dirty_weights = models.CharField(max_length=4, blank=True, default="")
     objects = models.Manager.from_queryset(OrderQueryset)()
 
     class Meta:
@@ -312,6 +314,11 @@ class Order(ModelWithMetadata):
                 fields=["user_email"],
                 opclasses=["gin_trgm_ops"],
             ),
+            models.Index(
+                name="order_search_vector_dirty_idx",
+                fields=["search_vector_dirty_weights"],
+                condition=~Q(search_vector_dirty_weights=""),
+            ),
         ]
 
     def is_fully_paid(self):
@@ -1,17 +1,49 @@
 from functools import reduce
 from operator import add
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import graphene
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db.models import F, Func, Q, Value, prefetch_related_objects
+from django.db.models.functions import Concat
 
 from ..account.search import generate_address_search_vector_value
+from .models import Order
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from .models import Order
+# Parts of the order search vector are stored with different weights, so each of
+# them can be replaced without rebuilding the whole vector.
+ORDER_SEARCH_CUSTOMER_WEIGHT = "A"
+ORDER_SEARCH_ADDRESSES_WEIGHT = "B"
+ORDER_SEARCH_LINES_WEIGHT = "C"
+ORDER_SEARCH_PAYMENTS_WEIGHT = "D"
+ORDER_SEARCH_WEIGHTS = "ABCD"
+ORDER_SEARCH_RELATIONS = {
+    ORDER_SEARCH_CUSTOMER_WEIGHT: ["user"],
+    ORDER_SEARCH_ADDRESSES_WEIGHT: ["billing_address", "shipping_address"],
+    ORDER_SEARCH_LINES_WEIGHT: ["lines"],
+    ORDER_SEARCH_PAYMENTS_WEIGHT: ["payments", "discounts"],
+}
+
+
+class SearchVectorFilter(SearchVectorCombinable, Func):
+    """Select the lexemes of a search vector having one of the given weights."""
+
+    function = "ts_filter"
+    template = '%(function)s(%(expressions)s::"char"[])'
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, weights: str):
+        weights_array = "{%s}" % ",".join(weight.lower() for weight in weights)
+        super().__init__(expression, Value(weights_array))
 
 
 def update_order_search_vector(order: "Order"):
@@ -19,17 +51,92 @@ def update_order_search_vector(order: "Order"):
     order.save(update_fields=["search_vector", "updated_at"])
 
 
+def mark_order_search_vector_as_dirty(order: "Order", weights: str):
+    """Queue the update of the order search vector parts with the given weights.
+
+    The parts are replaced by `update_orders_search_vector_task`, so repeated
+    changes of the same order are indexed once. Orders without the search vector
+    are indexed right away.
+    """
+    if order.search_vector is None:
+        update_order_search_vector(order)
+        return
+    orders = Order.objects.filter(pk=order.pk)
+    for weight in weights:
+        orders.exclude(search_vector_dirty_weights__contains=weight).update(
+            search_vector_dirty_weights=Concat(
+                F("search_vector_dirty_weights"), Value(weight)
+            )
+        )
+
+
+def get_order_search_vector_relations(weights: str) -> List[str]:
+    return [
+        relation for weight in weights for relation in ORDER_SEARCH_RELATIONS[weight]
+    ]
+
+
+def update_order_search_vector_parts(
+    order: "Order", weights: str, *, already_prefetched=False
+):
+    """Replace the order search vector parts with the given weights.
+
+    The other parts are kept as they are, so only the relations of the replaced
+    parts are fetched.
+    """
+    if order.search_vector is None:
+        weights = ORDER_SEARCH_WEIGHTS
+    kept_weights = "".join(
+        weight for weight in ORDER_SEARCH_WEIGHTS if weight not in weights
+    )
+    search_vector: SearchVectorCombinable = SearchVectorFilter(
+        F("search_vector"), kept_weights
+    )
+    parts_vector = prepare_order_search_vector_parts_value(
+        order, weights, already_prefetched=already_prefetched
+    )
+    if parts_vector is not None:
+        search_vector = parts_vector + search_vector
+    Order.objects.filter(pk=order.pk).update(
+        search_vector=search_vector, search_vector_dirty_weights=""
+    )
+
+
 def prepare_order_search_vector_value(order: "Order", *, already_prefetched=False):
+    return prepare_order_search_vector_parts_value(
+        order, ORDER_SEARCH_WEIGHTS, already_prefetched=already_prefetched
+    )
+
+
+def prepare_order_search_vector_parts_value(
+    order: "Order", weights: str, *, already_prefetched=False
+) -> Optional[SearchVector]:
     if not already_prefetched:
-        prefetch_related_objects(
-            [order],
-            "user",
-            "billing_address",
-            "shipping_address",
-            "payments",
-            "discounts",
-            "lines",
-        )
+        prefetch_related_objects([order], *get_order_search_vector_relations(weights))
+    vectors: List[Optional[SearchVector]] = []
+    if ORDER_SEARCH_CUSTOMER_WEIGHT in weights:
+        vectors.append(generate_order_customer_search_vector_value(order))
+    if ORDER_SEARCH_ADDRESSES_WEIGHT in weights:
+        for address in [order.billing_address, order.shipping_address]:
+            if address:
+                vectors.append(
+                    generate_address_search_vector_value(
+                        address, weight=ORDER_SEARCH_ADDRESSES_WEIGHT
+                    )
+                )
+    if ORDER_SEARCH_PAYMENTS_WEIGHT in weights:
+        vectors.append(generate_order_payments_search_vector_value(order))
+        vectors.append(generate_order_discounts_search_vector_value(order))
+    if ORDER_SEARCH_LINES_WEIGHT in weights:
+        vectors.append(generate_order_lines_search_vector_value(order))
+
+    search_vectors = [vector for vector in vectors if vector is not None]
+    if not search_vectors:
+        return None
+    return reduce(add, search_vectors)
+
+
+def generate_order_customer_search_vector_value(order: "Order") -> SearchVector:
     search_vector = SearchVector(Value(str(order.number)), config="simple", weight="A")
     if order.user_email:
         search_vector += SearchVector(
@@ -47,26 +154,6 @@ def prepare_order_search_vector_value(order: "Order", *, already_prefetched=Fals
             search_vector += SearchVector(
                 Value(order.user.last_name), config="simple", weight="A"
             )
-
-    if order.billing_address:
-        search_vector += generate_address_search_vector_value(
-            order.billing_address, weight="B"
-        )
-    if order.shipping_address:
-        search_vector += generate_address_search_vector_value(
-            order.shipping_address, weight="B"
-        )
-
-    payment_vector = generate_order_payments_search_vector_value(order)
-    if payment_vector:
-        search_vector += payment_vector
-    discount_vector = generate_order_discounts_search_vector_value(order)
-    if discount_vector:
-        search_vector += discount_vector
-    line_vector = generate_order_lines_search_vector_value(order)
-    if line_vector:
-        search_vector += line_vector
-
     return search_vector
 
 
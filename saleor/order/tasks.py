@@ -1,10 +1,18 @@
+from collections import defaultdict
 from typing import List
 
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+
 from ..celeryconf import app
 from ..plugins.manager import get_plugins_manager
 from .models import Order
+from .search import get_order_search_vector_relations, update_order_search_vector_parts
 from .utils import recalculate_order
 
+# Number of orders whose search vectors are updated in a single task run
+ORDERS_SEARCH_VECTOR_BATCH_SIZE = 500
+
 
 @app.task
 def recalculate_orders_task(order_ids: List[int]):
@@ -18,3 +26,31 @@ def send_order_updated(order_ids):
     manager = get_plugins_manager()
     for order in Order.objects.filter(id__in=order_ids):
         manager.order_updated(order)
+
+
+@app.task
+def update_orders_search_vector_task():
+    """Replace the search vector parts of the orders marked as dirty.
+
+    Orders locked by other transactions are skipped and updated in the next run,
+    after the changes that made them dirty are committed.
+    """
+    with transaction.atomic():
+        orders = (
+            Order.objects.exclude(search_vector_dirty_weights="")
+            .select_for_update(skip_locked=True)
+            .order_by("pk")[:ORDERS_SEARCH_VECTOR_BATCH_SIZE]
+        )
+        orders_by_weights = defaultdict(list)
+        for order in orders:
+            weights = "".join(sorted(order.search_vector_dirty_weights))
+            orders_by_weights[weights].append(order)
+
+        for weights, weight_orders in orders_by_weights.items():
+            prefetch_related_objects(
+                weight_orders, *get_order_search_vector_relations(weights)
+            )
+            for order in weight_orders:
+                update_order_search_vector_parts(
+                    order, weights, already_prefetched=True
+                )
@@ -1,8 +1,16 @@
 from decimal import Decimal
 
 from ...discount import DiscountValueType
-from ..models import OrderLine
-from ..search import prepare_order_search_vector_value, update_order_search_vector
+from ..models import Order, OrderLine
+from ..search import (
+    ORDER_SEARCH_LINES_WEIGHT,
+    ORDER_SEARCH_PAYMENTS_WEIGHT,
+    mark_order_search_vector_as_dirty,
+    prepare_order_search_vector_value,
+    search_orders,
+    update_order_search_vector,
+    update_order_search_vector_parts,
+)
 
 
 def test_update_order_search_vector(order):
@@ -93,3 +101,55 @@ def test_prepare_order_search_vector_value_no_relations_data(order, address_usa)
 
     # then
     assert search_vector_value
+
+
+def test_mark_order_search_vector_as_dirty_coalesces_weights(
+    order_with_search_vector_value,
+):
+    # given
+    order = order_with_search_vector_value
+
+    # when
+    mark_order_search_vector_as_dirty(order, ORDER_SEARCH_LINES_WEIGHT)
+    mark_order_search_vector_as_dirty(order, ORDER_SEARCH_PAYMENTS_WEIGHT)
+    mark_order_search_vector_as_dirty(order, ORDER_SEARCH_LINES_WEIGHT)
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector_dirty_weights == "CD"
+
+
+def test_mark_order_search_vector_as_dirty_indexes_order_without_vector(order):
+    # given
+    assert order.search_vector is None
+
+    # when
+    mark_order_search_vector_as_dirty(order, ORDER_SEARCH_LINES_WEIGHT)
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector
+    assert order.search_vector_dirty_weights == ""
+
+
+def test_update_order_search_vector_parts_keeps_other_parts(order_with_lines):
+    # given
+    order = order_with_lines
+    update_order_search_vector(order)
+    line = order.lines.first()
+    line.product_name = "Bamboozle"
+    line.save(update_fields=["product_name"])
+    order.search_vector_dirty_weights = ORDER_SEARCH_LINES_WEIGHT
+    order.save(update_fields=["search_vector_dirty_weights"])
+    order = Order.objects.get(pk=order.pk)
+
+    # when
+    update_order_search_vector_parts(order, ORDER_SEARCH_LINES_WEIGHT)
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector_dirty_weights == ""
+    orders = Order.objects.filter(pk=order.pk)
+    assert search_orders(orders, "bamboozle").exists()
+    assert search_orders(orders, order.user_email).exists()
+    assert search_orders(orders, str(order.number)).exists()
@@ -0,0 +1,28 @@
+from ..models import Order
+from ..search import (
+    ORDER_SEARCH_LINES_WEIGHT,
+    search_orders,
+    update_order_search_vector,
+)
+from ..tasks import update_orders_search_vector_task
+
+
+def test_update_orders_search_vector_task(order_with_lines):
+    # given
+    order = order_with_lines
+    update_order_search_vector(order)
+    line = order.lines.first()
+    line.product_name = "Bamboozle"
+    line.save(update_fields=["product_name"])
+    order.search_vector_dirty_weights = ORDER_SEARCH_LINES_WEIGHT
+    order.save(update_fields=["search_vector_dirty_weights"])
+
+    # when
+    update_orders_search_vector_task()
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector_dirty_weights == ""
+    orders = Order.objects.filter(pk=order.pk)
+    assert search_orders(orders, "bamboozle").exists()
+    assert search_orders(orders, order.user_email).exists()
@@ -1,8 +1,12 @@
+import hashlib
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union, cast
 from urllib.parse import urljoin
 
@@ -11,6 +15,7 @@ import opentracing.tags
 import requests
 from django.contrib.sites.models import Site
 from django.core.cache import cache
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from ...checkout import base_calculations
@@ -37,6 +42,12 @@ TAX_CODES_CACHE_TIME = 60 * 60 * 24 * 7  # 7 days
 CACHE_KEY = "avatax_request_id_"
 TAX_CODES_CACHE_KEY = "avatax_tax_codes_cache_key"
 TIMEOUT = 10  # API HTTP Requests Timeout
+MAX_CONNECTIONS_PER_HOST = 10
+# Poll interval of requests waiting for the response of an identical request
+IN_FLIGHT_POLL_INTERVAL = 0.05
+# Requests wait for the identical request about as long as Avatax usually takes to
+# respond, then send their own, so a slow Avatax doesn't hold up web workers
+IN_FLIGHT_MAX_WAIT = 1.5
 
 # Common discount code use to apply discount on order
 COMMON_DISCOUNT_VOUCHER_CODE = "OD010000"
@@ -85,13 +96,40 @@ def get_api_url(use_sandbox=True) -> str:
     return "https://rest.avatax.com/api/v2/"
 
 
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the worker's session keeping alive connections to Avatax."""
+    global _http_session
+
+    session = _http_session
+    if session is None:
+        with _http_session_lock:
+            session = _http_session
+            if session is None:
+                session = requests.Session()
+                # The session is shared by all configurations, cookies set by one
+                # response must not be sent with the next requests.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(
+                    pool_connections=2, pool_maxsize=MAX_CONNECTIONS_PER_HOST
+                )
+                session.mount("https://", adapter)
+                _http_session = session
+    return session
+
+
 def api_post_request(
     url: str, data: Dict[str, Any], config: AvataxConfiguration
 ) -> Dict[str, Any]:
     response = None
     try:
         auth = HTTPBasicAuth(config.username_or_account, config.password_or_license)
-        response = requests.post(url, auth=auth, data=json.dumps(data), timeout=TIMEOUT)
+        response = get_http_session().post(
+            url, auth=auth, data=json.dumps(data), timeout=TIMEOUT
+        )
         logger.debug("Hit to Avatax to calculate taxes %s", url)
         json_response = response.json()
         if "error" in response:  # type: ignore
@@ -117,7 +155,7 @@ def api_get_request(
     response = None
     try:
         auth = HTTPBasicAuth(username_or_account, password_or_license)
-        response = requests.get(url, auth=auth, timeout=TIMEOUT)
+        response = get_http_session().get(url, auth=auth, timeout=TIMEOUT)
         json_response = response.json()
         logger.debug("[GET] Hit to %s", url)
         if "error" in json_response:  # type: ignore
@@ -195,11 +233,47 @@ def taxes_need_new_fetch(data: Dict[str, Any], cached_data) -> bool:
         return True
 
     cached_request_data, _ = cached_data
-    if data != cached_request_data:
+    if _get_cacheable_request_data(data) != _get_cacheable_request_data(
+        cached_request_data
+    ):
         return True
     return False
 
 
+def _get_cacheable_request_data(data: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Return the request data that determines the Avatax response.
+
+    Sales orders are not recorded by Avatax, so their transaction codes don't
+    change the calculated taxes and are skipped to share the responses between
+    identical checkouts.
+    """
+    transaction_data = data.get("createTransactionModel")
+    if (
+        not transaction_data
+        or transaction_data.get("type") != TransactionType.ORDER
+        or transaction_data.get("commit")
+    ):
+        return data
+    transaction_data = {
+        key: value for key, value in transaction_data.items() if key != "code"
+    }
+    return {**data, "createTransactionModel": transaction_data}
+
+
+def get_request_hash(data: Dict[str, Dict], config: AvataxConfiguration) -> str:
+    """Return the hash of the request content used to cache Avatax responses."""
+    content = json.dumps(
+        [
+            config.username_or_account,
+            config.use_sandbox,
+            _get_cacheable_request_data(data),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def append_line_to_data(
     data: List[Dict[str, Union[Any]]],
     quantity: int,
@@ -517,23 +591,53 @@ def _fetch_new_taxes_data(
     return response
 
 
+def _wait_for_taxes_data(data: Dict[str, Dict], data_cache_key: str, lock_key: str):
+    """Wait for the response of the identical request sent by another worker.
+
+    Return None when the request didn't store its response in `IN_FLIGHT_MAX_WAIT`
+    seconds.
+    """
+    deadline = time.monotonic() + IN_FLIGHT_MAX_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(IN_FLIGHT_POLL_INTERVAL)
+        cached_data = cache.get(data_cache_key)
+        if not taxes_need_new_fetch(data, cached_data):
+            _, response = cached_data
+            return response
+        if not cache.get(lock_key):
+            return None
+    return None
+
+
 def get_cached_response_or_fetch(
     data: Dict[str, Dict],
-    token_in_cache: str,
     config: AvataxConfiguration,
     force_refresh: bool = False,
 ):
     """Try to find response in cache.
 
-    Return cached response if requests data are the same. Fetch new data in other cases.
+    Responses are cached by the hash of the requests content, so identical requests
+    share the response. Concurrent identical requests are sent to Avatax only once,
+    the others wait for the stored response.
     """
-    data_cache_key = CACHE_KEY + token_in_cache
-    cached_data = cache.get(data_cache_key)
-    if taxes_need_new_fetch(data, cached_data) or force_refresh:
-        response = _fetch_new_taxes_data(data, data_cache_key, config)
-    else:
-        _, response = cached_data
-    return response
+    data_cache_key = CACHE_KEY + get_request_hash(data, config)
+    if not force_refresh:
+        cached_data = cache.get(data_cache_key)
+        if not taxes_need_new_fetch(data, cached_data):
+            _, response = cached_data
+            return response
+
+    lock_key = data_cache_key + "_lock"
+    locked = cache.add(lock_key, True, TIMEOUT)
+    if not locked and not force_refresh:
+        response = _wait_for_taxes_data(data, data_cache_key, lock_key)
+        if response is not None:
+            return response
+    try:
+        return _fetch_new_taxes_data(data, data_cache_key, config)
+    finally:
+        if locked:
+            cache.delete(lock_key)
 
 
 def get_checkout_tax_data(
@@ -545,7 +649,7 @@ def get_checkout_tax_data(
     data = generate_request_data_from_checkout(
         checkout_info, lines_info, config, discounts=discounts
     )
-    return get_cached_response_or_fetch(data, str(checkout_info.checkout.token), config)
+    return get_cached_response_or_fetch(data, config)
 
 
 def get_order_request_data(order: "Order", config: AvataxConfiguration):
@@ -575,9 +679,7 @@ def get_order_tax_data(
     order: "Order", config: AvataxConfiguration, force_refresh=False
 ) -> Dict[str, Any]:
     data = get_order_request_data(order, config)
-    response = get_cached_response_or_fetch(
-        data, "order_%s" % order.id, config, force_refresh
-    )
+    response = get_cached_response_or_fetch(data, config, force_refresh)
     error = response.get("error")
     if error:
         raise TaxError(error)
@@ -1,12 +1,22 @@
 from decimal import Decimal
+from itertools import count
 from unittest.mock import ANY, Mock, patch
 
+from django.core.cache import cache
 from django.test import override_settings
 from prices import Money, TaxedMoney
 
 from ....checkout.fetch import fetch_checkout_lines
 from ...manager import get_plugins_manager
-from .. import CACHE_KEY, generate_request_data_from_checkout
+from .. import (
+    CACHE_KEY,
+    AvataxConfiguration,
+    TransactionType,
+    generate_request_data_from_checkout,
+    get_cached_response_or_fetch,
+    get_request_hash,
+    taxes_need_new_fetch,
+)
 from ..plugin import AvataxPlugin
 
 
@@ -51,7 +61,9 @@ def test_calculate_checkout_total_use_cache(
     # when
     assert result == TaxedMoney(net=Money("72.2", "USD"), gross=Money("75", "USD"))
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -140,7 +152,9 @@ def test_calculate_checkout_subtotal_use_cache(
     # when
     assert result == TaxedMoney(net=Money("64.07", "USD"), gross=Money("65", "USD"))
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -229,7 +243,9 @@ def test_calculate_checkout_shipping_use_cache(
     # when
     assert result == TaxedMoney(net=Money("8.13", "USD"), gross=Money("10", "USD"))
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -319,7 +335,9 @@ def test_calculate_checkout_line_total_use_cache(
     # when
     assert result == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5", "USD"))
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -414,7 +432,9 @@ def test_calculate_checkout_line_unit_price_use_cache(
     # when
     assert result == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5", "USD"))
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -519,7 +539,9 @@ def test_get_checkout_line_tax_rate_use_cache(
     # when
     assert result == Decimal("0.36")
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -621,7 +643,9 @@ def test_get_checkout_shipping_tax_rate_use_cache(
     # when
     assert result == Decimal("0.46")
 
-    avalara_cache_key = CACHE_KEY + str(checkout.token)
+    avalara_cache_key = CACHE_KEY + get_request_hash(
+        avalara_request_data, plugin.config
+    )
     mocked_cache.assert_called_with(avalara_cache_key)
     mock_cache_set.assert_not_called()
 
@@ -668,3 +692,125 @@ def test_get_checkout_shipping_tax_rate_save_avatax_response_in_cache(
         checkout_info, lines, plugin.config, []
     )
     mocked_avalara.assert_called_once_with(ANY, avalara_request_data, plugin.config)
+
+
+def _get_avatax_config():
+    return AvataxConfiguration(
+        username_or_account="test",
+        password_or_license="test",
+        from_street_address="Tęczowa 7",
+        from_city="WROCŁAW",
+        from_postal_code="53-601",
+        from_country="PL",
+    )
+
+
+def test_get_request_hash_skips_sales_order_code():
+    # given
+    config = _get_avatax_config()
+    data = {"createTransactionModel": {"type": TransactionType.ORDER, "code": "1"}}
+    other_data = {
+        "createTransactionModel": {"type": TransactionType.ORDER, "code": "2"}
+    }
+
+    # when
+    request_hash = get_request_hash(data, config)
+
+    # then
+    assert request_hash == get_request_hash(other_data, config)
+    assert not taxes_need_new_fetch(data, (other_data, {}))
+
+
+def test_get_request_hash_uses_sales_invoice_code():
+    # given
+    config = _get_avatax_config()
+    data = {"createTransactionModel": {"type": TransactionType.INVOICE, "code": "1"}}
+    other_data = {
+        "createTransactionModel": {"type": TransactionType.INVOICE, "code": "2"}
+    }
+
+    # when
+    request_hash = get_request_hash(data, config)
+
+    # then
+    assert request_hash != get_request_hash(other_data, config)
+    assert taxes_need_new_fetch(data, (other_data, {}))
+
+
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_waits_for_identical_request(
+    mocked_api_post_request,
+):
+    # given
+    config = _get_avatax_config()
+    data = {"createTransactionModel": {"type": TransactionType.ORDER, "code": "1"}}
+    response = {"lines": []}
+    data_cache_key = CACHE_KEY + get_request_hash(data, config)
+    cache.add(data_cache_key + "_lock", True)
+
+    def store_response(_):
+        # the identical request sent by another worker stores its response
+        cache.set(data_cache_key, (data, response))
+
+    # when
+    with patch("saleor.plugins.avatax.time.sleep", side_effect=store_response):
+        result = get_cached_response_or_fetch(data, config)
+
+    # then
+    assert result == response
+    mocked_api_post_request.assert_not_called()
+    cache.delete(data_cache_key)
+    cache.delete(data_cache_key + "_lock")
+
+
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_fetches_when_identical_request_failed(
+    mocked_api_post_request,
+):
+    # given
+    config = _get_avatax_config()
+    data = {"createTransactionModel": {"type": TransactionType.ORDER, "code": "1"}}
+    response = {"lines": []}
+    mocked_api_post_request.return_value = response
+    data_cache_key = CACHE_KEY + get_request_hash(data, config)
+    cache.add(data_cache_key + "_lock", True)
+
+    def release_lock(_):
+        # the identical request sent by another worker ends without a response
+        cache.delete(data_cache_key + "_lock")
+
+    # when
+    with patch("saleor.plugins.avatax.time.sleep", side_effect=release_lock):
+        result = get_cached_response_or_fetch(data, config)
+
+    # then
+    assert result == response
+    mocked_api_post_request.assert_called_once_with(ANY, data, config)
+    assert cache.get(data_cache_key) == (data, response)
+    assert cache.get(data_cache_key + "_lock") is None
+    cache.delete(data_cache_key)
+
+
+@patch("saleor.plugins.avatax.time.sleep")
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_stops_waiting_for_slow_identical_request(
+    mocked_api_post_request, mocked_sleep
+):
+    # given
+    config = _get_avatax_config()
+    data = {"createTransactionModel": {"type": TransactionType.ORDER, "code": "1"}}
+    response = {"lines": []}
+    mocked_api_post_request.return_value = response
+    data_cache_key = CACHE_KEY + get_request_hash(data, config)
+    cache.add(data_cache_key + "_lock", True)
+
+    # when
+    with patch("saleor.plugins.avatax.time.monotonic", side_effect=count(0, 0.5)):
+        result = get_cached_response_or_fetch(data, config)
+
+    # then
+    assert result == response
+    assert mocked_sleep.call_count == 2
+    mocked_api_post_request.assert_called_once_with(ANY, data, config)
+    cache.delete(data_cache_key)
+    cache.delete(data_cache_key + "_lock")
@@ -194,6 +194,14 @@ class BasePlugin:
         ["Product", Money, Country, TaxedMoney], TaxedMoney
     ]
 
+    #  Apply taxes to many product prices based on the customer country.
+    #
+    #  Overwrite this method if you want to show many products with taxes at once.
+    #  Plugins implementing only `apply_taxes_to_product` are run for each price.
+    apply_taxes_to_products: Callable[
+        [List[Tuple["Product", Money, Country]], List[TaxedMoney]], List[TaxedMoney]
+    ]
+
     #  Assign tax code dedicated to plugin.
     assign_tax_code_to_object_meta: Callable[
         [Union["Product", "ProductType"], Union[str, NoneType], Any], Any
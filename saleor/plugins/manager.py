@@ -1,9 +1,12 @@
+import threading
+import time
 from collections import defaultdict
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    DefaultDict,
     Dict,
     Iterable,
     List,
@@ -12,10 +15,13 @@ from typing import (
     Type,
     Union,
 )
+from uuid import uuid4
 
 import opentracing
 from django.conf import settings
+from django.core.cache import cache
 from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
 from django.http import HttpResponse, HttpResponseNotFound
 from django.utils.module_loading import import_string
 from django_countries.fields import Country
@@ -74,13 +80,58 @@ if TYPE_CHECKING:
 
 NotifyEventTypeChoice = str
 
+PLUGINS_REGISTRY_VERSION_KEY = "plugins-registry-version"
 
-class PluginsManager(PaymentInterface):
-    """Base manager for handling plugins logic."""
 
-    plugins_per_channel: Dict[str, List["BasePlugin"]] = {}
-    global_plugins: List["BasePlugin"] = []
-    all_plugins: List["BasePlugin"] = []
+class PluginsRegistry:
+    """Plugins loaded with their configurations for all channels.
+
+    Loading plugins requires fetching their configurations and channels from the
+    database. A registry loaded without a requestor is cached by the worker and
+    managers created for the subsequent requests instantiate their own plugins from
+    its configurations, as plugins may keep state for a single request.
+    """
+
+    def __init__(
+        self, plugins: List[str], requestor_getter=None, version: Optional[str] = None
+    ):
+        self.version = version
+        self.created_at = time.monotonic()
+        self.all_plugins: List["BasePlugin"] = []
+        self.global_plugins: List["BasePlugin"] = []
+        self.plugins_per_channel: DefaultDict[str, List["BasePlugin"]] = defaultdict(
+            list
+        )
+        self._plugins_by_method: Dict[
+            Tuple[Optional[str], str], List["BasePlugin"]
+        ] = {}
+        self._plugins_init_kwargs: Dict[int, Dict[str, Any]] = {}
+
+        global_db_configs, channel_db_configs = self._get_db_plugin_configs()
+        channels = Channel.objects.all()
+
+        for plugin_path in plugins:
+            with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
+                PluginClass = import_string(plugin_path)
+                if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                    plugin = self._load_plugin(
+                        PluginClass,
+                        global_db_configs,
+                        requestor_getter=requestor_getter,
+                    )
+                    self.global_plugins.append(plugin)
+                    self.all_plugins.append(plugin)
+                else:
+                    for channel in channels:
+                        channel_configs = channel_db_configs.get(channel, {})
+                        plugin = self._load_plugin(
+                            PluginClass, channel_configs, channel, requestor_getter
+                        )
+                        self.plugins_per_channel[channel.slug].append(plugin)
+                        self.all_plugins.append(plugin)
+
+        for channel in channels:
+            self.plugins_per_channel[channel.slug].extend(self.global_plugins)
 
     def _load_plugin(
         self,
@@ -99,46 +150,24 @@ class PluginsManager(PaymentInterface):
             plugin_config = PluginClass.DEFAULT_CONFIGURATION
             active = PluginClass.get_default_active()
 
-        return PluginClass(
-            configuration=plugin_config,
-            active=active,
-            channel=channel,
-            requestor_getter=requestor_getter,
-            db_config=db_config,
+        init_kwargs = {
+            "configuration": plugin_config,
+            "active": active,
+            "channel": channel,
+            "db_config": db_config,
+        }
+        plugin = PluginClass(**init_kwargs, requestor_getter=requestor_getter)
+        self._plugins_init_kwargs[id(plugin)] = init_kwargs
+        return plugin
+
+    def create_plugin(
+        self, plugin: "BasePlugin", requestor_getter=None
+    ) -> "BasePlugin":
+        """Return a new instance of the registry plugin bound to the requestor."""
+        return type(plugin)(
+            **self._plugins_init_kwargs[id(plugin)], requestor_getter=requestor_getter
         )
 
-    def __init__(self, plugins: List[str], requestor_getter=None):
-        with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
-            self.all_plugins = []
-            self.global_plugins = []
-            self.plugins_per_channel = defaultdict(list)
-
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs()
-            channels = Channel.objects.all()
-
-            for plugin_path in plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
-                    if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
-                        plugin = self._load_plugin(
-                            PluginClass,
-                            global_db_configs,
-                            requestor_getter=requestor_getter,
-                        )
-                        self.global_plugins.append(plugin)
-                        self.all_plugins.append(plugin)
-                    else:
-                        for channel in channels:
-                            channel_configs = channel_db_configs.get(channel, {})
-                            plugin = self._load_plugin(
-                                PluginClass, channel_configs, channel, requestor_getter
-                            )
-                            self.plugins_per_channel[channel.slug].append(plugin)
-                            self.all_plugins.append(plugin)
-
-            for channel in channels:
-                self.plugins_per_channel[channel.slug].extend(self.global_plugins)
-
     def _get_db_plugin_configs(self):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
             qs = (
@@ -158,6 +187,128 @@ class PluginsManager(PaymentInterface):
                     ] = db_plugin_config
             return global_configs, channel_configs
 
+    def get_plugins_implementing_method(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> List["BasePlugin"]:
+        """Return plugins that implement the method with the given name.
+
+        Plugins implement only a few of the available methods, so the list is
+        computed once per method and channel and shared by all managers using the
+        registry.
+        """
+        key = (channel_slug, method_name)
+        plugins = self._plugins_by_method.get(key)
+        if plugins is None:
+            channel_plugins = (
+                self.plugins_per_channel[channel_slug]
+                if channel_slug
+                else self.all_plugins
+            )
+            plugins = [
+                plugin
+                for plugin in channel_plugins
+                if getattr(plugin, method_name, NotImplemented) != NotImplemented
+            ]
+            self._plugins_by_method[key] = plugins
+        return plugins
+
+    def is_expired(self, version: Optional[str]) -> bool:
+        return (
+            self.version != version
+            or time.monotonic() - self.created_at >= settings.PLUGINS_REGISTRY_TIMEOUT
+        )
+
+
+_plugins_registries: Dict[Tuple[str, ...], PluginsRegistry] = {}
+_plugins_registries_lock = threading.Lock()
+
+
+def invalidate_plugins_registry():
+    """Make all workers reload plugins on the next request."""
+    cache.set(PLUGINS_REGISTRY_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def get_plugins_registry(plugins: List[str]) -> Optional[PluginsRegistry]:
+    """Return the worker's registry of the given plugins.
+
+    The registry is reloaded when it's older than PLUGINS_REGISTRY_TIMEOUT or when
+    it was invalidated by a change of plugin configurations or channels.
+    """
+    if not settings.PLUGINS_REGISTRY_TIMEOUT:
+        return None
+    key = tuple(plugins)
+    version = cache.get(PLUGINS_REGISTRY_VERSION_KEY)
+    registry = _plugins_registries.get(key)
+    if registry is not None and not registry.is_expired(version):
+        return registry
+
+    with _plugins_registries_lock:
+        registry = _plugins_registries.get(key)
+        if registry is None or registry.is_expired(version):
+            with opentracing.global_tracer().start_active_span("load_plugins"):
+                registry = PluginsRegistry(plugins, version=version)
+            _plugins_registries[key] = registry
+    return registry
+
+
+class PluginsManager(PaymentInterface):
+    """Base manager for handling plugins logic."""
+
+    plugins_per_channel: Dict[str, List["BasePlugin"]] = {}
+    global_plugins: List["BasePlugin"] = []
+    all_plugins: List["BasePlugin"] = []
+
+    def __init__(self, plugins: List[str], requestor_getter=None):
+        with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
+            self._plugins_by_method: Dict[
+                Tuple[Optional[str], str], List["BasePlugin"]
+            ] = {}
+            self._bound_plugins: Optional[Dict[int, "BasePlugin"]] = None
+            registry = get_plugins_registry(plugins)
+            if registry is None:
+                registry = PluginsRegistry(plugins, requestor_getter)
+                self.all_plugins = registry.all_plugins
+                self.global_plugins = registry.global_plugins
+                self.plugins_per_channel = registry.plugins_per_channel
+            else:
+                self._bind_plugins(registry, requestor_getter)
+            self._registry = registry
+
+    def _bind_plugins(self, registry: PluginsRegistry, requestor_getter=None):
+        """Use new instances of the registry plugins bound to the requestor."""
+        self._bound_plugins = bound_plugins = {
+            id(plugin): registry.create_plugin(plugin, requestor_getter)
+            for plugin in registry.all_plugins
+        }
+        self.all_plugins = [bound_plugins[id(p)] for p in registry.all_plugins]
+        self.global_plugins = [bound_plugins[id(p)] for p in registry.global_plugins]
+        self.plugins_per_channel = defaultdict(list)
+        for channel_slug, plugins in registry.plugins_per_channel.items():
+            self.plugins_per_channel[channel_slug] = [
+                bound_plugins[id(p)] for p in plugins
+            ]
+
+    def _get_plugins_implementing_method(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> List["BasePlugin"]:
+        """Return active plugins that implement the method with the given name.
+
+        The plugins are taken from the registry and replaced with the instances
+        bound to the requestor of this manager.
+        """
+        key = (channel_slug, method_name)
+        plugins = self._plugins_by_method.get(key)
+        if plugins is None:
+            plugins = self._registry.get_plugins_implementing_method(
+                method_name, channel_slug
+            )
+            if self._bound_plugins is not None:
+                bound_plugins = self._bound_plugins
+                plugins = [bound_plugins[id(plugin)] for plugin in plugins]
+            plugins = [plugin for plugin in plugins if plugin.active]
+            self._plugins_by_method[key] = plugins
+        return plugins
+
     def __run_method_on_plugins(
         self,
         method_name: str,
@@ -168,7 +319,7 @@ class PluginsManager(PaymentInterface):
     ):
         """Try to run a method with the given name on each declared active plugin."""
         value = default_value
-        plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+        plugins = self._get_plugins_implementing_method(method_name, channel_slug)
         for plugin in plugins:
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
@@ -550,6 +701,49 @@ class PluginsManager(PaymentInterface):
             price.currency,
         )
 
+    def apply_taxes_to_products(
+        self,
+        products_prices: List[Tuple["Product", Money, Country]],
+        channel_slug: str,
+    ) -> List[TaxedMoney]:
+        """Apply taxes to many product prices with a single call of each plugin.
+
+        `apply_taxes_to_products` is an optional batch version of
+        `apply_taxes_to_product`. Plugins that don't implement it are run for each
+        price.
+        """
+        values = [
+            quantize_price(TaxedMoney(net=price, gross=price), price.currency)
+            for _, price, _ in products_prices
+        ]
+        bulk_plugins = self._get_plugins_implementing_method(
+            "apply_taxes_to_products", channel_slug
+        )
+        plugins = self._get_plugins_implementing_method(
+            "apply_taxes_to_product", channel_slug
+        )
+        for plugin in plugins:
+            if plugin in bulk_plugins:
+                values = self.__run_method_on_single_plugin(
+                    plugin, "apply_taxes_to_products", values, products_prices
+                )
+            else:
+                values = [
+                    self.__run_method_on_single_plugin(
+                        plugin,
+                        "apply_taxes_to_product",
+                        value,
+                        product,
+                        price,
+                        country,
+                    )
+                    for (product, price, country), value in zip(products_prices, values)
+                ]
+        return [
+            quantize_price(value, price.currency)
+            for (_, price, _), value in zip(products_prices, values)
+        ]
+
     def preprocess_order_creation(
         self,
         checkout_info: "CheckoutInfo",
@@ -1338,6 +1532,8 @@ class PluginsManager(PaymentInterface):
                 configuration.description = plugin.PLUGIN_DESCRIPTION
                 plugin.active = configuration.active
                 plugin.configuration = configuration.configuration
+                self._plugins_by_method.clear()
+                transaction.on_commit(invalidate_plugins_registry)
                 return configuration
 
     def get_plugin(
@@ -1523,11 +1719,8 @@ class PluginsManager(PaymentInterface):
         self, event: str, channel_slug: Optional[str] = None
     ) -> bool:
         """Check if any plugin supports defined event."""
-        plugins = (
-            self.plugins_per_channel[channel_slug] if channel_slug else self.all_plugins
-        )
-        only_active_plugins = [plugin for plugin in plugins if plugin.active]
-        return any([plugin.is_event_active(event) for plugin in only_active_plugins])
+        plugins = self._get_plugins_implementing_method(event, channel_slug)
+        return any(plugin.is_event_active(event) for plugin in plugins)
 
 
 def get_plugins_manager(
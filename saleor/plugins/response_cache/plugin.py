@@ -0,0 +1,154 @@
+from typing import TYPE_CHECKING, Any, DefaultDict, List, Set
+
+import graphene
+
+from ...graphql.response_cache import get_list_tag, get_type_tag, invalidate_cache_tags
+from ..base_plugin import BasePlugin
+
+if TYPE_CHECKING:
+    from ...discount.models import Sale
+    from ...menu.models import Menu, MenuItem
+    from ...page.models import Page
+    from ...product.models import Category, Collection, Product, ProductVariant
+    from ...warehouse.models import Stock
+
+
+def _get_tags(type_name: str, pk) -> List[str]:
+    return [graphene.Node.to_global_id(type_name, pk), get_list_tag(type_name)]
+
+
+class ResponseCachePlugin(BasePlugin):
+    """Invalidate cached GraphQL responses containing the changed objects."""
+
+    PLUGIN_ID = "saleor.response_cache"
+    PLUGIN_NAME = "Response cache"
+    PLUGIN_DESCRIPTION = "Built-in saleor plugin that invalidates cached responses."
+    DEFAULT_ACTIVE = True
+    CONFIGURATION_PER_CHANNEL = False
+    HIDDEN = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = True
+
+    def category_created(self, category: "Category", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Category", category.pk))
+
+    def category_updated(self, category: "Category", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Category", category.pk))
+
+    def category_deleted(self, category: "Category", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Category", category.pk))
+
+    def collection_created(self, collection: "Collection", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Collection", collection.pk))
+
+    def collection_updated(self, collection: "Collection", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Collection", collection.pk))
+
+    def collection_deleted(self, collection: "Collection", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Collection", collection.pk))
+
+    def menu_created(self, menu: "Menu", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Menu", menu.pk))
+
+    def menu_updated(self, menu: "Menu", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Menu", menu.pk))
+
+    def menu_deleted(self, menu: "Menu", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Menu", menu.pk))
+
+    def menu_item_created(self, menu_item: "MenuItem", previous_value: Any) -> Any:
+        invalidate_cache_tags(
+            _get_tags("MenuItem", menu_item.pk) + _get_tags("Menu", menu_item.menu_id)
+        )
+
+    def menu_item_updated(self, menu_item: "MenuItem", previous_value: Any) -> Any:
+        invalidate_cache_tags(
+            _get_tags("MenuItem", menu_item.pk) + _get_tags("Menu", menu_item.menu_id)
+        )
+
+    def menu_item_deleted(self, menu_item: "MenuItem", previous_value: Any) -> Any:
+        invalidate_cache_tags(
+            _get_tags("MenuItem", menu_item.pk) + _get_tags("Menu", menu_item.menu_id)
+        )
+
+    def page_created(self, page: "Page", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Page", page.pk))
+
+    def page_updated(self, page: "Page", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Page", page.pk))
+
+    def page_deleted(self, page: "Page", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Page", page.pk))
+
+    def product_created(self, product: "Product", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Product", product.pk))
+
+    def product_updated(self, product: "Product", previous_value: Any) -> Any:
+        invalidate_cache_tags(_get_tags("Product", product.pk))
+
+    def product_deleted(
+        self, product: "Product", variants: List[int], previous_value: Any
+    ) -> Any:
+        tags = _get_tags("Product", product.pk)
+        for variant_id in variants:
+            tags.extend(_get_tags("ProductVariant", variant_id))
+        invalidate_cache_tags(tags)
+
+    def product_variant_created(
+        self, product_variant: "ProductVariant", previous_value: Any
+    ) -> Any:
+        self._invalidate_variant(product_variant)
+
+    def product_variant_updated(
+        self, product_variant: "ProductVariant", previous_value: Any
+    ) -> Any:
+        self._invalidate_variant(product_variant)
+
+    def product_variant_deleted(
+        self, product_variant: "ProductVariant", previous_value: Any
+    ) -> Any:
+        self._invalidate_variant(product_variant)
+
+    def product_variant_out_of_stock(self, stock: "Stock", previous_value: Any) -> Any:
+        self._invalidate_variant(stock.product_variant)
+
+    def product_variant_back_in_stock(self, stock: "Stock", previous_value: Any) -> Any:
+        self._invalidate_variant(stock.product_variant)
+
+    def sale_created(
+        self,
+        sale: "Sale",
+        current_catalogue: DefaultDict[str, Set[str]],
+        previous_value: Any,
+    ) -> Any:
+        self._invalidate_prices()
+
+    def sale_updated(
+        self,
+        sale: "Sale",
+        previous_catalogue: DefaultDict[str, Set[str]],
+        current_catalogue: DefaultDict[str, Set[str]],
+        previous_value: Any,
+    ) -> Any:
+        self._invalidate_prices()
+
+    def sale_deleted(
+        self,
+        sale: "Sale",
+        previous_catalogue: DefaultDict[str, Set[str]],
+        previous_value: Any,
+    ) -> Any:
+        self._invalidate_prices()
+
+    def _invalidate_variant(self, product_variant: "ProductVariant"):
+        invalidate_cache_tags(
+            _get_tags("ProductVariant", product_variant.pk)
+            + _get_tags("Product", product_variant.product_id)
+        )
+
+    def _invalidate_prices(self):
+        # Sales apply to whole categories and collections, so every response
+        # containing product prices is invalidated.
+        invalidate_cache_tags([get_type_tag("Product"), get_type_tag("ProductVariant")])
@@ -16,7 +16,7 @@ from ...graphql.discount.mutations.utils import convert_catalogue_info_to_global
 from ...payment.interface import PaymentGateway
 from ...product.models import Product
 from ..base_plugin import ExternalAccessTokens
-from ..manager import PluginsManager, get_plugins_manager
+from ..manager import PluginsManager, get_plugins_manager, invalidate_plugins_registry
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
     ACTIVE_PLUGINS,
@@ -86,6 +86,94 @@ def test_manager_with_channel_plugins(
     assert len(manager.all_plugins) == 2
 
 
+def test_manager_reuses_plugins_registry(
+    settings, channel_USD, channel_PLN, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS_REGISTRY_TIMEOUT = 60
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    invalidate_plugins_registry()
+    manager = get_plugins_manager()
+
+    # when
+    with django_assert_num_queries(0):
+        other_manager = get_plugins_manager(lambda: None)
+
+    # then
+    assert len(other_manager.all_plugins) == len(manager.all_plugins) == 3
+    assert set(other_manager.plugins_per_channel.keys()) == {
+        channel_PLN.slug,
+        channel_USD.slug,
+    }
+    for plugin, other_plugin in zip(manager.all_plugins, other_manager.all_plugins):
+        assert type(plugin) == type(other_plugin)
+        assert plugin is not other_plugin
+        assert plugin.requestor is None
+        assert other_plugin.requestor is not None
+    assert (
+        other_manager.global_plugins[0]
+        in other_manager.plugins_per_channel[channel_USD.slug]
+    )
+
+
+def test_manager_doesnt_share_plugin_state_with_other_managers(settings, channel_USD):
+    # given
+    settings.PLUGINS_REGISTRY_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    invalidate_plugins_registry()
+    manager = get_plugins_manager()
+    manager.all_plugins[0].request_state = "value"
+
+    # when
+    other_manager = get_plugins_manager()
+
+    # then
+    assert not hasattr(other_manager.all_plugins[0], "request_state")
+
+
+def test_manager_reloads_plugins_registry_after_invalidation(
+    settings, channel_USD, channel_PLN
+):
+    # given
+    settings.PLUGINS_REGISTRY_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    invalidate_plugins_registry()
+    get_plugins_manager()
+    channel_PLN.delete()
+
+    # when
+    invalidate_plugins_registry()
+    manager = get_plugins_manager()
+
+    # then
+    assert set(manager.plugins_per_channel.keys()) == {channel_USD.slug}
+    assert len(manager.all_plugins) == 1
+
+
+def test_save_plugin_configuration_invalidates_plugins_registry(
+    settings, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PLUGINS_REGISTRY_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    invalidate_plugins_registry()
+    manager = get_plugins_manager()
+    assert manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        manager.save_plugin_configuration(
+            PluginSample.PLUGIN_ID, None, {"active": False}
+        )
+
+    # then
+    manager = get_plugins_manager()
+    assert not manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+
 def test_manager_get_plugins_with_channel_slug(
     settings, channel_USD, plugin_configuration, inactive_plugin_configuration
 ):
@@ -558,6 +646,24 @@ def test_manager_apply_taxes_to_product(product, plugins, price, channel_USD):
     assert TaxedMoney(expected_price, expected_price) == taxed_price
 
 
+@pytest.mark.parametrize(
+    "plugins, price",
+    [(["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0"), ([], "10.0")],
+)
+def test_manager_apply_taxes_to_products(product, plugins, price, channel_USD):
+    # given
+    country = Country("PL")
+    expected_price = Money(price, "USD")
+
+    # when
+    taxed_prices = PluginsManager(plugins=plugins).apply_taxes_to_products(
+        [(product, Money("10.0", "USD"), country)] * 2, channel_USD.slug
+    )
+
+    # then
+    assert taxed_prices == [TaxedMoney(expected_price, expected_price)] * 2
+
+
 def test_manager_sale_created(sale):
     plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
 
@@ -971,7 +1077,7 @@ def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name="get_supported_currencies",
         default_value="default_value",
     )
     active_plugins_count = len(ACTIVE_PLUGINS)
@@ -981,14 +1087,90 @@ def test_run_method_on_plugins_only_on_active_ones(
         len([p for p in all_plugins_manager.all_plugins if p.active])
         == active_plugins_count
     )
-    assert mocked_method.call_count == active_plugins_count
+    assert mocked_method.call_count == 2
 
     called_plugins_id = [arg.args[0].PLUGIN_ID for arg in mocked_method.call_args_list]
-    expected_active_plugins_id = [p.PLUGIN_ID for p in ACTIVE_PLUGINS]
+    expected_active_plugins_id = [
+        ActivePaymentGateway.PLUGIN_ID,
+        ActiveDummyPaymentGateway.PLUGIN_ID,
+    ]
 
     assert called_plugins_id == expected_active_plugins_id
 
 
+@mock.patch(
+    "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
+)
+def test_run_method_on_plugins_skips_plugins_not_implementing_method(
+    mocked_method, channel_USD, all_plugins_manager
+):
+    value = all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="test_method_name",
+        default_value="default_value",
+    )
+
+    assert value == "default_value"
+    mocked_method.assert_not_called()
+
+
+def test_get_plugins_implementing_method_is_computed_once(
+    channel_USD, all_plugins_manager
+):
+    # given
+    plugins = all_plugins_manager._get_plugins_implementing_method(
+        "get_supported_currencies", channel_USD.slug
+    )
+
+    # when
+    with mock.patch.object(all_plugins_manager, "get_plugins") as mocked_get_plugins:
+        cached_plugins = all_plugins_manager._get_plugins_implementing_method(
+            "get_supported_currencies", channel_USD.slug
+        )
+
+    # then
+    mocked_get_plugins.assert_not_called()
+    assert cached_plugins is plugins
+    assert [type(plugin) for plugin in plugins] == [
+        ActivePaymentGateway,
+        ActiveDummyPaymentGateway,
+    ]
+
+
+def test_plugins_implementing_method_shared_by_managers_of_registry(
+    settings, channel_USD
+):
+    # given
+    settings.PLUGINS_REGISTRY_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    invalidate_plugins_registry()
+    manager = get_plugins_manager()
+    manager._get_plugins_implementing_method("authenticate_user")
+
+    # when
+    other_manager = get_plugins_manager(lambda: None)
+    with mock.patch.object(PluginSample, "authenticate_user", NotImplemented):
+        plugins = other_manager._get_plugins_implementing_method("authenticate_user")
+
+    # then
+    assert plugins == other_manager.all_plugins
+    assert plugins[0] is not manager.all_plugins[0]
+
+
+def test_save_plugin_configuration_resets_plugins_implementing_method(
+    settings, channel_USD
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = get_plugins_manager()
+    assert manager._get_plugins_implementing_method("authenticate_user")
+
+    # when
+    manager.save_plugin_configuration(PluginSample.PLUGIN_ID, None, {"active": False})
+
+    # then
+    assert not manager._get_plugins_implementing_method("authenticate_user")
+
+
 def test_run_method_on_single_plugin_method_does_not_exist(plugins_manager):
     default_value = "default_value"
     method_name = "method_does_not_exist"
@@ -1,11 +1,14 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Optional
+import datetime
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
+from django_prices_vatlayer.models import VAT
 from django_prices_vatlayer.utils import get_tax_for_rate, get_tax_rates_for_country
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...checkout import base_calculations
 from ...core.prices import quantize_price
+from ...core.snapshots import Snapshot, VersionedSnapshot
 from ...core.taxes import charge_taxes_on_shipping, include_taxes_in_prices, zero_money
 from ...discount import VoucherType
 
@@ -55,8 +58,61 @@ def apply_tax_to_price(taxes, rate_name, base):
     return tax_to_apply(base, keep_gross=keep_gross)
 
 
+@dataclass
+class TaxRatesIndex(Snapshot):
+    """Vatlayer tax rates of all countries, used to apply taxes without queries."""
+
+    tax_rates: Dict[str, dict]
+    _taxes: Dict[str, Optional[dict]] = field(default_factory=dict, repr=False)
+
+    def get_taxes(self, country_code: str) -> Optional[dict]:
+        if country_code not in self._taxes:
+            self._taxes[country_code] = _get_taxes_for_rates(
+                self.tax_rates.get(country_code)
+            )
+        return self._taxes[country_code]
+
+
+def _build_tax_rates_index(
+    version: str, created_at: datetime.datetime
+) -> TaxRatesIndex:
+    return TaxRatesIndex(
+        version=version,
+        created_at=created_at,
+        tax_rates=dict(VAT.objects.values_list("country_code", "data")),
+    )
+
+
+_tax_rates_index: VersionedSnapshot[TaxRatesIndex] = VersionedSnapshot(
+    "vatlayer-tax-rates-index",
+    "VATLAYER_TAX_RATES_INDEX_TIMEOUT",
+    _build_tax_rates_index,
+    share_through_cache=False,
+)
+
+
+def invalidate_tax_rates_index():
+    """Force reloading the tax rates index in all workers."""
+    _tax_rates_index.invalidate()
+
+
+def get_tax_rates_index() -> Optional[TaxRatesIndex]:
+    """Return the index of tax rates.
+
+    The index is loaded once and kept in the worker memory. It's reloaded when it
+    expires or when its version is changed by `invalidate_tax_rates_index`.
+    """
+    return _tax_rates_index.get()
+
+
 def get_taxes_for_country(country):
-    tax_rates = get_tax_rates_for_country(country.code)
+    index = get_tax_rates_index()
+    if index is not None:
+        return index.get_taxes(country.code)
+    return _get_taxes_for_rates(get_tax_rates_for_country(country.code))
+
+
+def _get_taxes_for_rates(tax_rates):
     if tax_rates is None:
         return None
 
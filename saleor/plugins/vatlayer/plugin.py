@@ -1,11 +1,23 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import opentracing
 import opentracing.tags
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django_countries import countries
 from django_countries.fields import Country
 from django_prices_vatlayer.utils import (
@@ -15,7 +27,7 @@ from django_prices_vatlayer.utils import (
 )
 from prices import Money, TaxedMoney, TaxedMoneyRange
 
-from ...checkout import base_calculations, calculations
+from ...checkout import base_calculations
 from ...checkout.interface import CheckoutTaxedPricesData
 from ...core.prices import quantize_price
 from ...core.taxes import TaxType, zero_money, zero_taxed_money
@@ -36,6 +48,7 @@ from . import (
     apply_tax_to_price,
     get_taxed_shipping_price,
     get_taxes_for_country,
+    invalidate_tax_rates_index,
 )
 
 if TYPE_CHECKING:
@@ -44,6 +57,7 @@ if TYPE_CHECKING:
     from ...channel.models import Channel
     from ...checkout.fetch import CheckoutInfo, CheckoutLineInfo
     from ...checkout.models import Checkout
+    from ...core.middleware import Requestor
     from ...discount import DiscountInfo
     from ...order.models import Order, OrderLine
     from ...product.models import (
@@ -180,19 +194,13 @@ class VatlayerPlugin(BasePlugin):
         if self._skip_plugin(previous_value):
             return previous_value
 
+        # The manager is used directly, as `checkout.calculations` would read the
+        # stored checkout prices that are being calculated.
         manager = get_plugins_manager()
-        return calculations.checkout_subtotal(
-            manager=manager,
-            checkout_info=checkout_info,
-            lines=lines,
-            address=address,
-            discounts=discounts,
-        ) + calculations.checkout_shipping_price(
-            manager=manager,
-            checkout_info=checkout_info,
-            lines=lines,
-            address=address,
-            discounts=discounts,
+        return manager.calculate_checkout_subtotal(
+            checkout_info, lines, address, discounts
+        ) + manager.calculate_checkout_shipping(
+            checkout_info, lines, address, discounts
         )
 
     def _get_taxes_for_country(self, country: Country):
@@ -546,6 +554,28 @@ class VatlayerPlugin(BasePlugin):
             return previous_value
         return self.__apply_taxes_to_product(product, price, country)
 
+    def apply_taxes_to_products(
+        self,
+        products_prices: List[Tuple["Product", Money, Country]],
+        previous_value: List[TaxedMoney],
+    ) -> List[TaxedMoney]:
+        if not self.active or not self.config.access_key:
+            return previous_value
+
+        # the prices of a product are usually given together, e.g. as a price range
+        tax_data: Dict[Tuple[int, Country], Tuple[Any, Optional[str]]] = {}
+        taxed_prices = []
+        for (product, price, country), value in zip(products_prices, previous_value):
+            if self._skip_plugin(value):
+                taxed_prices.append(value)
+                continue
+            key = (product.pk, country)
+            if key not in tax_data:
+                tax_data[key] = self.__get_tax_data_for_product(product, country)
+            taxes, tax_rate = tax_data[key]
+            taxed_prices.append(apply_tax_to_price(taxes, tax_rate, price))
+        return taxed_prices
+
     def __apply_taxes_to_product(
         self, product: "Product", price: Money, country: Country
     ):
@@ -629,6 +659,7 @@ class VatlayerPlugin(BasePlugin):
             span.set_tag(opentracing.tags.COMPONENT, "tax")
             span.set_tag("service.name", "vatlayer")
             fetch_rates(self.config.access_key)
+        transaction.on_commit(invalidate_tax_rates_index)
         return True
 
     @classmethod
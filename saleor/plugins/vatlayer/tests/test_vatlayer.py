@@ -5,6 +5,7 @@ import pytest
 from django.core.exceptions import ValidationError
 from django.test import override_settings
 from django_countries.fields import Country
+from django_prices_vatlayer.models import VAT
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ....checkout import calculations
@@ -22,6 +23,7 @@ from ...vatlayer import (
     get_tax_rate_by_name,
     get_taxed_shipping_price,
     get_taxes_for_country,
+    invalidate_tax_rates_index,
 )
 from ..plugin import VatlayerPlugin
 
@@ -101,6 +103,22 @@ def test_get_taxes_for_country(vatlayer, compare_taxes):
     compare_taxes(taxes, vatlayer)
 
 
+def test_get_taxes_for_country_uses_tax_rates_index(vatlayer, compare_taxes, settings):
+    # given
+    settings.VATLAYER_TAX_RATES_INDEX_TIMEOUT = 60
+    invalidate_tax_rates_index()
+    get_taxes_for_country(Country("PL"))
+    VAT.objects.all().delete()
+
+    # when
+    taxes = get_taxes_for_country(Country("PL"))
+
+    # then
+    compare_taxes(taxes, vatlayer)
+    invalidate_tax_rates_index()
+    assert get_taxes_for_country(Country("PL")) is None
+
+
 def test_apply_tax_to_price_do_not_include_tax(site_settings, taxes):
     site_settings.include_taxes_in_prices = False
     site_settings.save()
@@ -1409,6 +1427,34 @@ def test_apply_taxes_to_product_uses_taxes_from_product_type(
     assert price == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5.00", "USD"))
 
 
+def test_apply_taxes_to_products(
+    vatlayer, settings, product_with_two_variants, channel_USD
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.vatlayer.plugin.VatlayerPlugin"]
+    manager = get_plugins_manager()
+    product = product_with_two_variants
+    product.metadata = {
+        "vatlayer.code": "standard",
+        "vatlayer.description": "standard",
+    }
+    products_prices = [
+        (product, Money("5.00", "USD"), Country("PL")),
+        (product, Money("10.00", "USD"), Country("PL")),
+        (product, Money("10.00", "USD"), Country("US")),
+    ]
+
+    # when
+    prices = manager.apply_taxes_to_products(products_prices, channel_USD.slug)
+
+    # then
+    assert prices == [
+        manager.apply_taxes_to_product(product, price, country, channel_USD.slug)
+        for product, price, country in products_prices
+    ]
+    assert prices[0] == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5.00", "USD"))
+
+
 def test_calculations_checkout_total_with_vatlayer(
     vatlayer, settings, checkout_with_item
 ):
@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+
+from ...warehouse.utils import invalidate_warehouses_map
+from ..base_plugin import BasePlugin
+
+if TYPE_CHECKING:
+    from ...channel.models import Channel
+    from ...shipping.models import ShippingZone
+    from ...warehouse.models import Warehouse
+
+
+class WarehousesMapPlugin(BasePlugin):
+    """Rebuild the map of warehouses serving countries when it could change."""
+
+    PLUGIN_ID = "saleor.warehouses_map"
+    PLUGIN_NAME = "Warehouses map"
+    PLUGIN_DESCRIPTION = "Built-in saleor plugin that invalidates the warehouses map."
+    DEFAULT_ACTIVE = True
+    CONFIGURATION_PER_CHANNEL = False
+    HIDDEN = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = True
+
+    def channel_created(self, channel: "Channel", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def channel_updated(self, channel: "Channel", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def channel_deleted(self, channel: "Channel", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def shipping_zone_created(
+        self, shipping_zone: "ShippingZone", previous_value: Any
+    ) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def shipping_zone_updated(
+        self, shipping_zone: "ShippingZone", previous_value: Any
+    ) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def shipping_zone_deleted(
+        self, shipping_zone: "ShippingZone", previous_value: Any
+    ) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def warehouse_created(self, warehouse: "Warehouse", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def warehouse_updated(self, warehouse: "Warehouse", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
+
+    def warehouse_deleted(self, warehouse: "Warehouse", previous_value: Any) -> Any:
+        transaction.on_commit(invalidate_warehouses_map)
@@ -1,9 +1,26 @@
 import json
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import timedelta
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 from urllib.parse import unquote, urlparse, urlunparse
 
 import boto3
@@ -13,7 +30,9 @@ from celery import group
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.utils import timezone
 from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
@@ -22,6 +41,7 @@ from ...core.models import EventDelivery, EventPayload
 from ...core.tracing import webhooks_opentracing_trace
 from ...graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
+    get_subscription_query_hash,
     initialize_request,
 )
 from ...payment import PaymentError
@@ -84,24 +104,41 @@ def create_deliveries_for_subscriptions(
         )
         return []
 
+    # All webhooks share a single request, so the dataloaders' cache is reused
+    # between their subscription queries. Payloads depend on the app receiving them
+    # (e.g. its permissions), so they are only reused between webhooks of the same
+    # app subscribed with the same query.
+    request = initialize_request(requestor)
+    payloads_by_query: Dict[Tuple[str, Optional[int]], Optional[EventPayload]] = {}
     event_payloads = []
     event_deliveries = []
     for webhook in webhooks:
-        data = generate_payload_from_subscription(
-            event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
-            request=initialize_request(requestor),
-            app=webhook.app,
+        payload_key = (
+            get_subscription_query_hash(webhook.subscription_query),
+            webhook.app_id,
         )
-        if not data:
+        if payload_key in payloads_by_query:
+            event_payload = payloads_by_query[payload_key]
+        else:
+            data = generate_payload_from_subscription(
+                event_type=event_type,
+                subscribable_object=subscribable_object,
+                subscription_query=webhook.subscription_query,
+                request=request,
+                app=webhook.app,
+            )
+            event_payload = None
+            if data:
+                event_payload = EventPayload(payload=json.dumps({**data}))
+                event_payloads.append(event_payload)
+            payloads_by_query[payload_key] = event_payload
+
+        if not event_payload:
             logger.warning(
                 "No payload was generated with subscription for event: %s" % event_type
             )
             continue
 
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
         event_deliveries.append(
             EventDelivery(
                 status=EventDeliveryStatus.PENDING,
@@ -148,8 +185,15 @@ def trigger_webhooks_async(
             )
         )
 
-    for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+    batch_size = settings.WEBHOOK_BATCH_SIZE
+    if len(deliveries) > 1 and batch_size > 1:
+        delivery_ids = [delivery.id for delivery in deliveries]
+        for start in range(0, len(delivery_ids), batch_size):
+            end = start + batch_size
+            send_webhook_requests_async.delay(delivery_ids[start:end])
+    else:
+        for delivery in deliveries:
+            send_webhook_request_async.delay(delivery.id)
 
 
 def group_webhooks_by_subscription(webhooks):
@@ -180,6 +224,33 @@ def trigger_webhook_sync(
     return send_webhook_request_sync(app.name, delivery, **kwargs)
 
 
+_http_sessions: Dict[Tuple[str, str], requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(target_url: str) -> requests.Session:
+    """Return the worker's session keeping alive connections to the URL's host."""
+    parts = urlparse(target_url)
+    key = (parts.scheme.lower(), parts.netloc.lower())
+    session = _http_sessions.get(key)
+    if session is None:
+        with _http_sessions_lock:
+            session = _http_sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                # Webhook requests are independent, cookies set by one response
+                # must not be sent with the next requests.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.WEBHOOK_MAX_CONNECTIONS_PER_HOST,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_sessions[key] = session
+    return session
+
+
 def send_webhook_using_http(
     target_url, message, domain, signature, event_type, timeout=WEBHOOK_TIMEOUT
 ):
@@ -205,7 +276,8 @@ def send_webhook_using_http(
         "Saleor-Signature": signature,
     }
 
-    response = requests.post(target_url, data=message, headers=headers, timeout=timeout)
+    session = get_http_session(target_url)
+    response = session.post(target_url, data=message, headers=headers, timeout=timeout)
     return WebhookResponse(
         content=response.text,
         request_headers=headers,
@@ -218,25 +290,70 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+# Maximum number of messages accepted by a single SQS SendMessageBatch call.
+SQS_MAX_BATCH_SIZE = 10
+# Maximum total size of the messages sent in a single SQS SendMessageBatch call.
+SQS_MAX_BATCH_BYTES = 256 * 1024
+
+_transport_clients: Dict[Tuple[str, ...], Any] = {}
+_transport_clients_lock = threading.Lock()
+
+
+def _get_transport_client(key: Tuple[str, ...], create_client: Callable[[], Any]):
+    client = _transport_clients.get(key)
+    if client is None:
+        # creating clients is not thread-safe
+        with _transport_clients_lock:
+            client = _transport_clients.get(key)
+            if client is None:
+                client = create_client()
+                _transport_clients[key] = client
+    return client
+
+
+def clear_transport_clients():
+    _transport_clients.clear()
+
+
+def get_sqs_client(region, access_key_id, secret_access_key):
+    """Return the worker's SQS client for the given region and credentials."""
+    return _get_transport_client(
+        (WebhookSchemes.AWS_SQS, region, access_key_id or "", secret_access_key or ""),
+        lambda: boto3.client(
+            "sqs",
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+        ),
+    )
+
+
+def get_pubsub_publisher():
+    """Return the worker's Pub/Sub publisher client."""
+    return _get_transport_client(
+        (WebhookSchemes.GOOGLE_CLOUD_PUBSUB,), lambda: pubsub_v1.PublisherClient()
+    )
+
+
+def _get_sqs_queue(target_url):
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=(
-            unquote(parts.password) if parts.password else parts.password
-        ),
+    client = get_sqs_client(
+        region,
+        parts.username,
+        unquote(parts.password) if parts.password else parts.password,
     )
     queue_url = urlunparse(
         ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
     )
     is_fifo = parts.path.endswith(".fifo")
+    return client, queue_url, is_fifo
 
+
+def _get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo):
     msg_attributes = {
         "SaleorDomain": {"DataType": "String", "StringValue": domain},
         "EventType": {"DataType": "String", "StringValue": event_type},
@@ -245,22 +362,102 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
         msg_attributes["Signature"] = {"DataType": "String", "StringValue": signature}
 
     message_kwargs = {
-        "QueueUrl": queue_url,
         "MessageAttributes": msg_attributes,
         "MessageBody": message.decode("utf-8"),
     }
     if is_fifo:
         message_kwargs["MessageGroupId"] = domain
+    return message_kwargs
+
+
+def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+    client, queue_url, is_fifo = _get_sqs_queue(target_url)
+    message_kwargs = {
+        "QueueUrl": queue_url,
+        **_get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo),
+    }
     with catch_duration_time() as duration:
         response = client.send_message(**message_kwargs)
         return WebhookResponse(content=response, duration=duration())
 
 
+def _get_sqs_entry_size(entry) -> int:
+    size = len(entry["MessageBody"].encode("utf-8"))
+    for name, attribute in entry["MessageAttributes"].items():
+        size += len(name.encode("utf-8"))
+        size += len(attribute["DataType"].encode("utf-8"))
+        size += len(attribute["StringValue"].encode("utf-8"))
+    return size
+
+
+def _chunk_sqs_entries(entries) -> Iterator[List[Dict[str, Any]]]:
+    """Split entries into chunks within the SQS limits of a single batch request.
+
+    Entries larger than the size limit are sent alone and rejected by SQS.
+    """
+    chunk: List[Dict[str, Any]] = []
+    chunk_size = 0
+    for entry in entries:
+        entry_size = _get_sqs_entry_size(entry)
+        if chunk and (
+            len(chunk) == SQS_MAX_BATCH_SIZE
+            or chunk_size + entry_size > SQS_MAX_BATCH_BYTES
+        ):
+            yield chunk
+            chunk = []
+            chunk_size = 0
+        chunk.append(entry)
+        chunk_size += entry_size
+    if chunk:
+        yield chunk
+
+
+def send_webhooks_using_aws_sqs(target_url, messages, domain) -> List[WebhookResponse]:
+    """Send many messages to the same SQS queue using batch requests.
+
+    :param messages: List of (message, signature, event type) tuples.
+    """
+    client, queue_url, is_fifo = _get_sqs_queue(target_url)
+    entries = [
+        {
+            "Id": str(index),
+            **_get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo),
+        }
+        for index, (message, signature, event_type) in enumerate(messages)
+    ]
+    responses: List[WebhookResponse] = [
+        WebhookResponse(content="", status=EventDeliveryStatus.FAILED) for _ in messages
+    ]
+    for chunk in _chunk_sqs_entries(entries):
+        try:
+            with catch_duration_time() as duration:
+                response = client.send_message_batch(QueueUrl=queue_url, Entries=chunk)
+                response_duration = duration()
+        except ClientError as e:
+            # Only messages of this chunk failed, the other ones were delivered.
+            for entry in chunk:
+                responses[int(entry["Id"])] = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+            continue
+        for result in response.get("Successful", []):
+            responses[int(result["Id"])] = WebhookResponse(
+                content=result, duration=response_duration
+            )
+        for result in response.get("Failed", []):
+            responses[int(result["Id"])] = WebhookResponse(
+                content=result,
+                status=EventDeliveryStatus.FAILED,
+                duration=response_duration,
+            )
+    return responses
+
+
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_publisher()
     topic_name = parts.path[1:]  # drop the leading slash
     with catch_duration_time() as duration:
         future = client.publish(
@@ -275,6 +472,52 @@ def send_webhook_using_google_cloud_pubsub(
         return WebhookResponse(content=response, duration=response_duration)
 
 
+def send_webhooks_using_google_cloud_pubsub(
+    target_url, messages, domain
+) -> List[WebhookResponse]:
+    """Publish many messages to the same Pub/Sub topic.
+
+    All messages are published before waiting for the results, which lets the
+    publisher client send them in batches.
+
+    :param messages: List of (message, signature, event type) tuples.
+    """
+    parts = urlparse(target_url)
+    client = get_pubsub_publisher()
+    topic_name = parts.path[1:]  # drop the leading slash
+    futures: List[Any] = []
+    with catch_duration_time() as duration:
+        for message, signature, event_type in messages:
+            try:
+                future = client.publish(
+                    topic_name,
+                    message,
+                    saleorDomain=domain,
+                    eventType=event_type,
+                    signature=signature,
+                )
+            except Exception as e:
+                future = e
+            futures.append(future)
+        response_duration = duration()
+
+    responses = []
+    for future in futures:
+        try:
+            if isinstance(future, Exception):
+                raise future
+            response = WebhookResponse(
+                content=future.result(), duration=response_duration
+            )
+        except Exception as e:
+            # Any error fails only its own message, e.g. when the topic is missing.
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+        responses.append(response)
+    return responses
+
+
 def send_webhook_using_scheme_method(
     target_url, domain, secret, event_type, data
 ) -> WebhookResponse:
@@ -307,6 +550,157 @@ def send_webhook_using_scheme_method(
     raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
 
 
+def send_webhooks_using_scheme_method(
+    domain: str,
+    webhooks_data: List[Tuple[str, str, str, str]],
+    app_names: Optional[List[Optional[str]]] = None,
+) -> List[WebhookResponse]:
+    """Send many webhook requests concurrently.
+
+    Messages sent to the same SQS queue or Pub/Sub topic are sent in batches.
+
+    :param domain: Current site domain.
+    :param webhooks_data: List of (target URL, secret key, event type, payload)
+    tuples.
+    :param app_names: Names of the apps receiving the requests, used for tracing.
+
+    :return: List of WebhookResponse objects in the order of the requests.
+    """
+    batch_matrix: Dict[WebhookSchemes, Callable] = {
+        WebhookSchemes.AWS_SQS: send_webhooks_using_aws_sqs,
+        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: send_webhooks_using_google_cloud_pubsub,
+    }
+    responses: List[Optional[WebhookResponse]] = [None] * len(webhooks_data)
+    indexes_per_destination: DefaultDict[str, List[int]] = defaultdict(list)
+    for index, (target_url, *_) in enumerate(webhooks_data):
+        if urlparse(target_url).scheme.lower() in batch_matrix:
+            indexes_per_destination[target_url].append(index)
+
+    for target_url, indexes in indexes_per_destination.items():
+        if len(indexes) < 2:
+            continue
+        messages = []
+        for index in indexes:
+            _, secret_key, event_type, data = webhooks_data[index]
+            message = data.encode("utf-8")
+            signature = signature_for_payload(message, secret_key)
+            messages.append((message, signature, event_type))
+        send_method = batch_matrix[urlparse(target_url).scheme.lower()]
+        try:
+            with webhooks_opentracing_trace(
+                "batch", domain, app_name=app_names[indexes[0]] if app_names else None
+            ):
+                batch_responses = send_method(target_url, messages, domain)
+        except Exception as e:
+            # A failing destination mustn't abort the deliveries to other ones.
+            batch_responses = [
+                WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+                for _ in indexes
+            ]
+        for index, response in zip(indexes, batch_responses):
+            responses[index] = response
+
+    host_semaphores = {
+        urlparse(target_url).netloc.lower(): threading.BoundedSemaphore(
+            settings.WEBHOOK_MAX_CONNECTIONS_PER_HOST
+        )
+        for target_url, *_ in webhooks_data
+    }
+
+    def send(index):
+        target_url, secret_key, event_type, data = webhooks_data[index]
+        app_name = app_names[index] if app_names else None
+        with host_semaphores[urlparse(target_url).netloc.lower()]:
+            try:
+                with webhooks_opentracing_trace(event_type, domain, app_name=app_name):
+                    responses[index] = send_webhook_using_scheme_method(
+                        target_url, domain, secret_key, event_type, data
+                    )
+            except Exception as e:
+                # Failed deliveries are retried, unlike the ones left without
+                # a response when the whole batch is aborted.
+                responses[index] = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+
+    remaining_indexes = [i for i, response in enumerate(responses) if not response]
+    max_workers = min(settings.WEBHOOK_BATCH_MAX_WORKERS, len(remaining_indexes))
+    if max_workers <= 1:
+        for index in remaining_indexes:
+            send(index)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(send, remaining_indexes))
+    return cast(List[WebhookResponse], responses)
+
+
+@app.task(bind=True)
+def send_webhook_requests_async(self, event_delivery_ids):
+    """Send a batch of event deliveries concurrently from a single task.
+
+    Deliveries that fail are retried one by one by `send_webhook_request_async`,
+    counting the batched request as the first attempt.
+    """
+    deliveries = []
+    for delivery in EventDelivery.objects.select_related(
+        "payload", "webhook__app"
+    ).filter(id__in=event_delivery_ids):
+        if delivery.webhook.is_active:
+            deliveries.append(delivery)
+        else:
+            delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
+            logger.info("Event delivery id: %r webhook is disabled.", delivery.id)
+    if not deliveries:
+        return
+
+    domain = Site.objects.get_current().domain
+    attempts = [create_attempt(delivery, self.request.id) for delivery in deliveries]
+    responses = send_webhooks_using_scheme_method(
+        domain,
+        [
+            (
+                delivery.webhook.target_url,
+                delivery.webhook.secret_key,
+                delivery.event_type,
+                delivery.payload.payload,
+            )
+            for delivery in deliveries
+        ],
+        app_names=[delivery.webhook.app.name for delivery in deliveries],
+    )
+
+    retry_countdown = send_webhook_request_async.retry_backoff
+    for delivery, attempt, response in zip(deliveries, attempts, responses):
+        attempt_update(attempt, response)
+        if response.status == EventDeliveryStatus.FAILED:
+            task_logger.info(
+                "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                " Delivery attempt id: %r",
+                delivery.webhook.id,
+                delivery.webhook.target_url,
+                response.content,
+                delivery.event_type,
+                attempt.id,
+            )
+            send_webhook_request_async.apply_async(
+                (delivery.id,), countdown=retry_countdown, retries=1
+            )
+            next_retry = timezone.now() + timedelta(seconds=retry_countdown)
+            observability.report_event_delivery_attempt(attempt, next_retry)
+            continue
+
+        task_logger.info(
+            "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+            delivery.webhook.id,
+            delivery.webhook.target_url,
+            delivery.event_type,
+            delivery.id,
+        )
+        delivery_update(delivery, EventDeliveryStatus.SUCCESS)
+        observability.report_event_delivery_attempt(attempt)
+        clear_successful_delivery(delivery)
+
+
 @app.task(
     bind=True,
     retry_backoff=10,
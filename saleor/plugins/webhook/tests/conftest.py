@@ -9,11 +9,17 @@ from prices import Money
 from ....app.models import App
 from ....plugins.manager import get_plugins_manager
 from ....plugins.webhook.plugin import WebhookPlugin
+from ....plugins.webhook.tasks import clear_transport_clients
 from ....shipping.interface import ShippingMethodData
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
 
 
+@pytest.fixture(autouse=True)
+def clear_webhook_transport_clients():
+    clear_transport_clients()
+
+
 @pytest.fixture
 def webhook_plugin(settings):
     def factory() -> WebhookPlugin:
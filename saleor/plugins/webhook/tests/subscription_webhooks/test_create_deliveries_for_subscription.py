@@ -8,7 +8,10 @@ from freezegun import freeze_time
 
 from .....channel.models import Channel
 from .....giftcard.models import GiftCard
-from .....graphql.webhook.subscription_payload import validate_subscription_query
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_from_subscription,
+    validate_subscription_query,
+)
 from .....menu.models import Menu, MenuItem
 from .....product.models import Category
 from .....shipping.models import ShippingMethod, ShippingZone
@@ -1644,3 +1647,61 @@ def test_generate_payload_from_subscription_return_permission_errors_in_payload(
     assert payload["errors"][0]["extensions"]["exception"]["code"] == error_code
     assert len(deliveries) == len(webhooks)
     assert deliveries[0].webhook == webhooks[0]
+
+
+@patch(
+    "saleor.plugins.webhook.tasks.generate_payload_from_subscription",
+    wraps=generate_payload_from_subscription,
+)
+def test_create_deliveries_for_subscriptions_generates_payload_once_per_query(
+    mocked_generate_payload, order, subscription_webhook
+):
+    # given
+    query = subscription_queries.ORDER_UPDATED
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    webhooks = [
+        subscription_webhook(query, event_type),
+        subscription_webhook(" ".join(query.split()), event_type),
+    ]
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    mocked_generate_payload.assert_called_once()
+    assert len(deliveries) == len(webhooks)
+    assert deliveries[0].payload == deliveries[1].payload
+    assert json.loads(deliveries[0].payload.payload)["order"]["id"] == (
+        graphene.Node.to_global_id("Order", order.id)
+    )
+
+
+@patch(
+    "saleor.plugins.webhook.tasks.generate_payload_from_subscription",
+    wraps=generate_payload_from_subscription,
+)
+def test_create_deliveries_for_subscriptions_shares_request_between_apps(
+    mocked_generate_payload, order, subscription_order_updated_webhook, app
+):
+    # given
+    other_app_webhook = app.webhooks.create(
+        name="Other app subscription",
+        target_url="http://www.example.com/other",
+        subscription_query=subscription_queries.ORDER_UPDATED,
+    )
+    other_app_webhook.events.create(event_type=WebhookEventAsyncType.ORDER_UPDATED)
+    webhooks = [subscription_order_updated_webhook, other_app_webhook]
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(
+        WebhookEventAsyncType.ORDER_UPDATED, order, webhooks
+    )
+
+    # then
+    assert mocked_generate_payload.call_count == 2
+    first_call, second_call = mocked_generate_payload.call_args_list
+    assert first_call.kwargs["request"] is second_call.kwargs["request"]
+    assert first_call.kwargs["app"] == subscription_order_updated_webhook.app
+    assert second_call.kwargs["app"] == app
+    assert len(deliveries) == len(webhooks)
+    assert deliveries[0].payload != deliveries[1].payload
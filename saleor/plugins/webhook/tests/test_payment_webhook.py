@@ -82,7 +82,7 @@ def test_trigger_webhook_sync_no_webhook_available():
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.requests.Session.post")
 def test_send_webhook_request_sync_failed_attempt(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -114,7 +114,7 @@ def test_send_webhook_request_sync_failed_attempt(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.requests.Session.post")
 @mock.patch("saleor.plugins.webhook.tasks.clear_successful_delivery")
 def test_send_webhook_request_sync_successful_attempt(
     mock_clear_delivery, mock_post, mock_observability, app, event_delivery
@@ -149,7 +149,9 @@ def test_send_webhook_request_sync_successful_attempt(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post", side_effect=RequestException)
+@mock.patch(
+    "saleor.plugins.webhook.tasks.requests.Session.post", side_effect=RequestException
+)
 def test_send_webhook_request_sync_request_exception(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -170,7 +172,7 @@ def test_send_webhook_request_sync_request_exception(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.requests.Session.post")
 def test_send_webhook_request_sync_when_exception_with_response(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -191,7 +193,7 @@ def test_send_webhook_request_sync_when_exception_with_response(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.requests.Session.post")
 def test_send_webhook_request_sync_json_parsing_error(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -222,7 +224,7 @@ def test_send_webhook_request_sync_json_parsing_error(
     mock_observability.assert_called_once_with(attempt)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.requests.Session.post")
 def test_send_webhook_request_with_proper_timeout(mock_post, event_delivery, app):
     mock_post().text = '{"key": "response_text"}'
     mock_post().headers = {"header_key": "header_val"}
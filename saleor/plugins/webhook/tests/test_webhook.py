@@ -49,7 +49,12 @@ from ....webhook.payloads import (
 )
 from ....webhook.utils import get_webhooks_for_event
 from ...manager import get_plugins_manager
-from ...webhook.tasks import send_webhook_request_async, trigger_webhooks_async
+from ...webhook.tasks import (
+    get_http_session,
+    send_webhook_request_async,
+    send_webhook_requests_async,
+    trigger_webhooks_async,
+)
 
 first_url = "http://www.example.com/first/"
 third_url = "http://www.example.com/third/"
@@ -68,9 +73,11 @@ third_url = "http://www.example.com/third/"
         (WebhookEventAsyncType.CUSTOMER_CREATED, 0, set()),
     ],
 )
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_async.delay")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
 def test_trigger_webhooks_for_event_calls_expected_events(
     mock_request,
+    mock_batch_request,
     event_name,
     total_webhook_calls,
     expected_target_urls,
@@ -108,12 +115,14 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     trigger_webhooks_async(
         event_payload, event_name, get_webhooks_for_event(event_name)
     )
+    delivery_ids = [call.args[0] for call in mock_request.call_args_list]
+    for call in mock_batch_request.call_args_list:
+        delivery_ids.extend(call.args[0])
     deliveries_called = {
-        EventDelivery.objects.get(id=delivery_id[0][0])
-        for delivery_id in mock_request.call_args_list
+        EventDelivery.objects.get(id=delivery_id) for delivery_id in delivery_ids
     }
     urls_called = {delivery.webhook.target_url for delivery in deliveries_called}
-    assert mock_request.call_count == total_webhook_calls
+    assert len(delivery_ids) == total_webhook_calls
     assert urls_called == expected_target_urls
 
 
@@ -1178,6 +1187,150 @@ def test_send_webhook_request_async_when_max_retries_exceeded(
     mocked_observability.assert_called_once_with(attempt)
 
 
+@mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
+@mock.patch("saleor.plugins.webhook.tasks.clear_successful_delivery")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async(
+    mocked_send_response,
+    mocked_clear_delivery,
+    mocked_observability,
+    event_delivery,
+    webhook_response,
+):
+    # given
+    other_event_delivery = EventDelivery.objects.create(
+        event_type=event_delivery.event_type,
+        payload=event_delivery.payload,
+        webhook=event_delivery.webhook,
+    )
+    mocked_send_response.return_value = webhook_response
+
+    # when
+    send_webhook_requests_async([event_delivery.pk, other_event_delivery.pk])
+
+    # then
+    assert mocked_send_response.call_count == 2
+    mocked_send_response.assert_called_with(
+        event_delivery.webhook.target_url,
+        "mirumee.com",
+        event_delivery.webhook.secret_key,
+        event_delivery.event_type,
+        event_delivery.payload.payload,
+    )
+    assert mocked_clear_delivery.call_count == 2
+    assert EventDelivery.objects.filter(status=EventDeliveryStatus.SUCCESS).count() == 2
+    assert (
+        EventDeliveryAttempt.objects.filter(status=EventDeliveryStatus.SUCCESS).count()
+        == 2
+    )
+    assert mocked_observability.call_count == 2
+
+
+@mock.patch("saleor.plugins.webhook.tasks.webhooks_opentracing_trace")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async_traces_each_request(
+    mocked_send_response, mocked_webhooks_trace, event_delivery, webhook_response
+):
+    # given
+    mocked_send_response.return_value = webhook_response
+
+    # when
+    send_webhook_requests_async([event_delivery.pk])
+
+    # then
+    mocked_webhooks_trace.assert_called_once_with(
+        event_delivery.event_type,
+        "mirumee.com",
+        app_name=event_delivery.webhook.app.name,
+    )
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async_retries_failed_deliveries_one_by_one(
+    mocked_send_response,
+    mocked_observability,
+    mocked_send_webhook_request_async,
+    event_delivery,
+    webhook_response_failed,
+):
+    # given
+    mocked_send_response.return_value = webhook_response_failed
+
+    # when
+    send_webhook_requests_async([event_delivery.pk])
+
+    # then
+    mocked_send_webhook_request_async.assert_called_once_with(
+        (event_delivery.pk,), countdown=10, retries=1
+    )
+    attempt = EventDeliveryAttempt.objects.get(delivery=event_delivery)
+    delivery = EventDelivery.objects.get(id=event_delivery.pk)
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert delivery.status == EventDeliveryStatus.PENDING
+    mocked_observability.assert_called_once_with(attempt, mock.ANY)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async_when_webhook_is_disabled(
+    mocked_send_response, event_delivery
+):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_requests_async([event_delivery.pk])
+
+    # then
+    mocked_send_response.assert_not_called()
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_trigger_webhooks_async_sends_deliveries_in_batches(
+    mocked_send_webhook_request,
+    mocked_send_webhook_requests,
+    webhook,
+    settings,
+):
+    # given
+    settings.WEBHOOK_BATCH_SIZE = 2
+    other_webhook = webhook.app.webhooks.create(
+        target_url="http://www.example.com/other/"
+    )
+    another_webhook = webhook.app.webhooks.create(
+        target_url="http://www.example.com/another/"
+    )
+    event_type = WebhookEventAsyncType.PRODUCT_CREATED
+
+    # when
+    trigger_webhooks_async("{}", event_type, [webhook, other_webhook, another_webhook])
+
+    # then
+    mocked_send_webhook_request.assert_not_called()
+    batches = [call.args[0] for call in mocked_send_webhook_requests.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    delivery_ids = [delivery_id for batch in batches for delivery_id in batch]
+    assert {
+        delivery.webhook
+        for delivery in EventDelivery.objects.filter(id__in=delivery_ids)
+    } == {webhook, other_webhook, another_webhook}
+
+
+def test_get_http_session_reuses_session_per_host():
+    # when
+    session = get_http_session("https://www.example.com/first/")
+
+    # then
+    assert get_http_session("https://www.example.com/second/") is session
+    assert get_http_session("https://example.com/first/") is not session
+    assert get_http_session("http://www.example.com/first/") is not session
+
+
 @pytest.mark.parametrize(
     "event, expected_is_active",
     (("invoice_request", False), ("transaction_action_request", True)),
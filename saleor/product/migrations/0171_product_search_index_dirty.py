@@ -0,0 +1,26 @@
+# Generated by Django 3.2.13 on 2022-07-12 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0170_rewrite_digitalcontenturl_orderline_relation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_index_dirty",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(search_index_dirty=True),
+                fields=["search_index_dirty"],
+                name="product_search_index_dirty_idx",
+            ),
+        ),
+    ]
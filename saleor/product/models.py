@@ -398,6 +398,7 @@ class Product(SeoModel, ModelWithMetadata):
     description_plaintext = TextField(blank=True)
     search_document = models.TextField(blank=True, default="")
     search_vector = SearchVectorField(blank=True, null=True)
+    search_index_dirty = models.BooleanField(default=False)
 
     category = models.ForeignKey(
         Category,
@@ -443,6 +444,11 @@ class Product(SeoModel, ModelWithMetadata):
                 name="product_tsearch",
                 fields=["search_vector"],
             ),
+            models.Index(
+                name="product_search_index_dirty_idx",
+                fields=["search_index_dirty"],
+                condition=Q(search_index_dirty=True),
+            ),
         ]
         indexes.extend(ModelWithMetadata.Meta.indexes)
 
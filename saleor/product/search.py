@@ -1,8 +1,12 @@
+from bisect import bisect_left
 from functools import reduce
+from itertools import islice
 from operator import add
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
 from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.cache import cache
+from django.db import connections
 from django.db.models import F, Q, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
@@ -30,6 +34,10 @@ PRODUCTS_BATCH_SIZE = 300
 # update task on a large dataset and measureing the total time, memory usage
 # and time of a single SQL statement.
 
+PRODUCT_SEARCH_TERMS_KEY_PREFIX = "product-search-terms"
+# Number of the most common words of the channel products kept for suggestions
+PRODUCT_SEARCH_TERMS_LIMIT = 5000
+
 
 def update_products_search_vector(products: "QuerySet"):
     last_id = 0
@@ -55,6 +63,17 @@ def update_product_search_vector(product: "Product"):
     product.save(update_fields=["search_vector", "updated_at"])
 
 
+def mark_products_search_vector_as_dirty(product_ids: Iterable[int]):
+    """Queue the products for the search vector update.
+
+    The vectors are rebuilt in batches by `update_products_search_vector_task`,
+    so repeated changes of the same product are indexed once.
+    """
+    Product.objects.filter(id__in=product_ids, search_index_dirty=False).update(
+        search_index_dirty=True
+    )
+
+
 def prepare_product_search_vector_value(
     product: "Product", *, already_prefetched=False
 ) -> SearchVector:
@@ -159,3 +178,76 @@ def search_products(qs, value):
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+def prepare_product_prefix_search_query(value: str) -> Optional[SearchQuery]:
+    """Return a query matching products with words starting with every term."""
+    terms = [
+        "'{}':*".format(term.replace("\\", "\\\\").replace("'", "\\'"))
+        for term in value.split()
+    ]
+    if not terms:
+        return None
+    return SearchQuery(" & ".join(terms), search_type="raw", config="simple")
+
+
+def search_product_suggestions(qs, value: str, limit: int) -> List[Dict]:
+    """Return IDs, names and slugs of the best matching products.
+
+    Every term of the value is matched as a word prefix, so the suggestions can be
+    shown while the value is being typed.
+    """
+    query = prepare_product_prefix_search_query(value)
+    if query is None:
+        return []
+    qs = (
+        qs.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "id")
+    )
+    return list(qs.values("id", "name", "slug")[:limit])
+
+
+def _get_product_search_terms_key(channel_slug: str) -> str:
+    return f"{PRODUCT_SEARCH_TERMS_KEY_PREFIX}-{channel_slug}"
+
+
+def update_product_search_terms(products: "QuerySet", channel_slug: str):
+    """Store the most common words of the products search vectors.
+
+    The words are sorted alphabetically and stored with the number of products
+    containing them, so they can be looked up by prefix.
+    """
+    sql, params = products.values("search_vector").query.sql_with_params()
+    with connections[products.db].cursor() as cursor:
+        products_sql = cursor.mogrify(sql, params).decode()
+        cursor.execute(
+            "SELECT word, ndoc FROM ts_stat(%s) ORDER BY ndoc DESC, word LIMIT %s",
+            [products_sql, PRODUCT_SEARCH_TERMS_LIMIT],
+        )
+        terms = sorted(cursor.fetchall())
+    cache.set(_get_product_search_terms_key(channel_slug), terms, timeout=None)
+
+
+def get_product_search_term_suggestions(
+    channel_slug: str, value: str, limit: int
+) -> List[str]:
+    """Return the most common words of the channel products completing the value.
+
+    The last term of the value is completed with words stored by
+    `update_product_search_terms`.
+    """
+    terms = value.split()
+    if not terms:
+        return []
+    prefix = terms[-1].lower()
+    channel_terms: List[Tuple[str, int]] = (
+        cache.get(_get_product_search_terms_key(channel_slug)) or []
+    )
+    start = bisect_left(channel_terms, (prefix,))
+    matching_terms = []
+    for word, products_count in islice(channel_terms, start, None):
+        if not word.startswith(prefix):
+            break
+        matching_terms.append((-products_count, word))
+    return [word for _, word in sorted(matching_terms)[:limit]]
@@ -1,16 +1,22 @@
 import logging
+from datetime import timedelta
 from typing import Iterable, List, Optional
 
 from celery.utils.log import get_task_logger
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 from ..attribute.models import Attribute
 from ..celeryconf import app
+from ..channel.models import Channel
 from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
+from ..discount.utils import fetch_sales_catalogues_info
 from ..warehouse.management import deactivate_preorder_for_variant
-from .models import Product, ProductType, ProductVariant
+from .models import Product, ProductChannelListing, ProductType, ProductVariant
+from .search import update_product_search_terms
 from .utils.variant_prices import (
     update_product_discounted_price,
     update_products_discounted_prices,
@@ -22,6 +28,10 @@ from .utils.variants import generate_and_set_variant_name
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+SCHEDULED_SALES_LAST_CHECK_KEY = "scheduled-sales-last-check"
+# Sales started or ended within this period are handled when the last check is unknown
+SCHEDULED_SALES_DEFAULT_CHECK_PERIOD = timedelta(days=1)
+
 
 def _update_variants_names(instance: ProductType, saved_attributes: Iterable):
     """Product variant names are created from names of assigned attributes.
@@ -71,20 +81,23 @@ def update_products_discounted_prices_of_catalogues_task(
     category_ids: Optional[List[int]] = None,
     collection_ids: Optional[List[int]] = None,
     variant_ids: Optional[List[int]] = None,
+    channel_ids: Optional[List[int]] = None,
 ):
     update_products_discounted_prices_of_catalogues(
-        product_ids, category_ids, collection_ids, variant_ids
+        product_ids, category_ids, collection_ids, variant_ids, channel_ids
     )
 
 
 @app.task
-def update_products_discounted_prices_of_discount_task(discount_pk: int):
+def update_products_discounted_prices_of_discount_task(
+    discount_pk: int, channel_ids: Optional[List[int]] = None
+):
     try:
         discount = Sale.objects.get(pk=discount_pk)
     except ObjectDoesNotExist:
         logging.warning(f"Cannot find discount with id: {discount_pk}.")
         return
-    update_products_discounted_prices_of_discount(discount)
+    update_products_discounted_prices_of_discount(discount, channel_ids=channel_ids)
 
 
 @app.task
@@ -93,6 +106,44 @@ def update_products_discounted_prices_task(product_ids: List[int]):
     update_products_discounted_prices(products)
 
 
+@app.task
+def update_discounted_prices_of_scheduled_sales_task():
+    """Update discounted prices of products in sales started or ended on schedule.
+
+    Only sales whose start or end date passed since the previous run are handled.
+    """
+    now = timezone.now()
+    last_check = cache.get(SCHEDULED_SALES_LAST_CHECK_KEY)
+    if last_check is None:
+        last_check = now - SCHEDULED_SALES_DEFAULT_CHECK_PERIOD
+    sales = Sale.objects.filter(
+        Q(start_date__gt=last_check, start_date__lte=now)
+        | Q(end_date__gte=last_check, end_date__lt=now)
+    )
+    catalogues = fetch_sales_catalogues_info(sales)
+    if any(catalogues.values()):
+        update_products_discounted_prices_of_catalogues(
+            product_ids=catalogues["products"],
+            category_ids=catalogues["categories"],
+            collection_ids=catalogues["collections"],
+            variant_ids=catalogues["variants"],
+        )
+    cache.set(SCHEDULED_SALES_LAST_CHECK_KEY, now, timeout=None)
+
+
+@app.task
+def update_product_search_terms_task():
+    """Store the most common words of products listed in every active channel."""
+    for channel in Channel.objects.filter(is_active=True):
+        channel_listings = ProductChannelListing.objects.filter(
+            channel_id=channel.pk, visible_in_listings=True
+        )
+        products = Product.objects.published_with_variants(channel.slug).filter(
+            Exists(channel_listings.filter(product_id=OuterRef("pk")))
+        )
+        update_product_search_terms(products, channel.slug)
+
+
 @app.task
 def deactivate_preorder_for_variants_task():
     variants_to_clean = _get_preorder_variants_to_clean()
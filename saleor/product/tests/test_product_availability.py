@@ -21,7 +21,9 @@ def test_availability(stock, monkeypatch, settings, channel_USD):
     )
     taxed_price = TaxedMoney(Money("10.0", "USD"), Money("12.30", "USD"))
     monkeypatch.setattr(
-        PluginsManager, "apply_taxes_to_product", Mock(return_value=taxed_price)
+        PluginsManager,
+        "apply_taxes_to_products",
+        Mock(side_effect=lambda prices, **_: [taxed_price] * len(prices)),
     )
     manager = get_plugins_manager()
     availability = get_product_availability(
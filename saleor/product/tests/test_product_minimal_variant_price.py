@@ -3,10 +3,12 @@ from unittest.mock import patch
 from django.core.management import call_command
 from prices import Money
 
+from ..models import Product
 from ..tasks import (
     update_products_discounted_prices_of_catalogues,
     update_products_discounted_prices_task,
 )
+from ..utils import variant_prices
 from ..utils.variant_prices import update_product_discounted_price
 
 
@@ -63,6 +65,54 @@ def test_update_products_discounted_prices_of_catalogues_for_product(
     assert product_channel_listing.discounted_price == variant_channel_listing.price
 
 
+def test_update_products_discounted_prices_of_catalogues_in_channels(
+    product, channel_USD, channel_PLN
+):
+    # given
+    variant = product.variants.first()
+    variant_channel_listing = variant.channel_listings.get(channel_id=channel_USD.id)
+    product_channel_listing = product.channel_listings.get(channel_id=channel_USD.id)
+    variant_channel_listing.price = Money("0.99", "USD")
+    variant_channel_listing.save()
+
+    # when
+    update_products_discounted_prices_of_catalogues(
+        product_ids=[product.pk], channel_ids=[channel_PLN.id]
+    )
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.discounted_price == Money("10", "USD")
+
+    # when
+    update_products_discounted_prices_of_catalogues(
+        product_ids=[product.pk], channel_ids=[channel_USD.id]
+    )
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.discounted_price == variant_channel_listing.price
+
+
+def test_update_products_discounted_prices_in_batches(product_list):
+    # given
+    price = Money("0.01", "USD")
+    for product in product_list:
+        variant_channel_listing = product.variants.first().channel_listings.get()
+        variant_channel_listing.price = price
+        variant_channel_listing.save()
+
+    # when
+    with patch.object(variant_prices, "PRODUCTS_BATCH_SIZE", 2):
+        variant_prices.update_products_discounted_prices(
+            Product.objects.filter(pk__in=[product.pk for product in product_list])
+        )
+
+    # then
+    for product in product_list:
+        assert product.channel_listings.get().discounted_price == price
+
+
 def test_update_products_discounted_prices_of_catalogues_for_category(
     category, product, channel_USD
 ):
@@ -128,12 +178,12 @@ def test_update_products_discounted_prices_task(product_list):
 @patch(
     "saleor.product.management.commands"
     ".update_all_products_discounted_prices"
-    ".update_product_discounted_price"
+    ".update_products_discounted_prices"
 )
 def test_management_commmand_update_all_products_discounted_price(
-    mock_update_product_discounted_price, product_list
+    mock_update_products_discounted_prices, product_list
 ):
     call_command("update_all_products_discounted_prices")
-    call_args_list = mock_update_product_discounted_price.call_args_list
-    for (args, kwargs), product in zip(call_args_list, product_list):
-        assert args[0] == product
+    mock_update_products_discounted_prices.assert_called_once()
+    args, kwargs = mock_update_products_discounted_prices.call_args
+    assert set(args[0]) == set(product_list)
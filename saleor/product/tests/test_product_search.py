@@ -1,5 +1,12 @@
 from ..models import Product
-from ..search import update_product_search_vector, update_products_search_vector
+from ..search import (
+    get_product_search_term_suggestions,
+    mark_products_search_vector_as_dirty,
+    search_product_suggestions,
+    update_product_search_terms,
+    update_product_search_vector,
+    update_products_search_vector,
+)
 
 
 def test_update_product_search_vector(product_type, category):
@@ -35,3 +42,40 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_mark_products_search_vector_as_dirty(product_list):
+    # given
+    dirty_product, *other_products = product_list
+
+    # when
+    mark_products_search_vector_as_dirty([dirty_product.pk])
+
+    # then
+    dirty_product.refresh_from_db()
+    assert dirty_product.search_index_dirty
+    for product in other_products:
+        product.refresh_from_db()
+        assert not product.search_index_dirty
+
+
+def test_search_product_suggestions_matches_word_prefixes(product_list):
+    # when
+    suggestions = search_product_suggestions(Product.objects.all(), "bi BL", 5)
+
+    # then
+    product = product_list[0]
+    assert suggestions == [
+        {"id": product.pk, "name": product.name, "slug": product.slug}
+    ]
+
+
+def test_get_product_search_term_suggestions(product_list, channel_USD):
+    # given
+    update_product_search_terms(Product.objects.all(), channel_USD.slug)
+
+    # when
+    terms = get_product_search_term_suggestions(channel_USD.slug, "product Bi", 5)
+
+    # then
+    assert terms == ["big"]
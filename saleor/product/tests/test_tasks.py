@@ -2,10 +2,14 @@ import logging
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.utils import timezone
+from freezegun import freeze_time
 
 from ..tasks import (
+    SCHEDULED_SALES_LAST_CHECK_KEY,
     _get_preorder_variants_to_clean,
+    update_discounted_prices_of_scheduled_sales_task,
     update_product_discounted_price_task,
     update_products_discounted_prices_of_discount_task,
     update_variants_names,
@@ -20,7 +24,7 @@ def test_update_products_discounted_prices_of_discount_task(
     update_products_discounted_prices_of_discount_task(sale.id)
 
     # then
-    update_product_prices_mock.assert_called_once_with(sale)
+    update_product_prices_mock.assert_called_once_with(sale, channel_ids=None)
 
 
 @patch("saleor.product.tasks.update_products_discounted_prices_of_discount")
@@ -114,3 +118,47 @@ def test_get_preorder_variants_to_clean(
     variants_to_clean = _get_preorder_variants_to_clean()
     assert len(variants_to_clean) == 1
     assert variants_to_clean[0] == preorder_variant_after_end_date
+
+
+@freeze_time("2022-05-12 12:00:00")
+@patch("saleor.product.tasks.update_products_discounted_prices_of_catalogues")
+def test_update_discounted_prices_of_scheduled_sales_task(
+    update_products_discounted_prices_mock, sale, product, variant
+):
+    # given
+    now = timezone.now()
+    sale.start_date = now - timedelta(minutes=1)
+    sale.save(update_fields=["start_date"])
+    cache.set(SCHEDULED_SALES_LAST_CHECK_KEY, now - timedelta(minutes=5))
+
+    # when
+    update_discounted_prices_of_scheduled_sales_task()
+
+    # then
+    update_products_discounted_prices_mock.assert_called_once()
+    _, kwargs = update_products_discounted_prices_mock.call_args
+    assert kwargs["product_ids"] == {product.pk}
+    assert kwargs["variant_ids"] == {variant.pk}
+    assert cache.get(SCHEDULED_SALES_LAST_CHECK_KEY) == now
+    cache.delete(SCHEDULED_SALES_LAST_CHECK_KEY)
+
+
+@freeze_time("2022-05-12 12:00:00")
+@patch("saleor.product.tasks.update_products_discounted_prices_of_catalogues")
+def test_update_discounted_prices_of_scheduled_sales_task_skips_checked_sales(
+    update_products_discounted_prices_mock, sale
+):
+    # given
+    now = timezone.now()
+    sale.start_date = now - timedelta(minutes=10)
+    sale.end_date = now + timedelta(minutes=10)
+    sale.save(update_fields=["start_date", "end_date"])
+    cache.set(SCHEDULED_SALES_LAST_CHECK_KEY, now - timedelta(minutes=5))
+
+    # when
+    update_discounted_prices_of_scheduled_sales_task()
+
+    # then
+    update_products_discounted_prices_mock.assert_not_called()
+    assert cache.get(SCHEDULED_SALES_LAST_CHECK_KEY) == now
+    cache.delete(SCHEDULED_SALES_LAST_CHECK_KEY)
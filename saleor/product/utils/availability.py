@@ -4,12 +4,12 @@ from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
 import opentracing
 from django.conf import settings
 from django_countries.fields import Country
-from prices import MoneyRange, TaxedMoney, TaxedMoneyRange
+from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...channel.models import Channel
 from ...core.utils import to_local_currency
 from ...discount import DiscountInfo
-from ...discount.utils import calculate_discounted_price
+from ...discount.utils import calculate_discounted_price, calculate_discounted_prices
 from ...product.models import (
     Collection,
     Product,
@@ -118,41 +118,62 @@ def get_product_price_range(
             for channel_listing in variants_channel_listing
             if channel_listing
         }
-        prices = []
-        for variant in variants:
-            variant_channel_listing = variants_channel_listing_dict.get(variant.id)
-            if variant_channel_listing:
-                price = get_variant_price(
-                    variant=variant,
-                    variant_channel_listing=variant_channel_listing,
-                    product=product,
-                    collections=collections,
-                    discounts=discounts,
-                    channel=channel,
-                )
-                prices.append(price)
+        variant_prices = [
+            (variant.id, variants_channel_listing_dict[variant.id].price)
+            for variant in variants
+            if variants_channel_listing_dict.get(variant.id)
+        ]
+        prices = calculate_discounted_prices(
+            product=product,
+            variant_prices=variant_prices,
+            collections=collections,
+            discounts=discounts,
+            channel=channel,
+        )
         if prices:
             return MoneyRange(min(prices), max(prices))
 
     return None
 
 
-def get_product_availability(
+def _apply_taxes_to_price_ranges(
+    price_ranges: List[Optional[MoneyRange]],
+    *,
+    product: Product,
+    country: Country,
+    manager: "PluginsManager",
+    channel_slug: str,
+) -> List[Optional[TaxedMoneyRange]]:
+    """Apply taxes to the price ranges of the product with a single plugins call."""
+    taxed_prices = iter(
+        manager.apply_taxes_to_products(
+            [
+                (product, price, country)
+                for price_range in price_ranges
+                if price_range is not None
+                for price in (price_range.start, price_range.stop)
+            ],
+            channel_slug=channel_slug,
+        )
+    )
+    return [
+        TaxedMoneyRange(start=next(taxed_prices), stop=next(taxed_prices))
+        if price_range is not None
+        else None
+        for price_range in price_ranges
+    ]
+
+
+def get_product_net_price_ranges(
     *,
     product: Product,
-    product_channel_listing: Optional[ProductChannelListing],
     variants: Iterable[ProductVariant],
     variants_channel_listing: List[ProductVariantChannelListing],
     collections: Iterable[Collection],
     discounts: Iterable[DiscountInfo],
     channel: Channel,
-    manager: "PluginsManager",
-    country: Country,
-    local_currency: Optional[str] = None,
-) -> ProductAvailability:
-    channel_slug = channel.slug
-
-    discounted = None
+) -> Tuple[Optional[MoneyRange], Optional[MoneyRange]]:
+    """Return the discounted and undiscounted price ranges of the product."""
     discounted_net_range = get_product_price_range(
         product=product,
         variants=variants,
@@ -161,23 +182,6 @@ def get_product_availability(
         discounts=discounts,
         channel=channel,
     )
-    if discounted_net_range is not None:
-        discounted = TaxedMoneyRange(
-            start=manager.apply_taxes_to_product(
-                product,
-                discounted_net_range.start,
-                country,
-                channel_slug=channel_slug,
-            ),
-            stop=manager.apply_taxes_to_product(
-                product,
-                discounted_net_range.stop,
-                country,
-                channel_slug=channel_slug,
-            ),
-        )
-
-    undiscounted = None
     undiscounted_net_range = get_product_price_range(
         product=product,
         variants=variants,
@@ -186,26 +190,20 @@ def get_product_availability(
         discounts=[],
         channel=channel,
     )
-    if undiscounted_net_range is not None:
-        undiscounted = TaxedMoneyRange(
-            start=manager.apply_taxes_to_product(
-                product,
-                undiscounted_net_range.start,
-                country,
-                channel_slug=channel_slug,
-            ),
-            stop=manager.apply_taxes_to_product(
-                product,
-                undiscounted_net_range.stop,
-                country,
-                channel_slug=channel_slug,
-            ),
-        )
+    return discounted_net_range, undiscounted_net_range
+
 
+def get_product_availability_from_taxed_prices(
+    *,
+    product_channel_listing: Optional[ProductChannelListing],
+    discounted: Optional[TaxedMoneyRange],
+    undiscounted: Optional[TaxedMoneyRange],
+    local_currency: Optional[str] = None,
+) -> ProductAvailability:
     discount = None
     price_range_local = None
     discount_local_currency = None
-    if undiscounted_net_range is not None and discounted_net_range is not None:
+    if undiscounted is not None and discounted is not None:
         discount = _get_total_discount_from_range(undiscounted, discounted)
         price_range_local, discount_local_currency = _get_product_price_range(
             discounted, undiscounted, local_currency
@@ -226,6 +224,102 @@ def get_product_availability(
     )
 
 
+def get_product_availability(
+    *,
+    product: Product,
+    product_channel_listing: Optional[ProductChannelListing],
+    variants: Iterable[ProductVariant],
+    variants_channel_listing: List[ProductVariantChannelListing],
+    collections: Iterable[Collection],
+    discounts: Iterable[DiscountInfo],
+    channel: Channel,
+    manager: "PluginsManager",
+    country: Country,
+    local_currency: Optional[str] = None,
+) -> ProductAvailability:
+    discounted_net_range, undiscounted_net_range = get_product_net_price_ranges(
+        product=product,
+        variants=variants,
+        variants_channel_listing=variants_channel_listing,
+        collections=collections,
+        discounts=discounts,
+        channel=channel,
+    )
+    discounted, undiscounted = _apply_taxes_to_price_ranges(
+        [discounted_net_range, undiscounted_net_range],
+        product=product,
+        country=country,
+        manager=manager,
+        channel_slug=channel.slug,
+    )
+    return get_product_availability_from_taxed_prices(
+        product_channel_listing=product_channel_listing,
+        discounted=discounted,
+        undiscounted=undiscounted,
+        local_currency=local_currency,
+    )
+
+
+def get_variant_net_prices(
+    *,
+    variant: ProductVariant,
+    variant_channel_listing: ProductVariantChannelListing,
+    product: Product,
+    collections: Iterable[Collection],
+    discounts: Iterable[DiscountInfo],
+    channel: Channel,
+) -> Tuple[Money, Money]:
+    """Return the discounted and undiscounted prices of the variant."""
+    discounted = get_variant_price(
+        variant=variant,
+        variant_channel_listing=variant_channel_listing,
+        product=product,
+        collections=collections,
+        discounts=discounts,
+        channel=channel,
+    )
+    undiscounted = get_variant_price(
+        variant=variant,
+        variant_channel_listing=variant_channel_listing,
+        product=product,
+        collections=collections,
+        discounts=[],
+        channel=channel,
+    )
+    return discounted, undiscounted
+
+
+def get_variant_availability_from_taxed_prices(
+    *,
+    product_channel_listing: Optional[ProductChannelListing],
+    discounted: TaxedMoney,
+    undiscounted: TaxedMoney,
+    local_currency: Optional[str] = None,
+) -> VariantAvailability:
+    discount = _get_total_discount(undiscounted, discounted)
+
+    if local_currency:
+        price_local_currency = to_local_currency(discounted, local_currency)
+        discount_local_currency = to_local_currency(discount, local_currency)
+    else:
+        price_local_currency = None
+        discount_local_currency = None
+
+    is_visible = (
+        product_channel_listing is not None and product_channel_listing.is_visible
+    )
+    is_on_sale = is_visible and discount is not None
+
+    return VariantAvailability(
+        on_sale=is_on_sale,
+        price=discounted,
+        price_undiscounted=undiscounted,
+        discount=discount,
+        price_local_currency=price_local_currency,
+        discount_local_currency=discount_local_currency,
+    )
+
+
 def get_variant_availability(
     variant: ProductVariant,
     variant_channel_listing: ProductVariantChannelListing,
@@ -239,53 +333,21 @@ def get_variant_availability(
     local_currency: Optional[str] = None,
 ) -> VariantAvailability:
     with opentracing.global_tracer().start_active_span("get_variant_availability"):
-        channel_slug = channel.slug
-        discounted = plugins.apply_taxes_to_product(
-            product,
-            get_variant_price(
-                variant=variant,
-                variant_channel_listing=variant_channel_listing,
-                product=product,
-                collections=collections,
-                discounts=discounts,
-                channel=channel,
-            ),
-            country,
-            channel_slug=channel_slug,
+        prices = get_variant_net_prices(
+            variant=variant,
+            variant_channel_listing=variant_channel_listing,
+            product=product,
+            collections=collections,
+            discounts=discounts,
+            channel=channel,
         )
-        undiscounted = plugins.apply_taxes_to_product(
-            product,
-            get_variant_price(
-                variant=variant,
-                variant_channel_listing=variant_channel_listing,
-                product=product,
-                collections=collections,
-                discounts=[],
-                channel=channel,
-            ),
-            country,
-            channel_slug=channel_slug,
-        )
-
-        discount = _get_total_discount(undiscounted, discounted)
-
-        if local_currency:
-            price_local_currency = to_local_currency(discounted, local_currency)
-            discount_local_currency = to_local_currency(discount, local_currency)
-        else:
-            price_local_currency = None
-            discount_local_currency = None
-
-        is_visible = (
-            product_channel_listing is not None and product_channel_listing.is_visible
+        discounted, undiscounted = plugins.apply_taxes_to_products(
+            [(product, price, country) for price in prices],
+            channel_slug=channel.slug,
         )
-        is_on_sale = is_visible and discount is not None
-
-        return VariantAvailability(
-            on_sale=is_on_sale,
-            price=discounted,
-            price_undiscounted=undiscounted,
-            discount=discount,
-            price_local_currency=price_local_currency,
-            discount_local_currency=discount_local_currency,
+        return get_variant_availability_from_taxed_prices(
+            product_channel_listing=product_channel_listing,
+            discounted=discounted,
+            undiscounted=undiscounted,
+            local_currency=local_currency,
         )
@@ -1,58 +1,97 @@
 import operator
 from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from django.db.models import Prefetch
 from django.db.models.query_utils import Q
 from prices import Money
 
-from ...discount.utils import calculate_discounted_price, fetch_active_discounts
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
-
-
-def _get_variant_prices_in_channels_dict(product):
+from ...channel.models import Channel
+from ...discount.utils import (
+    IndexedDiscounts,
+    calculate_discounted_prices,
+    fetch_active_discounts,
+)
+from ..models import (
+    Collection,
+    Product,
+    ProductChannelListing,
+    ProductVariantChannelListing,
+)
+
+# Number of products whose discounted prices are computed with the same queries
+PRODUCTS_BATCH_SIZE = 1000
+
+
+def _get_variant_prices_in_channels_dict(
+    product_ids: Iterable[int], channel_ids: Optional[Iterable[int]] = None
+) -> Dict[Tuple[int, int], List[Money]]:
+    """Return variant prices of the products grouped by product and channel IDs."""
+    variant_channel_listings = ProductVariantChannelListing.objects.filter(
+        variant__product_id__in=product_ids, price_amount__isnull=False
+    )
+    if channel_ids is not None:
+        variant_channel_listings = variant_channel_listings.filter(
+            channel_id__in=channel_ids
+        )
+    variant_prices = variant_channel_listings.values_list(
+        "variant__product_id", "channel_id", "price_amount", "currency"
+    )
     prices_dict = defaultdict(list)
-    for variant_channel_listing in ProductVariantChannelListing.objects.filter(
-        variant__product_id=product, price_amount__isnull=False
-    ):
-        channel_id = variant_channel_listing.channel_id
-        prices_dict[channel_id].append(variant_channel_listing.price)
+    for product_id, channel_id, price_amount, currency in variant_prices.iterator():
+        prices_dict[(product_id, channel_id)].append(Money(price_amount, currency))
     return prices_dict
 
 
 def _get_product_discounted_price(
     variant_prices, product, collections, discounts, channel
 ) -> Optional[Money]:
-    discounted_variants_price = []
-    for variant_price in variant_prices:
-        discounted_variant_price = calculate_discounted_price(
-            product=product,
-            price=variant_price,
-            collections=collections,
-            discounts=discounts,
-            channel=channel,
-        )
-        discounted_variants_price.append(discounted_variant_price)
+    discounted_variants_price = calculate_discounted_prices(
+        product=product,
+        variant_prices=[(None, variant_price) for variant_price in variant_prices],
+        collections=collections,
+        discounts=discounts,
+        channel=channel,
+    )
     return min(discounted_variants_price)
 
 
-def update_product_discounted_price(product, discounts=None):
-    if discounts is None:
-        discounts = fetch_active_discounts()
-    collections = list(product.collections.all())
-    variant_prices_in_channels_dict = _get_variant_prices_in_channels_dict(product)
+def _update_products_batch_discounted_prices(
+    products: List[Product],
+    discounts: IndexedDiscounts,
+    channels: Dict[int, Channel],
+    channel_ids: Optional[Iterable[int]] = None,
+):
+    """Compute discounted prices of the products and save the changed ones.
+
+    The products should have their collections prefetched.
+    """
+    products_dict = {product.pk: product for product in products}
+    product_ids = list(products_dict)
+    variant_prices_dict = _get_variant_prices_in_channels_dict(product_ids, channel_ids)
+    product_channel_listings = ProductChannelListing.objects.filter(
+        product_id__in=product_ids
+    )
+    if channel_ids is not None:
+        product_channel_listings = product_channel_listings.filter(
+            channel_id__in=channel_ids
+        )
+
     changed_products_channels_to_update = []
-    for product_channel_listing in product.channel_listings.all():
+    for product_channel_listing in product_channel_listings:
+        product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
-        variant_prices_dict = variant_prices_in_channels_dict.get(channel_id)
-        if not variant_prices_dict:
+        variant_prices = variant_prices_dict.get((product_id, channel_id))
+        if not variant_prices:
             continue
+        product = products_dict[product_id]
         product_discounted_price = _get_product_discounted_price(
-            variant_prices_dict,
+            variant_prices,
             product,
-            collections,
+            product.collections.all(),
             discounts,
-            product_channel_listing.channel,
+            channels[channel_id],
         )
         if product_channel_listing.discounted_price != product_discounted_price:
             product_channel_listing.discounted_price_amount = (
@@ -64,16 +103,51 @@ def update_product_discounted_price(product, discounts=None):
     )
 
 
-def update_products_discounted_prices(products, discounts=None):
+def update_product_discounted_price(product, discounts=None):
+    update_products_discounted_prices(
+        Product.objects.filter(pk=product.pk), discounts=discounts
+    )
+
+
+def update_products_discounted_prices(products, discounts=None, channel_ids=None):
+    """Recompute discounted prices of the products in batches.
+
+    Each batch of products is handled with a fixed number of queries. Pass
+    `channel_ids` to recompute the prices only in the given channels.
+    """
     if discounts is None:
         discounts = fetch_active_discounts()
-
-    for product in products.prefetch_related("channel_listings"):
-        update_product_discounted_price(product, discounts)
+    if not isinstance(discounts, IndexedDiscounts):
+        discounts = IndexedDiscounts(discounts)
+    channels = Channel.objects.in_bulk()
+
+    products = (
+        products.order_by("pk")
+        .only("id", "category_id")
+        .prefetch_related(
+            Prefetch("collections", queryset=Collection.objects.only("id"))
+        )
+    )
+    last_pk = None
+    while True:
+        batch = products
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        batch = list(batch[:PRODUCTS_BATCH_SIZE])
+        if not batch:
+            break
+        _update_products_batch_discounted_prices(
+            batch, discounts, channels, channel_ids
+        )
+        last_pk = batch[-1].pk
 
 
 def update_products_discounted_prices_of_catalogues(
-    product_ids=None, category_ids=None, collection_ids=None, variant_ids=None
+    product_ids=None,
+    category_ids=None,
+    collection_ids=None,
+    variant_ids=None,
+    channel_ids=None,
 ):
     # Building the matching products query
     q_list = []
@@ -89,15 +163,18 @@ def update_products_discounted_prices_of_catalogues(
     if q_list:
         # Querying the products
         q_or = reduce(operator.or_, q_list)
-        products = Product.objects.filter(q_or).distinct()
+        products = Product.objects.filter(
+            pk__in=Product.objects.filter(q_or).values("pk")
+        )
 
-        update_products_discounted_prices(products)
+        update_products_discounted_prices(products, channel_ids=channel_ids)
 
 
-def update_products_discounted_prices_of_discount(discount):
+def update_products_discounted_prices_of_discount(discount, channel_ids=None):
     update_products_discounted_prices_of_catalogues(
         product_ids=discount.products.all().values_list("id", flat=True),
         category_ids=discount.categories.all().values_list("id", flat=True),
         collection_ids=discount.collections.all().values_list("id", flat=True),
         variant_ids=discount.variants.all().values_list("id", flat=True),
+        channel_ids=channel_ids,
     )
@@ -509,11 +509,33 @@ EMPTY_CHECKOUTS_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EMPTY_CHECKOUTS_TIMEDELTA", "6 hours"))
 )
 
+# Defines for how long checkout prices calculated by plugins are reused before they
+# are calculated again. Changes of the checkout invalidate the prices immediately.
+CHECKOUT_PRICES_TTL = timedelta(
+    seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "30 seconds"))
+)
+
 # Exports settings - defines after what time exported files will be deleted
 EXPORT_FILES_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
 
+# Active sales are cached in a snapshot shared by requests and celery tasks.
+# Set DISCOUNTS_SNAPSHOT_TIMEOUT=0 in env to fetch sales on each request.
+DISCOUNTS_SNAPSHOT_TIMEOUT = parse(
+    os.environ.get("DISCOUNTS_SNAPSHOT_TIMEOUT", "5 minutes")
+)
+
+# Warehouses serving countries in channels are cached in a map shared by requests
+# and celery tasks. Set WAREHOUSES_MAP_TIMEOUT=0 in env to query them each time.
+WAREHOUSES_MAP_TIMEOUT = parse(os.environ.get("WAREHOUSES_MAP_TIMEOUT", "5 minutes"))
+
+# Vatlayer tax rates are loaded once in each worker and reloaded when fetched again.
+# Set VATLAYER_TAX_RATES_INDEX_TIMEOUT=0 in env to read them for each request.
+VATLAYER_TAX_RATES_INDEX_TIMEOUT = parse(
+    os.environ.get("VATLAYER_TAX_RATES_INDEX_TIMEOUT", "1 hour")
+)
+
 # CELERY SETTINGS
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BROKER_URL = (
@@ -538,6 +560,22 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.delete_empty_allocations_task",
         "schedule": timedelta(days=1),
     },
+    "update-discounted-prices-of-scheduled-sales": {
+        "task": "saleor.product.tasks.update_discounted_prices_of_scheduled_sales_task",
+        "schedule": timedelta(minutes=5),
+    },
+    "update-products-search-vectors": {
+        "task": "saleor.core.search_tasks.update_products_search_vector_task",
+        "schedule": timedelta(seconds=20),
+    },
+    "update-orders-search-vectors": {
+        "task": "saleor.order.tasks.update_orders_search_vector_task",
+        "schedule": timedelta(seconds=20),
+    },
+    "update-product-search-terms": {
+        "task": "saleor.product.tasks.update_product_search_terms_task",
+        "schedule": timedelta(hours=1),
+    },
     "deactivate-preorder-for-variants": {
         "task": "saleor.product.tasks.deactivate_preorder_for_variants_task",
         "schedule": timedelta(hours=1),
@@ -562,6 +600,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "update-stocks-quantity-reserved": {
+        "task": "saleor.warehouse.tasks.update_stocks_quantity_reserved_task",
+        "schedule": crontab(hour=0, minute=30),
+    },
     "delete-old-export-files": {
         "task": "saleor.csv.tasks.delete_old_export_files",
         "schedule": crontab(hour=1, minute=0),
@@ -634,6 +676,52 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of parsed and validated GraphQL documents kept in memory by each worker.
+# Set GRAPHQL_DOCUMENT_CACHE_SIZE=0 in env to disable.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+# Share validation results and query costs between workers through the cache backend.
+GRAPHQL_DOCUMENT_CACHE_SHARED = get_bool_from_env(
+    "GRAPHQL_DOCUMENT_CACHE_SHARED", False
+)
+
+# Automatic persisted queries (Apollo APQ) stored in the cache backend.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", True
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "7 days")
+)
+
+# Cache responses of anonymous queries selecting only the listed root fields.
+# Cached responses are invalidated by the plugin events of the objects they contain.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "10 minutes")
+)
+GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS = get_list(
+    os.environ.get(
+        "GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS",
+        "categories,category,collections,collection,menus,menu,pages,page,"
+        "products,product,productVariants,productVariant",
+    )
+)
+
+# Strategies of resolving `totalCount` of connections, e.g.
+# "OrderCountableConnection:cached,ProductCountableConnection:estimate".
+# "exact" counts the rows, "estimate" uses the query planner estimate of connections
+# that aren't filtered or searched and "cached" reuses exact counts of the same
+# filters for GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT.
+GRAPHQL_TOTAL_COUNT_STRATEGIES = dict(
+    item.split(":", 1)
+    for item in get_list(os.environ.get("GRAPHQL_TOTAL_COUNT_STRATEGIES", ""))
+    if item
+)
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", "30 seconds")
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -658,6 +746,8 @@ BUILTIN_PLUGINS = [
     "saleor.plugins.admin_email.plugin.AdminEmailPlugin",
     "saleor.plugins.sendgrid.plugin.SendgridEmailPlugin",
     "saleor.plugins.openid_connect.plugin.OpenIDConnectPlugin",
+    "saleor.plugins.response_cache.plugin.ResponseCachePlugin",
+    "saleor.plugins.warehouses_map.plugin.WarehousesMapPlugin",
 ]
 
 # Plugin discovery
@@ -672,6 +762,13 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Loaded plugins are cached by each worker and reloaded when their configurations
+# or channels change. Set PLUGINS_REGISTRY_TIMEOUT=0 in env to load plugins on each
+# request.
+PLUGINS_REGISTRY_TIMEOUT = parse(
+    os.environ.get("PLUGINS_REGISTRY_TIMEOUT", "5 minutes")
+)
+
 if (
     not DEBUG
     and ENABLE_ACCOUNT_CONFIRMATION_BY_EMAIL
@@ -687,6 +784,16 @@ if (
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
 
+# Webhook requests reuse keep-alive connections to their target hosts. Async
+# deliveries of a single event are sent concurrently in batches of up to
+# WEBHOOK_BATCH_SIZE, with at most WEBHOOK_MAX_CONNECTIONS_PER_HOST requests to
+# the same host at a time.
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+WEBHOOK_BATCH_MAX_WORKERS = int(os.environ.get("WEBHOOK_BATCH_MAX_WORKERS", 16))
+WEBHOOK_MAX_CONNECTIONS_PER_HOST = int(
+    os.environ.get("WEBHOOK_MAX_CONNECTIONS_PER_HOST", 4)
+)
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
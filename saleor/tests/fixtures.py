@@ -3241,9 +3241,12 @@ def gift_card_non_shippable_order_line(
         undiscounted_base_unit_price=unit_price.gross,
         tax_rate=Decimal("0.23"),
     )
+    stock = variant.stocks.first()
     Allocation.objects.create(
-        order_line=line, stock=variant.stocks.first(), quantity_allocated=line.quantity
+        order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
     return line
 
 
@@ -3274,9 +3277,12 @@ def gift_card_shippable_order_line(order, gift_card_shippable_variant, warehouse
         undiscounted_base_unit_price=unit_price.gross,
         tax_rate=Decimal("0.23"),
     )
+    stock = variant.stocks.first()
     Allocation.objects.create(
-        order_line=line, stock=variant.stocks.first(), quantity_allocated=line.quantity
+        order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
     return line
 
 
@@ -3448,6 +3454,12 @@ def checkout_line_with_reservation_in_many_stocks(
         ]
     )
 
+    stocks_to_update = list(stocks)
+    stocks_to_update[0].quantity_reserved = 2
+    stocks_to_update[1].quantity_reserved = 1
+
+    Stock.objects.bulk_update(stocks_to_update, ["quantity_reserved"])
+
     return checkout_line
 
 
@@ -3471,6 +3483,7 @@ def checkout_line_with_one_reservation(
         quantity_reserved=2,
         reserved_until=reserved_until,
     )
+    Stock.objects.filter(pk=stocks[0].pk).update(quantity_reserved=2)
 
     return checkout_line
 
@@ -3662,6 +3675,8 @@ def order_with_lines(
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
 
     product = Product.objects.create(
         name="Test product 2",
@@ -3714,6 +3729,8 @@ def order_with_lines(
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
 
     order.shipping_address = order.billing_address.get_copy()
     order.channel = channel_USD
@@ -3901,6 +3918,8 @@ def order_with_lines_channel_PLN(
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
 
     product = Product.objects.create(
         name="Test product 2 in PLN channel",
@@ -3952,6 +3971,8 @@ def order_with_lines_channel_PLN(
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    stock.quantity_allocated += line.quantity
+    stock.save(update_fields=["quantity_allocated"])
 
     order.shipping_address = order.billing_address.get_copy()
     order.channel = channel_PLN
@@ -5624,6 +5645,8 @@ def stock(variant, warehouse):
 
 @pytest.fixture
 def allocation(order_line, stock):
+    stock.quantity_allocated = order_line.quantity
+    stock.save(update_fields=["quantity_allocated"])
     return Allocation.objects.create(
         order_line=order_line, stock=stock, quantity_allocated=order_line.quantity
     )
@@ -5688,6 +5711,9 @@ def allocations(order_list, stock, channel_USD):
         order.search_vector = prepare_order_search_vector_value(order)
     Order.objects.bulk_update(order_list, ["search_vector"])
 
+    stock.quantity_allocated = sum(line.quantity for line in lines)
+    stock.save(update_fields=["quantity_allocated"])
+
     return Allocation.objects.bulk_create(
         [
             Allocation(
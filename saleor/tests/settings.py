@@ -1,4 +1,5 @@
 import re
+from datetime import timedelta
 from typing import List, Pattern, Union
 
 from django.utils.functional import SimpleLazyObject
@@ -44,6 +45,16 @@ PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
 
 PLUGINS = []
 
+PLUGINS_REGISTRY_TIMEOUT = 0
+
+DISCOUNTS_SNAPSHOT_TIMEOUT = 0
+
+CHECKOUT_PRICES_TTL = timedelta(0)
+
+WAREHOUSES_MAP_TIMEOUT = 0
+
+VATLAYER_TAX_RATES_INDEX_TIMEOUT = 0
+
 PATTERNS_IGNORED_IN_QUERY_CAPTURES: List[Union[Pattern, SimpleLazyObject]] = [
     lazy_re_compile(r"^SET\s+")
 ]
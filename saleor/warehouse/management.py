@@ -72,7 +72,8 @@ def allocate_stocks(
         .order_by("pk")
         .values("id", "product_variant", "pk", "quantity")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock.pop("id") for stock in stocks]
+    stock_quantities = {stock["pk"]: stock["quantity"] for stock in stocks}
 
     quantity_reservation_for_stocks: Dict = defaultdict(int)
 
@@ -130,26 +131,44 @@ def allocate_stocks(
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        Allocation.objects.bulk_create(allocations)
 
+        quantity_allocated_for_stocks: Dict[int, int] = defaultdict(int)
         for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
+            quantity_allocated_for_stocks[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_pk, quantity_allocated=F("quantity_allocated") + quantity
+                )
+                for stock_pk, quantity in quantity_allocated_for_stocks.items()
+            ],
+            ["quantity_allocated"],
+        )
+
+        # stocks are locked, so the quantities loaded above are still up to date
+        out_of_stock_ids = [
+            stock_pk
+            for stock_pk, quantity in quantity_allocated_for_stocks.items()
+            if stock_quantities[stock_pk]
+            - quantity_allocation_for_stocks[stock_pk]
+            - quantity
+            <= 0
+        ]
+        if out_of_stock_ids:
+            out_of_stocks = list(
+                Stock.objects.filter(pk__in=out_of_stock_ids).select_related(
+                    "product_variant", "warehouse"
                 )
+            )
+            transaction.on_commit(lambda: _notify_out_of_stock(out_of_stocks, manager))
+
+
+def _notify_out_of_stock(stocks: Iterable[Stock], manager: PluginsManager):
+    for stock in stocks:
+        manager.product_variant_out_of_stock(stock)
 
 
 def _create_allocations(
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.13 on 2022-07-06 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("warehouse", "0028_rewrite_checkouline_relations"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stock",
+            name="quantity_reserved",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE warehouse_stock
+            SET quantity_reserved = (
+                SELECT COALESCE(SUM(quantity_reserved), 0)
+                FROM warehouse_reservation
+                WHERE warehouse_reservation.stock_id = warehouse_stock.id
+            );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
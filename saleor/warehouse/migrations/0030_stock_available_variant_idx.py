@@ -0,0 +1,21 @@
+# Generated by Django 3.2.13 on 2022-07-08 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("warehouse", "0029_stock_quantity_reserved"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="stock",
+            index=models.Index(
+                condition=models.Q(quantity__gt=models.F("quantity_allocated")),
+                fields=["product_variant"],
+                name="stock_available_variant_idx",
+            ),
+        ),
+    ]
@@ -17,6 +17,7 @@ from ..order.models import OrderLine
 from ..product.models import Product, ProductVariant, ProductVariantChannelListing
 from ..shipping.models import ShippingZone
 from . import WarehouseClickAndCollectOption
+from .utils import get_warehouse_ids_for_country_and_channel
 
 
 class WarehouseQueryset(models.QuerySet):
@@ -153,16 +154,7 @@ class Warehouse(ModelWithMetadata):
 
 class StockQuerySet(models.QuerySet):
     def annotate_available_quantity(self):
-        return self.annotate(
-            available_quantity=F("quantity")
-            - Coalesce(
-                Sum(
-                    "allocations__quantity_allocated",
-                    filter=Q(allocations__quantity_allocated__gt=0),
-                ),
-                0,
-            )
-        )
+        return self.annotate(available_quantity=F("quantity") - F("quantity_allocated"))
 
     def annotate_reserved_quantity(self):
         return self.annotate(
@@ -196,6 +188,14 @@ class StockQuerySet(models.QuerySet):
         )
 
     def for_country_and_channel(self, country_code: str, channel_slug):
+        warehouse_ids = get_warehouse_ids_for_country_and_channel(
+            country_code, channel_slug
+        )
+        if warehouse_ids is not None:
+            return self.select_related("product_variant", "warehouse").filter(
+                warehouse_id__in=warehouse_ids
+            )
+
         filter_lookup = {"shipping_zones__countries__contains": country_code}
         if channel_slug is not None:
             filter_lookup["shipping_zones__channels__slug"] = channel_slug
@@ -246,12 +246,23 @@ class Stock(models.Model):
     )
     quantity = models.IntegerField(default=0)
     quantity_allocated = models.IntegerField(default=0)
+    # Sum of all reservation rows of the stock, including the expired ones. It is
+    # never lower than the actual reserved quantity, so it is safe to reserve
+    # against without locking the stock.
+    quantity_reserved = models.IntegerField(default=0)
 
     objects = models.Manager.from_queryset(StockQuerySet)()
 
     class Meta:
         unique_together = [["warehouse", "product_variant"]]
         ordering = ("pk",)
+        indexes = [
+            models.Index(
+                name="stock_available_variant_idx",
+                fields=["product_variant"],
+                condition=Q(quantity__gt=F("quantity_allocated")),
+            ),
+        ]
 
     def increase_stock(self, quantity: int, commit: bool = True):
         """Return given quantity of product to a stock."""
@@ -2,7 +2,8 @@ from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import F, Sum
+from django.db import transaction
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
@@ -17,6 +18,10 @@ if TYPE_CHECKING:
 StockData = namedtuple("StockData", ["pk", "quantity"])
 
 
+class _StockReservationConflict(Exception):
+    """Stocks can't be reserved without locking them."""
+
+
 @traced_atomic_transaction()
 def reserve_stocks_and_preorders(
     checkout_lines: Iterable["CheckoutLine"],
@@ -85,6 +90,20 @@ def reserve_stocks(
 
     reserved_until = timezone.now() + timedelta(minutes=length_in_minutes)
 
+    try:
+        with transaction.atomic():
+            _reserve_stocks_without_locking(
+                checkout_lines,
+                variants_map,
+                country_code,
+                channel_slug,
+                reserved_until,
+                replace=replace,
+            )
+        return
+    except _StockReservationConflict:
+        pass
+
     stocks = list(
         Stock.objects.select_for_update(of=("self",))
         .get_variants_stocks_for_country(country_code, channel_slug, variants)
@@ -148,8 +167,138 @@ def reserve_stocks(
 
     if reservations:
         if replace:
-            Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
+            release_stock_reservations(
+                Reservation.objects.filter(checkout_line__in=checkout_lines)
+            )
         Reservation.objects.bulk_create(reservations)
+        update_stocks_quantity_reserved(stocks_id)
+
+
+def _reserve_stocks_without_locking(
+    checkout_lines: Iterable["CheckoutLine"],
+    variants_map: Dict[int, "ProductVariant"],
+    country_code: str,
+    channel_slug: str,
+    reserved_until: datetime,
+    *,
+    replace: bool,
+):
+    """Reserve stocks using the quantities stored on the stocks.
+
+    Stocks are reserved with conditional updates of `quantity_reserved` instead of
+    locking them and summing their allocations and reservations. Expired
+    reservations are still counted in `quantity_reserved`, so the
+    `_StockReservationConflict` raised when the stored quantities are not enough
+    should be handled by reserving with the locked stocks.
+    """
+    if replace:
+        release_stock_reservations(
+            Reservation.objects.filter(checkout_line__in=checkout_lines)
+        )
+
+    stocks = Stock.objects.get_variants_stocks_for_country(
+        country_code, channel_slug, variants_map.values()
+    ).values(
+        "pk", "product_variant", "quantity", "quantity_allocated", "quantity_reserved"
+    )
+    variant_to_stocks: Dict[int, List[StockData]] = defaultdict(list)
+    for stock_data in stocks.order_by("pk"):
+        variant_to_stocks[stock_data["product_variant"]].append(
+            StockData(
+                pk=stock_data["pk"],
+                quantity=stock_data["quantity"]
+                - stock_data["quantity_allocated"]
+                - stock_data["quantity_reserved"],
+            )
+        )
+
+    insufficient_stocks: List[InsufficientStockData] = []
+    reservations: List[Reservation] = []
+    for line in checkout_lines:
+        insufficient_stocks, reserved_items = _create_stock_reservations(
+            line,
+            variants_map[line.variant_id],
+            variant_to_stocks[line.variant_id],
+            {},
+            {},
+            insufficient_stocks,
+            reserved_until,
+        )
+        reservations.extend(reserved_items)
+
+    if insufficient_stocks:
+        raise _StockReservationConflict()
+
+    quantity_to_reserve_for_stocks: Dict[int, int] = defaultdict(int)
+    for reservation in reservations:
+        quantity_to_reserve_for_stocks[
+            reservation.stock_id
+        ] += reservation.quantity_reserved
+    for stock_pk, quantity in sorted(quantity_to_reserve_for_stocks.items()):
+        updated = Stock.objects.filter(
+            pk=stock_pk,
+            quantity__gte=F("quantity_allocated") + F("quantity_reserved") + quantity,
+        ).update(quantity_reserved=F("quantity_reserved") + quantity)
+        if not updated:
+            raise _StockReservationConflict()
+
+    Reservation.objects.bulk_create(reservations)
+
+
+def release_stock_reservations(reservations: QuerySet) -> int:
+    """Delete given reservations and return their quantity to the stocks."""
+    locked_reservations = list(
+        reservations.select_for_update(of=("self",)).values_list(
+            "pk", "stock_id", "quantity_reserved"
+        )
+    )
+    if not locked_reservations:
+        return 0
+
+    quantity_reserved_for_stocks: Dict[int, int] = defaultdict(int)
+    for _, stock_id, quantity_reserved in locked_reservations:
+        quantity_reserved_for_stocks[stock_id] += quantity_reserved
+
+    Reservation.objects.filter(pk__in=[pk for pk, _, _ in locked_reservations]).delete()
+    Stock.objects.bulk_update(
+        [
+            Stock(pk=stock_id, quantity_reserved=F("quantity_reserved") - quantity)
+            for stock_id, quantity in sorted(quantity_reserved_for_stocks.items())
+        ],
+        ["quantity_reserved"],
+    )
+    return len(locked_reservations)
+
+
+def release_checkout_lines_reservations(
+    checkout_lines: Iterable["CheckoutLine"],
+) -> int:
+    """Release stock reservations of checkout lines that are about to be deleted.
+
+    Reservations deleted by the cascade of their checkout lines would stay counted
+    in `Stock.quantity_reserved`.
+    """
+    with transaction.atomic():
+        return release_stock_reservations(
+            Reservation.objects.filter(checkout_line__in=checkout_lines)
+        )
+
+
+def update_stocks_quantity_reserved(stocks_id: Iterable[int]):
+    """Set `quantity_reserved` of given stocks to the sum of their reservations.
+
+    Stocks should be locked, otherwise concurrent reservations could be missed.
+    """
+    reservations = (
+        Reservation.objects.filter(stock_id=OuterRef("pk"))
+        .order_by()
+        .values("stock_id")
+        .annotate(quantity_reserved_sum=Sum("quantity_reserved"))
+        .values("quantity_reserved_sum")
+    )
+    Stock.objects.filter(pk__in=stocks_id).update(
+        quantity_reserved=Coalesce(Subquery(reservations), 0)
+    )
 
 
 def _create_stock_reservations(
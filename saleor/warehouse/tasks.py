@@ -1,10 +1,12 @@
 from celery.utils.log import get_task_logger
+from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
 from .models import Allocation, PreorderReservation, Reservation, Stock
+from .reservations import release_stock_reservations, update_stocks_quantity_reserved
 
 task_logger = get_task_logger(__name__)
 
@@ -18,9 +20,10 @@ def delete_empty_allocations_task():
 
 @app.task
 def delete_expired_reservations_task():
-    stock_reservations, _ = Reservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
+    with transaction.atomic():
+        stock_reservations = release_stock_reservations(
+            Reservation.objects.filter(reserved_until__lt=timezone.now())
+        )
     preorder_reservations, _ = PreorderReservation.objects.filter(
         reserved_until__lt=timezone.now()
     ).delete()
@@ -54,3 +57,27 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+def update_stocks_quantity_reserved_task():
+    mismatched_stocks_ids = list(
+        Stock.objects.annotate(
+            reservations_reserved=Coalesce(Sum("reservations__quantity_reserved"), 0)
+        )
+        .exclude(quantity_reserved=F("reservations_reserved"))
+        .values_list("pk", flat=True)
+    )
+    if mismatched_stocks_ids:
+        with transaction.atomic():
+            # lock the stocks so reservations made in the meantime are counted
+            list(
+                Stock.objects.select_for_update(of=("self",))
+                .filter(pk__in=mismatched_stocks_ids)
+                .values_list("pk", flat=True)
+            )
+            update_stocks_quantity_reserved(mismatched_stocks_ids)
+    task_logger.info(
+        "Finished updating quantity_reserved on stocks, %d were corrected.",
+        len(mismatched_stocks_ids),
+    )
@@ -96,6 +96,33 @@ def test_allocate_stock_many_stocks(order_line, variant_with_many_stocks, channe
     assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stock_with_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock,
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+):
+    # given
+    variant = variant_with_many_stocks
+    stocks = list(variant.stocks.order_by("pk"))
+    quantity = stocks[0].quantity + 1
+    line_data = OrderLineInfo(
+        line=order_line, variant=order_line.variant, quantity=quantity
+    )
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stocks[0])
+    stocks[0].refresh_from_db()
+    assert stocks[0].quantity_allocated == stocks[0].quantity
+
+
 def test_allocate_stock_with_reservations(
     order_line,
     variant_with_many_stocks,
@@ -842,7 +869,8 @@ def test_decrease_stock_with_out_of_stock_webhook_triggered(
 ):
     stock = allocation.stock
     stock.quantity = 50
-    stock.save(update_fields=["quantity"])
+    stock.quantity_allocated = 50
+    stock.save(update_fields=["quantity", "quantity_allocated"])
     allocation.quantity_allocated = 50
     allocation.save(update_fields=["quantity_allocated"])
     warehouse_pk = allocation.stock.warehouse.pk
@@ -6,7 +6,7 @@ from django.utils import timezone
 from ...checkout.models import Checkout
 from ...core.exceptions import InsufficientStock
 from ..models import Reservation, Stock, Warehouse
-from ..reservations import reserve_stocks
+from ..reservations import release_checkout_lines_reservations, reserve_stocks
 
 COUNTRY_CODE = "US"
 RESERVATION_LENGTH = 5
@@ -111,7 +111,8 @@ def test_stocks_reservation_removes_previous_reservations_for_checkout(
 
     stock = Stock.objects.get(product_variant=checkout_line.variant)
     stock.quantity = 10
-    stock.save(update_fields=["quantity"])
+    stock.quantity_reserved = 5
+    stock.save(update_fields=["quantity", "quantity_reserved"])
 
     previous_reservation = Reservation.objects.create(
         checkout_line=checkout_line,
@@ -204,12 +205,15 @@ def test_stock_reservation_accounts_for_order_allocations_and_reservations(
         variant=variant,
     )
 
+    reserved_stock = variant.stocks.order_by("pk").last()
     Reservation.objects.create(
         checkout_line=other_checkout_line,
-        stock=variant.stocks.order_by("pk").last(),
+        stock=reserved_stock,
         quantity_reserved=2,
         reserved_until=timezone.now() + timedelta(hours=1),
     )
+    reserved_stock.quantity_reserved = 2
+    reserved_stock.save(update_fields=["quantity_reserved"])
 
     checkout_line = checkout.lines.create(
         quantity=2,
@@ -224,3 +228,102 @@ def test_stock_reservation_accounts_for_order_allocations_and_reservations(
             channel_USD.slug,
             RESERVATION_LENGTH,
         )
+
+
+def test_reserve_stocks_updates_stock_quantity_reserved(checkout_line, channel_USD):
+    # given
+    checkout_line.quantity = 5
+    checkout_line.save()
+
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD.slug,
+        RESERVATION_LENGTH,
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 5
+
+
+def test_reserve_stocks_releases_replaced_stock_quantity_reserved(
+    checkout_line_with_one_reservation, channel_USD
+):
+    # given
+    checkout_line = checkout_line_with_one_reservation
+    checkout_line.quantity = 1
+    checkout_line.save(update_fields=["quantity"])
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD.slug,
+        RESERVATION_LENGTH,
+    )
+
+    # then
+    stock = checkout_line.reservations.get().stock
+    assert stock.quantity_reserved == 1
+
+
+def test_reserve_stocks_with_expired_reservations_in_stock_quantity_reserved(
+    checkout_line, checkout, channel_USD
+):
+    # given
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 10
+    stock.quantity_reserved = 8
+    stock.save(update_fields=["quantity", "quantity_reserved"])
+
+    other_checkout_line = checkout.lines.create(
+        quantity=8,
+        variant=checkout_line.variant,
+    )
+    Reservation.objects.create(
+        checkout_line=other_checkout_line,
+        stock=stock,
+        quantity_reserved=8,
+        reserved_until=timezone.now() - timedelta(minutes=1),
+    )
+
+    checkout_line.quantity = 5
+    checkout_line.save(update_fields=["quantity"])
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD.slug,
+        RESERVATION_LENGTH,
+    )
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=checkout_line, stock=stock)
+    assert reservation.quantity_reserved == 5
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 13
+
+
+def test_release_checkout_lines_reservations(checkout_line_with_one_reservation):
+    # given
+    checkout_line = checkout_line_with_one_reservation
+    stock = checkout_line.reservations.get().stock
+
+    # when
+    released = release_checkout_lines_reservations([checkout_line])
+
+    # then
+    assert released == 1
+    assert not Reservation.objects.filter(checkout_line=checkout_line).exists()
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
@@ -7,6 +7,7 @@ from ..models import PreorderReservation, Reservation
 from ..tasks import (
     delete_expired_reservations_task,
     update_stocks_quantity_allocated_task,
+    update_stocks_quantity_reserved_task,
 )
 
 
@@ -18,6 +19,20 @@ def test_delete_expired_reservations_task_deletes_expired_stock_reservations(
     assert not Reservation.objects.exists()
 
 
+def test_delete_expired_reservations_task_releases_stock_quantity_reserved(
+    checkout_line_with_reservation_in_many_stocks,
+):
+    # given
+    Reservation.objects.update(reserved_until=timezone.now() - timedelta(seconds=1))
+
+    # when
+    delete_expired_reservations_task()
+
+    # then
+    variant = checkout_line_with_reservation_in_many_stocks.variant
+    assert set(variant.stocks.values_list("quantity_reserved", flat=True)) == {0}
+
+
 def test_delete_expired_reservations_task_skips_active_stock_reservations(
     checkout_line_with_reservation_in_many_stocks,
 ):
@@ -85,3 +100,18 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_stocks_quantity_reserved_task(
+    checkout_line_with_reservation_in_many_stocks,
+):
+    # given
+    variant = checkout_line_with_reservation_in_many_stocks.variant
+    variant.stocks.update(quantity_reserved=10)
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    stocks = variant.stocks.order_by("pk")
+    assert [stock.quantity_reserved for stock in stocks] == [2, 1]
@@ -0,0 +1,81 @@
+from ...plugins.manager import get_plugins_manager
+from ..utils import get_warehouse_ids_for_country_and_channel, invalidate_warehouses_map
+
+COUNTRY_CODE = "US"
+
+
+def test_get_warehouse_ids_for_country_and_channel(
+    warehouse, channel_USD, channel_PLN, settings
+):
+    # given
+    settings.WAREHOUSES_MAP_TIMEOUT = 60
+    invalidate_warehouses_map()
+
+    # when
+    warehouse_ids = get_warehouse_ids_for_country_and_channel(
+        COUNTRY_CODE, channel_USD.slug
+    )
+    other_channel_warehouse_ids = get_warehouse_ids_for_country_and_channel(
+        COUNTRY_CODE, channel_PLN.slug
+    )
+
+    # then
+    assert warehouse_ids == [warehouse.pk]
+    assert other_channel_warehouse_ids == []
+
+
+def test_get_warehouse_ids_for_country_and_channel_reuses_map(
+    warehouse, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.WAREHOUSES_MAP_TIMEOUT = 60
+    invalidate_warehouses_map()
+    get_warehouse_ids_for_country_and_channel(COUNTRY_CODE, channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        warehouse_ids = get_warehouse_ids_for_country_and_channel(
+            COUNTRY_CODE, channel_USD.slug
+        )
+
+    # then
+    assert warehouse_ids == [warehouse.pk]
+
+
+def test_get_warehouse_ids_for_country_and_channel_disabled(
+    warehouse, channel_USD, settings
+):
+    # given
+    settings.WAREHOUSES_MAP_TIMEOUT = 0
+
+    # when
+    warehouse_ids = get_warehouse_ids_for_country_and_channel(
+        COUNTRY_CODE, channel_USD.slug
+    )
+
+    # then
+    assert warehouse_ids is None
+
+
+def test_warehouses_map_invalidated_by_shipping_zone_update(
+    warehouse, shipping_zone, channel_USD, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.WAREHOUSES_MAP_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.warehouses_map.plugin.WarehousesMapPlugin"]
+    invalidate_warehouses_map()
+    get_warehouse_ids_for_country_and_channel(COUNTRY_CODE, channel_USD.slug)
+    shipping_zone.countries = ["PL"]
+    shipping_zone.save(update_fields=["countries"])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        get_plugins_manager().shipping_zone_updated(shipping_zone)
+
+    # then
+    assert get_warehouse_ids_for_country_and_channel("PL", channel_USD.slug) == [
+        warehouse.pk
+    ]
+    assert (
+        get_warehouse_ids_for_country_and_channel(COUNTRY_CODE, channel_USD.slug) == []
+    )
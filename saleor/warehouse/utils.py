@@ -0,0 +1,99 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from uuid import UUID
+
+from django.db.models import Prefetch
+
+from ..channel.models import Channel
+from ..core.snapshots import Snapshot, VersionedSnapshot
+from ..shipping.models import ShippingZone
+
+
+@dataclass
+class WarehousesMap(Snapshot):
+    """Shipping zones of warehouses, used to find warehouses serving a country."""
+
+    # warehouse ID, shipping zone countries and shipping zone channel slugs
+    shipping_zones: List[Tuple[UUID, FrozenSet[str], FrozenSet[str]]]
+    _warehouse_ids: Dict[Tuple[str, Optional[str]], List[UUID]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def get_warehouse_ids(
+        self, country_code: str, channel_slug: Optional[str]
+    ) -> List[UUID]:
+        key = (country_code, channel_slug)
+        if key not in self._warehouse_ids:
+            self._warehouse_ids[key] = list(
+                {
+                    warehouse_id
+                    for warehouse_id, countries, channels in self.shipping_zones
+                    if country_code in countries
+                    and (channel_slug is None or channel_slug in channels)
+                }
+            )
+        return self._warehouse_ids[key]
+
+
+def _fetch_warehouses_shipping_zones() -> List[
+    Tuple[UUID, FrozenSet[str], FrozenSet[str]]
+]:
+    shipping_zones = ShippingZone.objects.only("countries").prefetch_related(
+        Prefetch("channels", queryset=Channel.objects.only("slug"))
+    )
+    zones = {
+        zone.pk: (
+            frozenset(country.code for country in zone.countries),
+            frozenset(channel.slug for channel in zone.channels.all()),
+        )
+        for zone in shipping_zones
+    }
+    WarehouseShippingZone = ShippingZone.warehouses.through  # type: ignore
+    return [
+        (warehouse_id, *zones[shipping_zone_id])
+        for warehouse_id, shipping_zone_id in WarehouseShippingZone.objects.values_list(
+            "warehouse_id", "shippingzone_id"
+        )
+    ]
+
+
+def _build_warehouses_map(version: str, created_at: datetime.datetime) -> WarehousesMap:
+    return WarehousesMap(
+        version=version,
+        created_at=created_at,
+        shipping_zones=_fetch_warehouses_shipping_zones(),
+    )
+
+
+_warehouses_map: VersionedSnapshot[WarehousesMap] = VersionedSnapshot(
+    "warehouses-map", "WAREHOUSES_MAP_TIMEOUT", _build_warehouses_map
+)
+
+
+def invalidate_warehouses_map():
+    """Force rebuilding the warehouses map in all workers."""
+    _warehouses_map.invalidate()
+
+
+def get_warehouses_map() -> Optional[WarehousesMap]:
+    """Return the map of warehouses shipping zones.
+
+    The map is kept in the worker memory and shared between workers through the
+    cache. It's rebuilt when it expires or when its version is changed by
+    `invalidate_warehouses_map`.
+    """
+    return _warehouses_map.get()
+
+
+def get_warehouse_ids_for_country_and_channel(
+    country_code: str, channel_slug: Optional[str]
+) -> Optional[List[UUID]]:
+    """Return IDs of warehouses shipping to the country in the channel.
+
+    Return None when the warehouses map is disabled.
+    """
+    warehouses_map = get_warehouses_map()
+    if warehouses_map is None:
+        return None
+    return warehouses_map.get_warehouse_ids(country_code, channel_slug)